@@ -2,16 +2,387 @@
 # │ GENERAL IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
+import gzip
+import hashlib
+import json
+import logging
 import requests
+import time
 
+from collections import deque, namedtuple, OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    wait,
+)
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from requests.cookies import merge_cookies, RequestsCookieJar
+from requests.sessions import merge_setting
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_netrc_auth
+from threading import BoundedSemaphore, Lock
+from urllib.parse import urlencode, urljoin
+from urllib3.util.retry import Retry
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
-# │ BASE ADAPTER                                                                       │
+# │ DJANGO IMPORTS                                                                     │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
+from django.core.cache import caches
 
-class BaseAdapter:
-    """ A base adapter """
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.breakers import CircuitBreaker, CircuitOpenError
+from beutils.limiters import RedisTokenBucket, TokenBucket
+from beutils.metrics import RequestMetric
+from beutils.tools import get_redis
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ REQUEST RESULT                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Define the result of a request made as part of a batch
+RequestResult = namedtuple(
+    "RequestResult", ["endpoint", "data", "status_code", "error", "elapsed"]
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ LOCAL RESPONSE CACHE                                                               │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class LocalResponseCache:
+    """ A thread-safe, in-process LRU cache of adapter responses """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, max_entries=1024):
+        """ Custom Init Method """
+
+        # Set max entries
+        self.max_entries = max_entries
+
+        # Initialize entries and lock
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get(self, key):
+        """ Returns a cached entry or None """
+
+        # Acquire lock
+        with self._lock:
+
+            # Get entry
+            entry = self._entries.get(key)
+
+            # Mark entry as most recently used
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            # Return entry
+            return entry
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def set(self, key, entry, timeout):
+        """ Caches an entry, evicting the least recently used entries if full """
+
+        # Acquire lock
+        with self._lock:
+
+            # Set entry as most recently used
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            # Evict least recently used entries
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ LATENCY WINDOW                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class LatencyWindow:
+    """ A thread-safe window of the most recent request latencies """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, size=200):
+        """ Custom Init Method """
+
+        # Initialize latencies and lock
+        self._latencies = deque(maxlen=size)
+        self._lock = Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add(self, latency):
+        """ Adds a latency in seconds """
+
+        # Acquire lock
+        with self._lock:
+
+            # Add latency
+            self._latencies.append(latency)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ PERCENTILE                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def percentile(self, percentile, min_samples=20):
+        """ Returns a latency percentile or None if there are too few samples """
+
+        # Acquire lock
+        with self._lock:
+
+            # Copy latencies
+            latencies = list(self._latencies)
+
+        # Return None if there are too few samples
+        if len(latencies) < min_samples:
+            return None
+
+        # Return nearest-rank percentile
+        latencies.sort()
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percentile))]
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO RESPONSE CACHE                                                              │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class DjangoResponseCache:
+    """ A cache of adapter responses backed by a Django cache, e.g. Redis """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, alias="default", prefix="beutils:adapter"):
+        """ Custom Init Method """
+
+        # Set cache alias and key prefix
+        self.alias = alias
+        self.prefix = prefix
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get(self, key):
+        """ Returns a cached entry or None """
+
+        return caches[self.alias].get(f"{self.prefix}:{key}")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def set(self, key, entry, timeout):
+        """ Caches an entry for timeout seconds """
+
+        caches[self.alias].set(f"{self.prefix}:{key}", entry, timeout)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ COMPILE INTERFACE                                                                  │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def compile_interface(interface):
+    """
+    Compiles an interface dict into a tuple of normalized per-key rules
+
+    Interfaces are cached by their contents, so equal inline interfaces share rules
+    """
+
+    # Get a hashable form of the interface
+    frozen = tuple(
+        (
+            key,
+            tuple(info["type"]) if type(info["type"]) is list else info["type"],
+            info.get("required", True),
+            info.get("validator"),
+        )
+        for key, info in interface.items()
+    )
+
+    # Return cached rules, compiling without caching if a validator is unhashable
+    try:
+        return compile_frozen_interface(frozen)
+    except TypeError:
+        return compile_frozen_interface.__wrapped__(frozen)
+
+
+@lru_cache(maxsize=256)
+def compile_frozen_interface(frozen):
+    """ Compiles a hashable interface of (key, type, required, validator) tuples """
+
+    # Initialize rules
+    rules = []
+
+    # Iterate over interface
+    for key, value_type, value_required, value_validator in frozen:
+
+        # Get value types as a list
+        value_type = list(value_type) if type(value_type) is tuple else [value_type]
+
+        # Ensure None is handled correctly
+        value_type = [type(t) if t is None else t for t in value_type]
+
+        # Add rule of key, type set, type list, required, and validator
+        rules.append(
+            (key, frozenset(value_type), value_type, value_required, value_validator)
+        )
+
+    # Return rules
+    return tuple(rules)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ITER ITEM ERRORS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def iter_item_errors(label, item, rules):
+    """ Yields the first error of each key of an item based on compiled rules """
+
+    # Iterate over rules
+    for key, value_types, value_type, value_required, value_validator in rules:
+
+        # Check if key not in item
+        if key not in item:
+            yield f"{label} missing {key} of type {value_type}"
+            continue
+
+        # Get value
+        value = item[key]
+
+        # Check if value is missing
+        if value_required and not value and value is not False:
+            yield f"{label} value for {key} cannot be nullish"
+
+        # Check if value is not the correct type
+        elif type(value) not in value_types:
+            yield f"{label} {key} is not of type {value_type}"
+
+        # Check if custom validator is defined
+        elif value_validator and not value_validator(value):
+            yield f"{label} {key} is not valid: {value}"
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ITER JSON ARRAY                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def iter_json_array(chunks):
+    """ Incrementally yields the elements of a JSON array from text chunks """
+
+    # Initialize decoder, buffer, and whether the array has started
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+
+    # Iterate over chunks
+    for chunk in chunks:
+
+        # Add chunk to buffer
+        buffer += chunk
+        pos = 0
+
+        # Decode as many elements as the buffer holds
+        while True:
+
+            # Skip whitespace and separators
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+
+            # Wait for more data if the buffer is exhausted
+            if pos >= len(buffer):
+                break
+
+            # Check if array has not started
+            if not started:
+
+                # Ensure that the body is an array
+                if buffer[pos] != "[":
+                    raise Exception("Response body is not a JSON array")
+
+                # Start array
+                started = True
+                pos += 1
+                continue
+
+            # Return at the end of the array
+            if buffer[pos] == "]":
+                return
+
+            # Decode the next element
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+
+            # Wait for more data if the element is incomplete
+            except json.JSONDecodeError:
+                break
+
+            # Check if element is a scalar that is not followed by a delimiter
+            if not isinstance(element, (dict, list)) and (
+                end == len(buffer) or buffer[end] not in " \t\r\n,]"
+            ):
+
+                # Wait for more data if the scalar may continue in the next chunk,
+                # e.g. "3" of "3.5" or "1" of "1e5"
+                if end == len(buffer) or buffer[end] in "0123456789.eE+-":
+                    break
+
+                # Raise exception if the scalar is followed by anything else
+                raise Exception("Response body is not a valid JSON array")
+
+            # Yield element
+            yield element
+            pos = end
+
+        # Discard consumed data
+        buffer = buffer[pos:]
+
+    # Raise exception if the array never ended
+    raise Exception("Response body ended before the end of the JSON array")
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ADAPTER MIXIN                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class AdapterMixin:
+    """
+    Shares URL building, headers, rate limits, circuit breaking, metrics, and
+    validation between BaseAdapter and AsyncBaseAdapter, which define get_session
+    """
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ CLASS ATTRIBUTES                                                               │
@@ -20,23 +391,65 @@ class BaseAdapter:
     # Initialize base URL
     base_url = ""
 
-    # ┌────────────────────────────────────────────────────────────────────────────────┐
-    # │ ENTER METHOD                                                                   │
-    # └────────────────────────────────────────────────────────────────────────────────┘
+    # Define connection pool sizes, i.e. number of hosts and connections per host
+    pool_connections = 10
+    pool_maxsize = 10
 
-    def __enter__(self):
-        """ Enter Method """
-        return self
+    # Define default (connect, read) timeout in seconds
+    timeout = (3.05, 30)
+
+    # Define whether get_default_headers is called once per instance and reused
+    cache_default_headers = True
+
+    # Define the rate limit of the adapter class as (calls per second, burst size)
+    rate_limit = None
+
+    # Define rate limits by endpoint, e.g. {"prices": (5, 10)}
+    endpoint_rate_limits = {}
+
+    # Define whether rate limits are shared across processes via settings.REDIS_URL
+    rate_limit_redis = False
+
+    # Initialize token buckets by key and a lock to create them
+    _token_buckets = {}
+    _token_buckets_lock = Lock()
+
+    # Define consecutive failures that open the circuit, e.g. 5, where None disables
+    # it. An open circuit makes request raise CircuitOpenError instead of returning.
+    circuit_failure_threshold = None
+
+    # Define how long an open circuit rejects requests before a trial in seconds
+    circuit_recovery_timeout = 30
+
+    # Define response status codes counted as circuit failures
+    circuit_failure_statuses = (500, 502, 503, 504)
+
+    # Initialize circuit breakers by adapter class
+    _circuit_breakers = {}
+
+    # Define metrics hooks called with a RequestMetric after each request, e.g.
+    # (LoggingMetricsHook(), HistogramMetricsHook())
+    metrics_hooks = ()
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
-    # │ EXIT METHOD                                                                    │
+    # │ SESSION                                                                        │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def __exit__(self, *args, **kwargs):
-        """ Exit Method """
+    @property
+    def session(self):
+        """ Returns the pooled session, creating it on first use """
 
-        # Close the adapter
-        self.close()
+        # Get session
+        session = getattr(self, "_session", None)
+
+        # Check if session has not been created
+        if session is None:
+
+            # Create session
+            session = self._session = self.get_session()
+
+        # Return session
+        return session
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │GET_DEFAULT_HEADERS                                                             │
@@ -49,15 +462,11 @@ class BaseAdapter:
         return {}
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
-    # │REQUEST                                                                         │
+    # │ BUILD URL                                                                      │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def request(self, endpoint, headers=None, params=None, post_data=None):
-        """ Makes an HTTP request to an API endpoint """
-
-        # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ CONSTRUCT URL                                                              │
-        # └────────────────────────────────────────────────────────────────────────────┘
+    def build_url(self, endpoint, params=None):
+        """ Returns the full URL of an API endpoint """
 
         # Construct URL
         url = self.base_url.rstrip("/") + "/" + endpoint.strip("/")
@@ -68,18 +477,43 @@ class BaseAdapter:
             # Check if params is a dict
             if type(params) is dict:
 
-                # Construct params
-                params = "&".join([f"{k}={v}" for k, v in params.items()])
+                # Encode params, where list values become repeated params
+                params = urlencode(params, doseq=True)
 
             # Add params to URL
             url = url + "?" + params
 
-        # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ GET HEADERS                                                                │
-        # └────────────────────────────────────────────────────────────────────────────┘
+        # Return URL
+        return url
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET BASE HEADERS                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_base_headers(self):
+        """ Returns the default headers, cached per instance unless disabled """
+
+        # Get cached base headers
+        base_headers = getattr(self, "_base_headers", None)
+
+        # Check if base headers should be fetched
+        if base_headers is None or not self.cache_default_headers:
+
+            # Get default headers
+            base_headers = self._base_headers = self.get_default_headers()
+
+        # Return base headers
+        return base_headers
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ BUILD HEADERS                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
 
-        # Get default headers
-        _headers = self.get_default_headers()
+    def build_headers(self, headers=None):
+        """ Returns the default headers updated with any supplied headers """
+
+        # Copy base headers
+        _headers = dict(self.get_base_headers())
 
         # Check if headers were supplied
         if type(headers) is dict:
@@ -87,36 +521,123 @@ class BaseAdapter:
             # Update final headers
             _headers.update(headers)
 
-        # Set headers
-        headers = _headers
+        # Return headers
+        return _headers
 
-        # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ MAKE REQUEST                                                               │
-        # └────────────────────────────────────────────────────────────────────────────┘
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET TOKEN BUCKET                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
 
-        # Initialize request dict
-        request_dict = {
-            "url": url,
-            "headers": headers,
-        }
+    def get_token_bucket(self, key, rate_limit):
+        """ Returns the token bucket of a key, shared by all threads """
 
-        # Check if request is POST
-        if post_data:
+        # Get token bucket
+        bucket = self._token_buckets.get(key)
 
-            # Add POST data to request dict
-            request_dict["data"] = post_data
+        # Return token bucket if it exists
+        if bucket is not None:
+            return bucket
 
-            # Make POST request
-            response = requests.post(**request_dict)
+        # Acquire lock
+        with self._token_buckets_lock:
 
-        # Otherwise GET by default
-        else:
+            # Get token bucket again in case another thread created it
+            bucket = self._token_buckets.get(key)
 
-            # Make GET request
-            response = requests.get(**request_dict)
+            # Check if token bucket does not exist
+            if bucket is None:
 
-        # Return response JSON and status code
-        return response.json(), response.status_code
+                # Get rate and capacity
+                rate, capacity = rate_limit
+
+                # Create token bucket
+                bucket = self._token_buckets[key] = (
+                    RedisTokenBucket(
+                        get_redis(), f"beutils:rate_limit:{key}", rate, capacity
+                    )
+                    if self.rate_limit_redis
+                    else TokenBucket(rate, capacity)
+                )
+
+        # Return token bucket
+        return bucket
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESERVE RATE LIMIT                                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def reserve_rate_limit(self, endpoint=None):
+        """
+        Takes a token from the adapter class and endpoint buckets
+
+        Returns the number of seconds to wait before making the request
+        """
+
+        # Get adapter class key
+        key = f"{type(self).__module__}.{type(self).__qualname__}"
+
+        # Initialize buckets
+        buckets = []
+
+        # Check if adapter class is rate limited
+        if self.rate_limit:
+            buckets.append(self.get_token_bucket(key, self.rate_limit))
+
+        # Get endpoint rate limit
+        endpoint_rate_limit = endpoint and self.endpoint_rate_limits.get(
+            endpoint.strip("/")
+        )
+
+        # Check if endpoint is rate limited
+        if endpoint_rate_limit:
+            buckets.append(
+                self.get_token_bucket(
+                    f"{key}:{endpoint.strip('/')}", endpoint_rate_limit
+                )
+            )
+
+        # Return the longest wait
+        return max([bucket.reserve() for bucket in buckets], default=0)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ EMIT METRIC                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def emit_metric(self, metric):
+        """ Calls the metrics hooks with a RequestMetric """
+
+        # Iterate over metrics hooks
+        for hook in self.metrics_hooks:
+
+            # Call hook, where a broken hook must not fail the request
+            try:
+                hook(metric)
+            except Exception:
+                logging.getLogger("beutils.metrics").exception("Metrics hook failed")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET CIRCUIT BREAKER                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_circuit_breaker(self):
+        """ Returns the circuit breaker shared by the adapter class or None """
+
+        # Return None if circuit breaking is disabled
+        if not self.circuit_failure_threshold:
+            return None
+
+        # Get adapter class
+        cls = type(self)
+
+        # Return circuit breaker
+        return cls._circuit_breakers.get(cls) or cls._circuit_breakers.setdefault(
+            cls,
+            CircuitBreaker(
+                name=cls.__name__,
+                failure_threshold=self.circuit_failure_threshold,
+                recovery_timeout=self.circuit_recovery_timeout,
+            ),
+        )
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ _VALIDATE                                                                      │
@@ -125,6 +646,9 @@ class BaseAdapter:
     def _validate(self, label, items, interface):
         """ Validates a set of items based on an interface """
 
+        # Get compiled interface
+        rules = compile_interface(interface)
+
         # Check if items is a dict
         if type(items) is dict:
 
@@ -134,47 +658,918 @@ class BaseAdapter:
         # Iterate over items
         for item in items:
 
-            # Iterate over item interface
-            for key, info in interface.items():
+            # Iterate over item errors
+            for error in iter_item_errors(label, item, rules):
 
-                # Get value info
-                value_type = info["type"]
-                value_type = value_type if type(value_type) is list else [value_type]
-                value_required = info.get("required", True)
-                value_validator = info.get("validator")
+                # Raise exception on the first error
+                raise Exception(error)
 
-                # Ensure None is handled correctly
-                value_type = [type(t) if t is None else t for t in value_type]
+        # Return items
+        return items
 
-                # Check if key not in item
-                if key not in item:
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ _COLLECT ERRORS                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
 
-                    # Raise exception
-                    raise Exception(f"{label} missing {key} of type {value_type}")
+    def _collect_errors(self, label, items, interface):
+        """
+        Validates a set of items based on an interface, collecting all errors
 
-                # Get value
-                value = item[key]
+        Returns a list of (item index or key, error) tuples instead of raising
+        """
 
-                # Check if value is missing
-                if value_required and not value and value is not False:
+        # Get compiled interface
+        rules = compile_interface(interface)
 
-                    # Raise exception
-                    raise Exception(f"{label} value for {key} cannot be nullish")
+        # Get items by index or key
+        items = items.items() if type(items) is dict else enumerate(items)
 
-                # Check if value is missing or not the correct type
-                if type(value) not in value_type:
+        # Return errors of all items
+        return [
+            (i, error)
+            for i, item in items
+            for error in iter_item_errors(label, item, rules)
+        ]
 
-                    # Raise exception
-                    raise Exception(f"{label} {key} is not of type {value_type}")
 
-                # Check if custom validator is defined
-                if value_validator and not value_validator(value):
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BASE ADAPTER                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
 
-                    # Raise exception
-                    raise Exception(f"{label} {key} is not valid: {value}")
 
-        # Return items
-        return items
+class BaseAdapter(AdapterMixin):
+    """ A base adapter """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define retries for connection errors and retryable status codes
+    max_retries = 3
+    retry_backoff_factor = 0.3
+    retry_status_forcelist = (429, 500, 502, 503, 504)
+
+    # Define whether request bodies of at least compress_min_size bytes are gzipped
+    compress_request_bodies = False
+    compress_min_size = 1024
+
+    # Define the max number of prepared request templates per instance
+    max_prepared_templates = 64
+
+    # Define the default response cache TTL in seconds, where None disables caching
+    cache_ttl = None
+
+    # Define response cache TTLs by endpoint, e.g. {"currencies": 3600}
+    cache_ttls = {}
+
+    # Define how long stale responses are kept for revalidation in seconds
+    cache_stale_ttl = 86400
+
+    # Define the max entries of the in-process response cache
+    cache_max_entries = 1024
+
+    # Define the alias of a shared Django cache tier, e.g. "default"
+    cache_backend = None
+
+    # Initialize in-process response caches by adapter class
+    _local_response_caches = {}
+
+    # Define whether slow GET requests are hedged with a duplicate request
+    hedge_requests = False
+
+    # Define the hedge delay in seconds, where None uses the hedge percentile latency
+    hedge_delay = None
+    hedge_percentile = 0.95
+
+    # Initialize latency windows, hedge thread pools, and their free worker slots by
+    # adapter class
+    _latency_windows = {}
+    _hedge_pools = {}
+    _hedge_slots = {}
+    _hedge_pools_lock = Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ENTER METHOD                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __enter__(self):
+        """ Enter Method """
+        return self
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ EXIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __exit__(self, *args, **kwargs):
+        """ Exit Method """
+
+        # Close the adapter
+        self.close()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET SESSION                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_session(self):
+        """ Returns a new requests session with a keep-alive connection pool """
+
+        # Initialize retry policy, which only retries idempotent methods
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.retry_backoff_factor,
+            status_forcelist=self.retry_status_forcelist,
+            raise_on_status=False,
+        )
+
+        # Initialize HTTP adapter
+        http_adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+        )
+
+        # Initialize session
+        session = requests.Session()
+
+        # Mount HTTP adapter for both schemes
+        session.mount("https://", http_adapter)
+        session.mount("http://", http_adapter)
+
+        # Return session
+        return session
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET CACHE TTL                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_cache_ttl(self, endpoint):
+        """ Returns the response cache TTL of an endpoint or None if uncached """
+
+        return self.cache_ttls.get(endpoint.strip("/"), self.cache_ttl)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET RESPONSE CACHES                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_response_caches(self):
+        """ Returns the response cache tiers, i.e. in-process then shared """
+
+        # Get adapter class
+        cls = type(self)
+
+        # Get in-process cache shared by instances of the adapter class
+        local_cache = cls._local_response_caches.get(cls)
+
+        # Check if in-process cache does not exist
+        if local_cache is None:
+
+            # Create in-process cache
+            local_cache = cls._local_response_caches.setdefault(
+                cls, LocalResponseCache(max_entries=self.cache_max_entries)
+            )
+
+        # Return cache tiers
+        return [local_cache] + (
+            [DjangoResponseCache(self.cache_backend)] if self.cache_backend else []
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET CACHED RESPONSE                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_cached_response(self, key):
+        """ Returns a cached response entry from the first tier that has it """
+
+        # Get cache tiers
+        tiers = self.get_response_caches()
+
+        # Iterate over cache tiers
+        for i, tier in enumerate(tiers):
+
+            # Get entry
+            entry = tier.get(key)
+
+            # Check if entry was found
+            if entry is not None:
+
+                # Backfill faster tiers
+                for faster_tier in tiers[:i]:
+                    faster_tier.set(key, entry, self.cache_stale_ttl)
+
+                # Return entry
+                return entry
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET CACHED RESPONSE                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def set_cached_response(self, key, entry):
+        """ Caches a response entry in all tiers """
+
+        # Iterate over cache tiers
+        for tier in self.get_response_caches():
+
+            # Set entry, keeping it past its TTL for revalidation
+            tier.set(key, entry, entry["ttl"] + self.cache_stale_ttl)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SEND                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        data=None,
+        endpoint=None,
+        stream=False,
+        json_data=None,
+    ):
+        """
+        Sends an HTTP request on the pooled session and returns the response
+
+        Raises CircuitOpenError without sending if the adapter circuit is open, and
+        emits a RequestMetric to any metrics hooks
+        """
+
+        # Prepare request
+        prepared = self.prepare(
+            method, url, headers=headers, data=data, json_data=json_data
+        )
+
+        # Get proxy and TLS settings, which Session.request would otherwise merge
+        settings = self.session.merge_environment_settings(
+            prepared.url, {}, stream, None, None
+        )
+
+        # Get circuit breaker
+        breaker = self.get_circuit_breaker()
+
+        # Get start time and initialize response and error
+        start = time.perf_counter()
+        response = error = None
+
+        # Send request
+        try:
+
+            # Check if circuit is open
+            if breaker:
+                breaker.before_call()
+
+            # Send request, hedging idempotent requests if enabled
+            response = (
+                self.send_hedged(prepared, endpoint, settings)
+                if self.hedge_requests and method == "GET" and not stream
+                else self.send_prepared(prepared, endpoint, settings)
+            )
+
+        # Handle open circuits, connection errors, and timeouts
+        except Exception as e:
+
+            # Set error
+            error = e
+
+            # Record failure unless the request was not sent
+            if breaker and not isinstance(e, CircuitOpenError):
+                breaker.record_failure()
+
+            # Re-raise exception
+            raise
+
+        # Emit metric whether or not the request failed
+        finally:
+
+            # Check if there are metrics hooks
+            if self.metrics_hooks:
+
+                # Emit metric
+                self.emit_metric(
+                    RequestMetric(
+                        adapter=type(self).__name__,
+                        method=method,
+                        endpoint=endpoint or prepared.path_url,
+                        status_code=getattr(response, "status_code", None),
+                        elapsed=time.perf_counter() - start,
+                        bytes=self.get_response_size(response, stream),
+                        retries=self.get_response_retries(response),
+                        error=error and type(error).__name__,
+                    )
+                )
+
+        # Check if circuit breaker is enabled
+        if breaker:
+
+            # Record response
+            if response.status_code in self.circuit_failure_statuses:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+        # Return response
+        return response
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET RESPONSE SIZE                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_response_size(self, response, stream=False):
+        """ Returns the response body size in bytes or None if unknown """
+
+        # Return None if there is no response
+        if response is None:
+            return None
+
+        # Return Content-Length of streamed responses, which have not been read
+        if stream:
+            content_length = response.headers.get("Content-Length")
+            return int(content_length) if content_length else None
+
+        # Return body size
+        return len(response.content)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET RESPONSE RETRIES                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_response_retries(self, response):
+        """ Returns the number of retries urllib3 made to get a response """
+
+        # Get retry state
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+
+        # Return number of retries
+        return len(retries.history) if retries else 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SEND PREPARED                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def send_prepared(self, prepared, endpoint=None, settings=None, reserve=True):
+        """
+        Sends a prepared request with the adapter timeout and records latency
+
+        Waits for a rate limit token first unless reserve is False, i.e. the caller
+        has already waited for one
+        """
+
+        # Check if timeout is not set
+        if not self.timeout:
+
+            # Raise exception
+            raise Exception(f"{type(self).__name__}.timeout must be set")
+
+        # Wait for any rate limits
+        if reserve:
+            time.sleep(self.reserve_rate_limit(endpoint))
+
+        # Get start time
+        start = time.perf_counter()
+
+        # Send request
+        response = self.session.send(prepared, timeout=self.timeout, **(settings or {}))
+
+        # Record latency
+        self.get_latency_window().add(time.perf_counter() - start)
+
+        # Return response
+        return response
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SEND HEDGED                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def send_hedged(self, prepared, endpoint=None, settings=None):
+        """
+        Sends an idempotent prepared request, hedging it if it is slow
+
+        If no response arrives within the hedge delay, a duplicate request is sent
+        and whichever succeeds first is returned, which bounds tail latency. The
+        delay starts once the primary request has its rate limit token and a worker,
+        and requests are not hedged while the hedge pool is saturated.
+        """
+
+        # Wait for any rate limits before the hedge delay starts, so that waiting for
+        # a token is not mistaken for a slow response
+        time.sleep(self.reserve_rate_limit(endpoint))
+
+        # Send primary request on a free worker of the hedge pool
+        primary = self.submit_hedged(prepared, endpoint, settings, False)
+
+        # Send primary request without hedging if the hedge pool is saturated
+        if primary is None:
+            return self.send_prepared(prepared, endpoint, settings, reserve=False)
+
+        # Get hedge delay
+        delay = self.get_hedge_delay()
+
+        # Wait for primary response until the hedge delay
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+
+        # Send hedge request, which waits for its own rate limit token
+        hedge = self.submit_hedged(prepared.copy(), endpoint, settings)
+
+        # Wait for the primary request if the hedge pool is saturated
+        if hedge is None:
+            return primary.result()
+
+        # Wait for the first request to finish
+        done, pending = wait([primary, hedge], return_when=FIRST_COMPLETED)
+
+        # Get first finished request, preferring one that did not raise
+        future = next((f for f in done if f.exception() is None), None)
+
+        # Check if all finished requests raised
+        if future is None:
+
+            # Fall back to the pending request, or raise the first exception
+            future = pending.pop() if pending else done.pop()
+
+        # Iterate over the other requests
+        for other in {primary, hedge} - {future}:
+
+            # Close the losing response when it arrives to release its connection
+            other.add_done_callback(
+                lambda f: f.exception() is None and f.result().close()
+            )
+
+        # Return response
+        return future.result()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET HEDGE DELAY                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_hedge_delay(self):
+        """ Returns seconds to wait before hedging or None if latency is unknown """
+
+        # Return hedge delay if set
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+
+        # Return hedge percentile latency
+        return self.get_latency_window().percentile(self.hedge_percentile)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET HEDGE POOL                                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_hedge_pool(self):
+        """ Returns the thread pool of hedged requests, shared by the adapter class """
+
+        # Get adapter class
+        cls = type(self)
+
+        # Acquire lock
+        with cls._hedge_pools_lock:
+
+            # Get hedge pool
+            pool = cls._hedge_pools.get(cls)
+
+            # Check if hedge pool does not exist
+            if pool is None:
+
+                # Create hedge pool, with room for a primary and hedge per connection
+                pool = cls._hedge_pools[cls] = ThreadPoolExecutor(
+                    max_workers=self.pool_maxsize * 2,
+                    thread_name_prefix=f"{cls.__name__}-hedge",
+                )
+
+                # Create free worker slots of the hedge pool
+                cls._hedge_slots[cls] = BoundedSemaphore(self.pool_maxsize * 2)
+
+        # Return hedge pool
+        return pool
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SUBMIT HEDGED                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def submit_hedged(self, *args):
+        """
+        Submits send_prepared to a free worker of the hedge pool and returns its
+        future, or returns None if all workers are busy so that it is not queued
+        """
+
+        # Get hedge pool and its free worker slots
+        pool = self.get_hedge_pool()
+        slots = self._hedge_slots[type(self)]
+
+        # Return None if there is no free worker
+        if not slots.acquire(blocking=False):
+            return None
+
+        # Submit request, freeing its slot when done
+        future = pool.submit(self.send_prepared, *args)
+        future.add_done_callback(lambda f: slots.release())
+
+        # Return future
+        return future
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET LATENCY WINDOW                                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_latency_window(self):
+        """ Returns the latency window shared by the adapter class """
+
+        # Get adapter class
+        cls = type(self)
+
+        # Return latency window
+        return cls._latency_windows.get(cls) or cls._latency_windows.setdefault(
+            cls, LatencyWindow()
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ PREPARE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def prepare(self, method, url, headers=None, data=None, json_data=None):
+        """
+        Returns a PreparedRequest for a URL and body
+
+        Session-merged headers are prepared once per method and header set and
+        reused as a template, while the URL, cookies, body, and auth are prepared
+        for every request so that session cookies and auth are always current
+        """
+
+        # Get session
+        session = self.session
+
+        # Get template cache
+        templates = getattr(self, "_prepared_templates", None)
+
+        # Check if template cache does not exist or is full
+        if templates is None or len(templates) >= self.max_prepared_templates:
+
+            # Initialize template cache
+            templates = self._prepared_templates = {}
+
+        # Get template key, including session headers in case they change
+        key = (
+            method,
+            tuple(sorted((headers or {}).items())),
+            tuple(session.headers.items()),
+        )
+
+        # Get template
+        template = templates.get(key)
+
+        # Check if template does not exist
+        if template is None:
+
+            # Prepare template method, session-merged headers, and hooks
+            template = templates[key] = requests.PreparedRequest()
+            template.prepare_method(method)
+            template.prepare_headers(
+                merge_setting(headers, session.headers, dict_class=CaseInsensitiveDict)
+            )
+            template.prepare_hooks(session.hooks)
+
+        # Copy template
+        prepared = template.copy()
+
+        # Prepare URL, session cookies, and body
+        prepared.prepare_url(url, session.params)
+        prepared.prepare_cookies(merge_cookies(RequestsCookieJar(), session.cookies))
+        prepared.prepare_body(data, None, json_data)
+
+        # Get session auth, falling back to netrc as requests does
+        auth = session.auth or (get_netrc_auth(url) if session.trust_env else None)
+
+        # Prepare auth
+        prepared.prepare_auth(auth, url)
+
+        # Get body
+        body = prepared.body
+
+        # Check if body should be compressed
+        if (
+            self.compress_request_bodies
+            and body
+            and len(body) >= self.compress_min_size
+        ):
+
+            # Gzip body
+            prepared.body = gzip.compress(
+                body.encode("utf-8") if isinstance(body, str) else body
+            )
+
+            # Update body headers
+            prepared.headers["Content-Encoding"] = "gzip"
+            prepared.headers["Content-Length"] = str(len(prepared.body))
+
+        # Return prepared request
+        return prepared
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │REQUEST                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def request(
+        self, endpoint, headers=None, params=None, post_data=None, json_data=None
+    ):
+        """ Makes an HTTP request to an API endpoint """
+
+        # Get URL and headers
+        url = self.build_url(endpoint, params)
+        headers = self.build_headers(headers)
+
+        # Check if request has a body
+        has_body = bool(post_data) or json_data is not None
+
+        # Get cache TTL, where only GET requests are cached
+        ttl = None if has_body else self.get_cache_ttl(endpoint)
+
+        # Check if response should not be cached
+        if not ttl:
+
+            # Make POST request if there is a body, otherwise GET by default
+            response = self.send(
+                "POST" if has_body else "GET",
+                url,
+                headers=headers,
+                data=post_data,
+                endpoint=endpoint,
+                json_data=json_data,
+            )
+
+            # Return response JSON and status code
+            return response.json(), response.status_code
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ CACHED GET REQUEST                                                         │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Get cache key from method, URL, which includes params, and headers, which
+        # include any API key or auth header that varies between instances
+        key = hashlib.sha256(
+            repr(("GET", url, sorted(headers.items()))).encode()
+        ).hexdigest()
+
+        # Get cached entry
+        entry = self.get_cached_response(key)
+
+        # Check if entry exists
+        if entry is not None:
+
+            # Return entry if it is still fresh, decoding its body so that callers
+            # never share and mutate cached data
+            if entry["expires_at"] > time.time():
+                return json.loads(entry["body"]), entry["status_code"]
+
+            # Otherwise revalidate entry with conditional headers
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        # Make GET request
+        response = self.send("GET", url, headers=headers, endpoint=endpoint)
+
+        # Check if stale entry is still valid
+        if response.status_code == 304 and entry is not None:
+
+            # Refresh entry
+            entry = dict(entry, ttl=ttl, expires_at=time.time() + ttl)
+            self.set_cached_response(key, entry)
+
+            # Return cached response
+            return json.loads(entry["body"]), entry["status_code"]
+
+        # Return no data if not modified without a cached entry, e.g. if the caller
+        # sent its own conditional headers
+        if response.status_code == 304:
+            return None, response.status_code
+
+        # Get response JSON and status code
+        data, status_code = response.json(), response.status_code
+
+        # Check if response is successful
+        if status_code == 200:
+
+            # Cache response
+            self.set_cached_response(
+                key,
+                {
+                    "body": response.text,
+                    "status_code": status_code,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "ttl": ttl,
+                    "expires_at": time.time() + ttl,
+                },
+            )
+
+        # Return response JSON and status code
+        return data, status_code
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STREAM                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def stream(
+        self, endpoint, headers=None, params=None, ndjson=False, chunk_size=65536
+    ):
+        """
+        Lazily yields records from a large JSON array or NDJSON response
+
+        The response body is read in chunks rather than buffered in full
+        """
+
+        # Make streamed GET request
+        response = self.send(
+            "GET",
+            self.build_url(endpoint, params),
+            headers=self.build_headers(headers),
+            endpoint=endpoint,
+            stream=True,
+        )
+
+        # Release the connection back to the pool when done
+        with response:
+
+            # Check if request failed
+            if response.status_code >= 400:
+
+                # Raise exception
+                raise Exception(f"{endpoint} returned status {response.status_code}")
+
+            # Check if response is newline-delimited JSON
+            if ndjson:
+
+                # Yield a record per non-empty line
+                yield from (
+                    json.loads(line)
+                    for line in response.iter_lines(chunk_size=chunk_size)
+                    if line
+                )
+
+            # Otherwise handle a JSON array
+            else:
+
+                # Decode chunks as UTF-8 unless another encoding is declared
+                response.encoding = response.encoding or "utf-8"
+
+                # Yield records as they are decoded
+                yield from iter_json_array(
+                    response.iter_content(chunk_size=chunk_size, decode_unicode=True)
+                )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ PAGINATE                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def paginate(
+        self,
+        endpoint,
+        headers=None,
+        params=None,
+        results_key=None,
+        cursor_key=None,
+        cursor_param="cursor",
+        offset_param=None,
+        limit_param="limit",
+        limit=100,
+        max_pages=None,
+    ):
+        """
+        Lazily yields records from a paginated endpoint, one page at a time
+
+        Next pages are found by, in order of precedence:
+            a Link header with rel="next"
+            a cursor at response[cursor_key] sent back as the cursor_param param
+            an offset_param param advanced by the number of records received
+        """
+
+        # Copy params so that pagination can update them
+        params = dict(params or {})
+
+        # Check if paginating by offset
+        if offset_param:
+
+            # Set initial offset and limit
+            params.setdefault(offset_param, 0)
+            params.setdefault(limit_param, limit)
+
+        # Initialize URL and page count
+        url = self.build_url(endpoint, params)
+        pages = 0
+
+        # Iterate while there is a next page
+        while url:
+
+            # Make GET request
+            response = self.send(
+                "GET", url, headers=self.build_headers(headers), endpoint=endpoint
+            )
+
+            # Check if request failed
+            if response.status_code >= 400:
+
+                # Raise exception
+                raise Exception(f"{endpoint} returned status {response.status_code}")
+
+            # Get response JSON and records
+            data = response.json()
+            records = data[results_key] if results_key else data
+
+            # Yield records
+            yield from records
+
+            # Increment page count and stop at max pages
+            pages += 1
+            if max_pages and pages >= max_pages:
+                return
+
+            # Get next link
+            next_link = response.links.get("next", {}).get("url")
+
+            # Check if there is a next link
+            if next_link:
+
+                # Follow next link, which may be relative
+                url = urljoin(url, next_link)
+
+            # Otherwise check if paginating by cursor
+            elif cursor_key:
+
+                # Get next cursor
+                cursor = data.get(cursor_key)
+
+                # Set next page URL if there is a cursor
+                params[cursor_param] = cursor
+                url = self.build_url(endpoint, params) if cursor else None
+
+            # Otherwise check if paginating by offset
+            elif offset_param:
+
+                # Advance offset by the number of records
+                params[offset_param] += len(records)
+
+                # Set next page URL unless the page was not full
+                url = (
+                    self.build_url(endpoint, params)
+                    if records and len(records) >= int(params[limit_param])
+                    else None
+                )
+
+            # Otherwise there is no next page
+            else:
+                url = None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ REQUEST MANY                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def request_many(self, endpoints, max_workers=None, **kwargs):
+        """
+        Makes many requests concurrently on a thread pool sharing the session
+
+        Endpoints are endpoint strings, which are requested with any extra kwargs,
+        or dicts of request kwargs. Returns a list of RequestResult in input order,
+        where a failed request has an error instead of aborting the batch.
+        """
+
+        # Define a function that makes a single timed request
+        def run(endpoint):
+
+            # Get request kwargs
+            request_kwargs = (
+                endpoint if type(endpoint) is dict else dict(kwargs, endpoint=endpoint)
+            )
+
+            # Get start time
+            start = time.perf_counter()
+
+            # Make request
+            try:
+                data, status_code = self.request(**request_kwargs)
+                error = None
+
+            # Capture request errors
+            except Exception as e:
+                data, status_code, error = None, None, e
+
+            # Return request result
+            return RequestResult(
+                endpoint=request_kwargs["endpoint"],
+                data=data,
+                status_code=status_code,
+                error=error,
+                elapsed=time.perf_counter() - start,
+            )
+
+        # Create session up front so that worker threads share one connection pool
+        self.session
+
+        # Run requests on a bounded thread pool, preserving order
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_maxsize) as pool:
+            return list(pool.map(run, endpoints))
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ CLOSE                                                                          │
@@ -182,4 +1577,13 @@ class BaseAdapter:
 
     def close(self):
         """ Performs any additional logic necessary to close the adapter """
-        return
+
+        # Get session
+        session = getattr(self, "_session", None)
+
+        # Check if session has been created
+        if session is not None:
+
+            # Close session and its pooled connections
+            session.close()
+            self._session = None
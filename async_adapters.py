@@ -0,0 +1,279 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import aiohttp
+import asyncio
+import time
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.adapters import AdapterMixin
+from beutils.breakers import CircuitOpenError
+from beutils.metrics import RequestMetric
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GATHER WITH CONCURRENCY                                                            │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+async def gather_with_concurrency(limit, *aws, return_exceptions=False):
+    """ Gathers awaitables while running at most limit of them at a time """
+
+    # Initialize semaphore
+    semaphore = asyncio.Semaphore(limit)
+
+    # Define a wrapper that waits for the semaphore
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    # Gather awaitables in order
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ASYNC BASE ADAPTER                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class AsyncBaseAdapter(AdapterMixin):
+    """
+    An asyncio base adapter
+
+    Shares URL building, headers, rate limits, circuit breaking, metrics, and
+    validation with BaseAdapter, but requests are coroutines made with a pooled
+    aiohttp session bound to the running event loop
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define the default number of concurrent requests in a batch
+    concurrency_limit = 20
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ASYNC ENTER METHOD                                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def __aenter__(self):
+        """ Async Enter Method """
+        return self
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ASYNC EXIT METHOD                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def __aexit__(self, *args, **kwargs):
+        """ Async Exit Method """
+
+        # Close the adapter
+        await self.aclose()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET SESSION                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_session(self):
+        """ Returns a new aiohttp session with a keep-alive connection pool """
+
+        # Get connect and read timeouts
+        connect_timeout, read_timeout = self.timeout
+
+        # Return session
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.pool_connections * self.pool_maxsize,
+                limit_per_host=self.pool_maxsize,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=connect_timeout, sock_read=read_timeout
+            ),
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ REQUEST                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def request(
+        self, endpoint, headers=None, params=None, post_data=None, json_data=None
+    ):
+        """ Makes an HTTP request to an API endpoint """
+
+        # Get circuit breaker
+        breaker = self.get_circuit_breaker()
+
+        # Get method
+        method = "POST" if post_data or json_data is not None else "GET"
+
+        # Get start time and initialize response and error
+        start = time.perf_counter()
+        response = error = None
+
+        # Make POST request if there is a body, otherwise GET by default
+        try:
+
+            # Check if circuit is open
+            if breaker:
+                breaker.before_call()
+
+            # Wait for any rate limits without blocking the event loop
+            await asyncio.sleep(await self.areserve_rate_limit(endpoint))
+
+            # Make request
+            async with self.session.request(
+                method,
+                self.build_url(endpoint, params),
+                headers=self.build_headers(headers),
+                data=post_data or None,
+                json=json_data,
+            ) as response:
+
+                # Get response JSON and status code
+                data, status_code = (
+                    await response.json(content_type=None),
+                    response.status,
+                )
+
+        # Handle open circuits, connection errors, and timeouts
+        except Exception as e:
+
+            # Set error
+            error = e
+
+            # Record failure unless the request was not sent
+            if breaker and not isinstance(e, CircuitOpenError):
+                breaker.record_failure()
+
+            # Re-raise exception
+            raise
+
+        # Emit metric whether or not the request failed
+        finally:
+
+            # Check if there are metrics hooks
+            if self.metrics_hooks:
+
+                # Emit metric
+                self.emit_metric(
+                    RequestMetric(
+                        adapter=type(self).__name__,
+                        method=method,
+                        endpoint=endpoint,
+                        status_code=getattr(response, "status", None),
+                        elapsed=time.perf_counter() - start,
+                        bytes=getattr(response, "content_length", None),
+                        retries=0,
+                        error=error and type(error).__name__,
+                    )
+                )
+
+        # Check if circuit breaker is enabled
+        if breaker:
+
+            # Record response
+            if status_code in self.circuit_failure_statuses:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+        # Return response JSON and status code
+        return data, status_code
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ARESERVE RATE LIMIT                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def areserve_rate_limit(self, endpoint=None):
+        """ Takes rate limit tokens, reserving shared Redis buckets in a thread """
+
+        # Check if buckets are in-process, which reserve without blocking
+        if not self.rate_limit_redis or not (
+            self.rate_limit or self.endpoint_rate_limits
+        ):
+            return self.reserve_rate_limit(endpoint)
+
+        # Reserve Redis buckets in the default executor
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.reserve_rate_limit, endpoint
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ REQUEST BATCH                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def request_batch(self, requests, limit=None):
+        """
+        Makes many requests concurrently and returns their results in order
+
+        Requests are endpoints or dicts of request kwargs, and a failed request
+        returns its exception in place of a result
+        """
+
+        return await gather_with_concurrency(
+            limit or self.concurrency_limit,
+            *(
+                self.request(**r) if type(r) is dict else self.request(r)
+                for r in requests
+            ),
+            return_exceptions=True,
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RUN BATCH                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def run_batch(self, requests, limit=None):
+        """ Runs request batch from synchronous code, e.g. a view or Celery task """
+
+        # Define a coroutine that closes the loop-bound session when done
+        async def run():
+            try:
+                return await self.request_batch(requests, limit=limit)
+            finally:
+                await self.aclose()
+
+        # Run coroutine in a new event loop
+        return asyncio.run(run())
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ACLOSE                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def aclose(self):
+        """ Closes the aiohttp session and its pooled connections """
+
+        # Get session
+        session = getattr(self, "_session", None)
+
+        # Check if session has been created
+        if session is not None:
+
+            # Close session
+            self._session = None
+            await session.close()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLOSE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def close(self):
+        """ Discards a session that has already been closed with aclose """
+
+        # Get session
+        session = getattr(self, "_session", None)
+
+        # Check if session is still open
+        if session is not None and not session.closed:
+
+            # Raise exception
+            raise Exception("AsyncBaseAdapter must be closed with aclose")
+
+        # Discard session
+        self._session = None
@@ -0,0 +1,420 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import asyncio
+import json
+import logging
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.async_adapters import AsyncBaseAdapter, gather_with_concurrency
+from beutils.bots import BaseBot, group_messages, SendResult
+from beutils.limiters import TokenBucket
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TELEGRAM API ERROR                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TelegramAPIError(Exception):
+    """ Raised when the Telegram Bot API returns an unsuccessful response """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, description, error_code=None, retry_after=None):
+        """ Custom Init Method """
+
+        # Call parent init method
+        super().__init__(description)
+
+        # Set error code and seconds to wait before retrying, e.g. after a 429
+        self.error_code = error_code
+        self.retry_after = retry_after
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TELEGRAM API ADAPTER                                                               │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TelegramAPIAdapter(AsyncBaseAdapter):
+    """ An asyncio adapter for the Telegram Bot API """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define a connection pool sized for many concurrent sends to one host
+    pool_connections = 1
+    pool_maxsize = 100
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, api_key, api_url="https://api.telegram.org"):
+        """ Custom Init Method """
+
+        # Set base URL, e.g. https://api.telegram.org/bot<api_key>
+        self.base_url = f"{api_url.rstrip('/')}/bot{api_key}"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def call(self, method, **params):
+        """ Calls a Bot API method, e.g. sendMessage, and returns its result """
+
+        # Make request
+        data, status_code = await self.request(method, json_data=params)
+
+        # Check if request failed
+        if not data.get("ok"):
+
+            # Get response parameters
+            parameters = data.get("parameters") or {}
+
+            # Raise TelegramAPIError
+            raise TelegramAPIError(
+                data.get("description") or f"{method} returned status {status_code}",
+                error_code=data.get("error_code", status_code),
+                retry_after=parameters.get("retry_after"),
+            )
+
+        # Return result
+        return data["result"]
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ASYNC TELEGRAM BOT                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class AsyncTelegramBot(BaseBot):
+    """
+    An asyncio class for Telegram bots
+
+    Updates are plain dicts passed to async handlers added with add_handler, and
+    Bot API calls share one pooled aiohttp session, so a single event loop can
+    process many updates concurrently
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define the Bot API URL, which can point to a local Bot API or fake server
+    api_url = "https://api.telegram.org"
+
+    # Define the max number of updates processed concurrently
+    concurrency_limit = 1000
+
+    # Define the secret token expected in webhook requests, if any
+    secret_token = None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, api_key, *args, api_url=None, **kwargs):
+        """ Custom Init Method """
+
+        # Call parent init method
+        super().__init__(*args, **kwargs)
+
+        # Initialize Bot API adapter
+        self.adapter = TelegramAPIAdapter(api_key, api_url=api_url or self.api_url)
+
+        # Initialize handlers, background tasks, and concurrency semaphore
+        self.handlers = []
+        self.tasks = set()
+        self._semaphore = None
+
+        # Initialize logger
+        self.logger = logging.getLogger("beutils.bots")
+
+        # Add handlers
+        self.add_handlers()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ASYNC ENTER METHOD                                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def __aenter__(self):
+        """ Async Enter Method """
+        return self
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ASYNC EXIT METHOD                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def __aexit__(self, *args, **kwargs):
+        """ Async Exit Method """
+
+        # Close the bot
+        await self.aclose()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD HANDLERS                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_handlers(self):
+        """ Adds handlers with add_handler, called once on init """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD HANDLER                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_handler(self, handler):
+        """ Adds an async handler called with the bot and each update dict """
+
+        # Add handler
+        self.handlers.append(handler)
+
+        # Return handler so that this can be used as a decorator
+        return handler
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ DISPATCH                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def dispatch(self, update):
+        """ Calls each handler with an update, logging any handler exceptions """
+
+        # Create semaphore on first use, i.e. in the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency_limit)
+
+        # Wait for a free slot
+        async with self._semaphore:
+
+            # Iterate over handlers
+            for handler in self.handlers:
+
+                # Call handler
+                try:
+                    await handler(self, update)
+
+                # Log any exception so that other handlers still run
+                except Exception:
+                    self.logger.exception("Telegram update processing failed")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL DEDUPE STORE                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def call_dedupe_store(self, func, data):
+        """
+        Calls is_duplicate_update or forget_update with webhook data, in a thread if
+        the dedupe store uses Redis so that its round trip does not block the loop
+        """
+
+        # Check if the dedupe store uses Redis
+        if self.dedupe_redis:
+
+            # Call function in the default executor
+            return await asyncio.get_running_loop().run_in_executor(None, func, data)
+
+        # Otherwise call function, since the in-memory store only holds a lock briefly
+        return func(data)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ PROCESS WEBHOOK                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def process_webhook(self, data, wait=True):
+        """
+        Processes data passed in via webhook
+
+        If wait is False, the update is processed in a background task so that the
+        webhook can respond immediately. Returns False if the update is a duplicate.
+        """
+
+        # Return False if update is a duplicate
+        if await self.call_dedupe_store(self.is_duplicate_update, data):
+            return False
+
+        # Hand off update
+        try:
+
+            # Check if update should be processed before returning
+            if wait:
+                return await self.dispatch(data)
+
+            # Create background task
+            task = asyncio.ensure_future(self.dispatch(data))
+
+        # Forget update if it could not be handed off, e.g. if the request was
+        # cancelled, so that Telegram's retry is not dropped as a duplicate
+        except BaseException:
+            await self.call_dedupe_store(self.forget_update, data)
+            raise
+
+        # Keep a reference to the task until it is done
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SEND MESSAGE                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def send_message(self, chat_id, message):
+        """ Sends a message to a recipient / group """
+
+        # Send message
+        return await self.adapter.call("sendMessage", chat_id=chat_id, text=message)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ _GET RETRY AFTER                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def _get_retry_after(self, exc):
+        """ Returns seconds to wait if an exception is a rate limit, else None """
+
+        return exc.retry_after if isinstance(exc, TelegramAPIError) else None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SEND MANY                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def send_many(self, messages, limit=None):
+        """
+        Sends many (chat_id, message) pairs concurrently within rate limits
+
+        Messages to the same chat are sent in order, paced by the chat and global
+        rate limits without blocking the event loop. Returns a list of SendResult in
+        input order, where a failed send has an error instead of aborting the batch.
+        """
+
+        # Copy messages and initialize results
+        messages = list(messages)
+        results = [None] * len(messages)
+
+        # Get global send bucket
+        global_bucket = self.get_send_bucket()
+
+        # Define a coroutine that sends the messages of a chat in order
+        async def run(chat_id, chat_messages):
+
+            # Initialize chat bucket
+            chat_bucket = TokenBucket(*self.chat_rate_limit)
+
+            # Iterate over chat messages
+            for i, message in chat_messages:
+
+                # Initialize attempts
+                attempts = 0
+
+                # Iterate until the message is sent or fails
+                while True:
+
+                    # Wait for the chat, then the global, rate limit
+                    await asyncio.sleep(chat_bucket.reserve())
+                    await asyncio.sleep(global_bucket.reserve())
+
+                    # Increment attempts
+                    attempts += 1
+
+                    # Send message
+                    try:
+                        result, error = await self.send_message(chat_id, message), None
+
+                    # Handle send errors
+                    except Exception as e:
+                        result, error = None, e
+
+                        # Get retry after
+                        retry_after = self._get_retry_after(e)
+
+                        # Retry after the requested wait if there are retries left
+                        if (
+                            retry_after is not None
+                            and attempts <= self.send_max_retries
+                        ):
+                            await asyncio.sleep(retry_after)
+                            continue
+
+                    # Set result
+                    results[i] = SendResult(chat_id, message, result, error, attempts)
+
+                    # Break
+                    break
+
+        # Run chats concurrently
+        await gather_with_concurrency(
+            limit or self.adapter.pool_maxsize,
+            *(run(*group) for group in group_messages(messages).items()),
+        )
+
+        # Return results
+        return results
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ AS VIEW                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def as_view(self, wait=False):
+        """
+        Returns a Django async view that processes webhook requests
+
+        The view responds once the update is queued unless wait is True, e.g.
+        path("webhook/", bot.as_view()) under ASGI
+        """
+
+        # Define view
+        async def view(request):
+
+            # Check if request is not a POST
+            if request.method != "POST":
+                return HttpResponse(status=405)
+
+            # Check if secret token does not match
+            if self.secret_token and (
+                request.headers.get("X-Telegram-Bot-Api-Secret-Token")
+                != self.secret_token
+            ):
+                return HttpResponseForbidden()
+
+            # Decode update
+            try:
+                update = json.loads(request.body)
+            except ValueError:
+                return HttpResponse(status=400)
+
+            # Process update
+            await self.process_webhook(update, wait=wait)
+
+            # Return empty JSON response
+            return JsonResponse({})
+
+        # Exempt view from CSRF checks, since csrf_exempt would wrap it in a sync view
+        view.csrf_exempt = True
+
+        # Return view
+        return view
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ACLOSE                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def aclose(self):
+        """ Waits for background tasks and closes the Bot API session """
+
+        # Wait for background tasks
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+        # Close adapter
+        await self.adapter.aclose()
@@ -2,15 +2,457 @@
 # │ GENERAL IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
-from queue import Queue
-from threading import Thread
+import atexit
+import json
+import logging
+import time
+import uuid
+
+from collections import deque, namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ TELEGRAM IMPORTS                                                                   │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 from telegram import Bot, Update
+from telegram.error import RetryAfter
 from telegram.ext import Dispatcher
+from telegram.ext.dispatcher import DEFAULT_GROUP
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.conf import settings
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.limiters import TokenBucket
+from beutils.tools import get_redis
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SEND RESULT                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Define the delivery result of a message sent as part of a batch
+SendResult = namedtuple(
+    "SendResult", ["chat_id", "message", "result", "error", "attempts"]
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GROUP MESSAGES                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def group_messages(messages):
+    """
+    Groups (chat_id, message) pairs by chat, preserving order within each chat
+
+    Returns an OrderedDict of chat ID to a list of (input index, message) tuples
+    """
+
+    # Initialize groups
+    groups = OrderedDict()
+
+    # Iterate over messages
+    for i, (chat_id, message) in enumerate(messages):
+
+        # Add message to its chat group
+        groups.setdefault(chat_id, []).append((i, message))
+
+    # Return groups
+    return groups
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SHARED DISPATCHER                                                                  │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class SharedDispatcher(Dispatcher):
+    """
+    A Dispatcher shared by all instances of a bot class with the same API key
+
+    Once sealed, i.e. shared by a second instance, added handlers are ignored with a
+    warning so that bots that add handlers in __init__ rather than add_handlers do
+    not grow the handler list with every instance
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, *args, name="dispatcher", **kwargs):
+        """ Custom Init Method, where name is used in warnings, e.g. the bot class """
+
+        # Call parent init method
+        super().__init__(*args, **kwargs)
+
+        # Set name
+        self.name = name
+
+        # Initialize whether the dispatcher is sealed and has warned about it
+        self.sealed = False
+        self.warned = False
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD HANDLER                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_handler(self, handler, group=DEFAULT_GROUP):
+        """ Adds a handler unless the dispatcher is sealed """
+
+        # Check if dispatcher is sealed
+        if self.sealed:
+
+            # Warn once that handlers should be added in add_handlers
+            if not self.warned:
+                self.warned = True
+                logging.getLogger("beutils.bots").warning(
+                    "Ignoring handlers added to the shared dispatcher of %s after "
+                    "it was shared, move them from __init__ to add_handlers",
+                    self.name,
+                )
+
+            # Return without adding handler
+            return
+
+        # Add handler
+        super().add_handler(handler, group)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DISPATCHER POOL                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class DispatcherPool:
+    """
+    A dispatcher fed by a bounded update queue and a pool of worker threads
+
+    When the queue is full, the overflow policy either blocks for up to
+    block_timeout seconds and then raises, drops the newest update, or drops the
+    oldest queued update
+    """
+
+    # Define overflow policies
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+    # Define a sentinel that stops a worker
+    STOP = object()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(
+        self,
+        dispatcher,
+        workers=4,
+        queue_size=1000,
+        overflow_policy=BLOCK,
+        block_timeout=5,
+        name="dispatcher",
+    ):
+        """ Custom Init Method """
+
+        # Check if overflow policy is invalid
+        if overflow_policy not in (self.BLOCK, self.DROP_NEWEST, self.DROP_OLDEST):
+
+            # Raise exception
+            raise Exception(f"Invalid overflow policy: {overflow_policy}")
+
+        # Set dispatcher and overflow policy
+        self.dispatcher = dispatcher
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+
+        # Initialize bounded update queue
+        self.queue = Queue(maxsize=queue_size)
+
+        # Initialize dropped update count and state
+        self.dropped = 0
+        self.closed = False
+        self._lock = Lock()
+
+        # Initialize logger
+        self.logger = logging.getLogger("beutils.bots")
+
+        # Start worker threads
+        self.threads = [
+            Thread(target=self.work, name=f"{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SUBMIT                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def submit(self, update):
+        """ Queues an update and returns False if it was dropped """
+
+        # Check if pool is shut down
+        if self.closed:
+
+            # Raise exception
+            raise Exception("Dispatcher pool has been shut down")
+
+        # Check if there are no worker threads
+        if not self.threads:
+
+            # Process update inline
+            self.dispatcher.process_update(update)
+
+            # Return True
+            return True
+
+        # Check if overflow policy is to block
+        if self.overflow_policy == self.BLOCK:
+
+            # Queue update, applying backpressure until the timeout
+            try:
+                self.queue.put(update, timeout=self.block_timeout)
+            except Full:
+                raise Exception("Dispatcher update queue is full")
+
+            # Return True
+            return True
+
+        # Iterate until the update is queued or dropped
+        while True:
+
+            # Queue update if there is room
+            try:
+                self.queue.put_nowait(update)
+                return True
+            except Full:
+                pass
+
+            # Count dropped update
+            with self._lock:
+                self.dropped += 1
+
+            # Drop the newest update, i.e. this one
+            if self.overflow_policy == self.DROP_NEWEST:
+                return False
+
+            # Otherwise drop the oldest update to make room
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+            except Empty:
+                pass
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ WORK                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def work(self):
+        """ Processes queued updates until stopped """
+
+        # Iterate over queued updates
+        while True:
+
+            # Get update
+            update = self.queue.get()
+
+            # Process update
+            try:
+
+                # Return if stopped
+                if update is self.STOP:
+                    return
+
+                # Process update
+                self.dispatcher.process_update(update)
+
+            # Log any exception so that the worker survives it
+            except Exception:
+                self.logger.exception("Telegram update processing failed")
+
+            # Mark update as done
+            finally:
+                self.queue.task_done()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SHUTDOWN                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def shutdown(self, timeout=None):
+        """ Stops accepting updates and waits for queued updates to be processed """
+
+        # Return if already shut down
+        if self.closed:
+            return
+
+        # Stop accepting updates
+        self.closed = True
+
+        # Queue a stop sentinel per worker after any queued updates
+        for _ in self.threads:
+            self.queue.put(self.STOP)
+
+        # Wait for workers to finish
+        for thread in self.threads:
+            thread.join(timeout)
+
+        # Stop the dispatcher's run_async threads, if any
+        self.dispatcher.stop()
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DEDUPE STORE                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class DedupeStore:
+    """
+    A thread-safe store of recently seen keys, e.g. Telegram update IDs
+
+    Keys are kept in an in-memory ring buffer of the most recent size keys and,
+    if a Redis client is given, in Redis for ttl seconds so that duplicates are
+    also caught across processes
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, size=10000, client=None, prefix="beutils:dedupe", ttl=86400):
+        """ Custom Init Method """
+
+        # Set size, Redis client, key prefix, and TTL
+        self.size = size
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+        # Initialize ring buffer, key set, and lock
+        self._keys = deque()
+        self._key_set = set()
+        self._lock = Lock()
+
+        # Initialize counters
+        self.added = 0
+        self.duplicates = 0
+        self.discarded = 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add(self, key):
+        """ Records a key and returns False if it has already been seen """
+
+        # Acquire lock
+        with self._lock:
+
+            # Check if key was seen in this process
+            if key in self._key_set:
+
+                # Count duplicate
+                self.duplicates += 1
+
+                # Return False
+                return False
+
+            # Check if there is no Redis client
+            if self.client is None:
+
+                # Remember and count key under the same lock as the check, so that
+                # concurrent threads cannot both add it
+                self._remember(key)
+                self.added += 1
+
+                # Return True
+                return True
+
+        # Check if key is new in Redis, which is atomic across processes
+        is_new = bool(self.client.set(f"{self.prefix}:{key}", 1, nx=True, ex=self.ttl))
+
+        # Acquire lock
+        with self._lock:
+
+            # Remember key
+            self._remember(key)
+
+            # Count key
+            if is_new:
+                self.added += 1
+            else:
+                self.duplicates += 1
+
+        # Return whether key is new
+        return is_new
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ _REMEMBER                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def _remember(self, key):
+        """ Remembers a key in the ring buffer, where the lock must be held """
+
+        # Return if another thread just remembered key
+        if key in self._key_set:
+            return
+
+        # Remember key
+        self._keys.append(key)
+        self._key_set.add(key)
+
+        # Forget the oldest key if the ring buffer is full
+        if len(self._keys) > self.size:
+            self._key_set.discard(self._keys.popleft())
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ DISCARD                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def discard(self, key):
+        """ Forgets a key, e.g. if its update could not be handed off """
+
+        # Acquire lock
+        with self._lock:
+
+            # Forget key if it was seen in this process
+            if key in self._key_set:
+                self._key_set.discard(key)
+                self._keys.remove(key)
+
+            # Count discarded key, keeping added and duplicate counts as they were
+            self.discarded += 1
+
+        # Forget key in Redis, if any
+        if self.client is not None:
+            self.client.delete(f"{self.prefix}:{key}")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STATS                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def stats(self):
+        """
+        Returns the added, duplicate, and discarded counts and the number of keys
+        held
+        """
+
+        return {
+            "added": self.added,
+            "duplicates": self.duplicates,
+            "discarded": self.discarded,
+            "size": len(self._keys),
+        }
 
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
@@ -25,6 +467,35 @@ class BaseBot:
     # │ CLASS ATTRIBUTES                                                               │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
+    # Define the send rate limit of the bot class as (messages per second, burst),
+    # i.e. Telegram's limit of about 30 messages per second across all chats
+    global_rate_limit = (30, 30)
+
+    # Define the send rate limit of each chat as (messages per second, burst), i.e.
+    # Telegram's limit of about 1 message per second per chat with a short burst
+    chat_rate_limit = (1, 3)
+
+    # Define the number of threads and retries of send_many
+    send_max_workers = 8
+    send_max_retries = 3
+
+    # Initialize global send token buckets by bot class and a lock to create them
+    _send_buckets = {}
+    _send_buckets_lock = Lock()
+
+    # Define the number of recent update IDs kept to drop duplicates, or None
+    dedupe_size = 10000
+
+    # Define whether update IDs are also deduplicated across processes in Redis
+    dedupe_redis = False
+
+    # Define how long update IDs are kept in Redis in seconds
+    dedupe_ttl = 86400
+
+    # Initialize dedupe stores by bot class and Redis use
+    _dedupe_stores = {}
+    _dedupe_stores_lock = Lock()
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ ENTER METHOD                                                                   │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -61,6 +532,188 @@ class BaseBot:
 
         raise NotImplementedError
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET DEDUPE STORE                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_dedupe_store(self, use_redis=None):
+        """ Returns the update dedupe store, shared by the bot class """
+
+        # Get bot class and Redis use
+        cls = type(self)
+        use_redis = self.dedupe_redis if use_redis is None else use_redis
+
+        # Acquire lock
+        with cls._dedupe_stores_lock:
+
+            # Get dedupe store
+            store = cls._dedupe_stores.get((cls, use_redis))
+
+            # Check if dedupe store does not exist
+            if store is None:
+
+                # Create dedupe store
+                store = cls._dedupe_stores[(cls, use_redis)] = DedupeStore(
+                    size=self.dedupe_size,
+                    client=get_redis() if use_redis else None,
+                    prefix=f"beutils:bots:{cls.__module__}.{cls.__qualname__}:update",
+                    ttl=self.dedupe_ttl,
+                )
+
+        # Return dedupe store
+        return store
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ IS DUPLICATE UPDATE                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def is_duplicate_update(self, data, use_redis=None):
+        """ Returns True if the update ID of webhook data has already been seen """
+
+        # Get update ID
+        update_id = data.get("update_id")
+
+        # Return False if deduplication is disabled or there is no update ID
+        if not self.dedupe_size or update_id is None:
+            return False
+
+        # Return whether update ID was already added
+        return not self.get_dedupe_store(use_redis).add(update_id)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FORGET UPDATE                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def forget_update(self, data, use_redis=None):
+        """ Forgets the update ID of webhook data so that a retry is processed """
+
+        # Get update ID
+        update_id = data.get("update_id")
+
+        # Check if deduplication is enabled and there is an update ID
+        if self.dedupe_size and update_id is not None:
+
+            # Forget update ID
+            self.get_dedupe_store(use_redis).discard(update_id)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET SEND BUCKET                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_send_bucket(self):
+        """ Returns the global send token bucket, shared by the bot class """
+
+        # Get bot class
+        cls = type(self)
+
+        # Acquire lock
+        with cls._send_buckets_lock:
+
+            # Get send bucket
+            bucket = cls._send_buckets.get(cls)
+
+            # Check if send bucket does not exist
+            if bucket is None:
+
+                # Create send bucket
+                bucket = cls._send_buckets[cls] = TokenBucket(*self.global_rate_limit)
+
+        # Return send bucket
+        return bucket
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ _GET RETRY AFTER                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def _get_retry_after(self, exc):
+        """ Returns seconds to wait if an exception is a rate limit, else None """
+
+        return None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SEND MANY                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def send_many(self, messages, max_workers=None):
+        """
+        Sends many (chat_id, message) pairs concurrently within rate limits
+
+        Messages to the same chat are sent in order on one thread, paced by the chat
+        and global rate limits, and rate limited sends are retried after the wait
+        the server asks for. Returns a list of SendResult in input order, where a
+        failed send has an error instead of aborting the batch.
+        """
+
+        # Copy messages and initialize results
+        messages = list(messages)
+        results = [None] * len(messages)
+
+        # Get global send bucket
+        global_bucket = self.get_send_bucket()
+
+        # Define a function that sends the messages of a chat in order
+        def run(chat_id, chat_messages):
+
+            # Initialize chat bucket
+            chat_bucket = TokenBucket(*self.chat_rate_limit)
+
+            # Iterate over chat messages
+            for i, message in chat_messages:
+
+                # Initialize attempts
+                attempts = 0
+
+                # Iterate until the message is sent or fails
+                while True:
+
+                    # Wait for the chat, then the global, rate limit
+                    time.sleep(chat_bucket.reserve())
+                    time.sleep(global_bucket.reserve())
+
+                    # Increment attempts
+                    attempts += 1
+
+                    # Send message
+                    try:
+                        result, error = self.send_message(chat_id, message), None
+
+                    # Handle send errors
+                    except Exception as e:
+                        result, error = None, e
+
+                        # Get retry after
+                        retry_after = self._get_retry_after(e)
+
+                        # Retry after the requested wait if there are retries left
+                        if (
+                            retry_after is not None
+                            and attempts <= self.send_max_retries
+                        ):
+                            time.sleep(retry_after)
+                            continue
+
+                    # Set result
+                    results[i] = SendResult(chat_id, message, result, error, attempts)
+
+                    # Break
+                    break
+
+        # Run chats on a bounded thread pool
+        with ThreadPoolExecutor(
+            max_workers=max_workers or self.send_max_workers
+        ) as pool:
+            list(pool.map(lambda group: run(*group), group_messages(messages).items()))
+
+        # Return results
+        return results
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLOSE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def close(self):
+        """ Performs any additional logic necessary to close the bot """
+
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ TELEGRAM BOT                                                                       │
@@ -68,14 +721,88 @@ class BaseBot:
 
 
 class TelegramBot(BaseBot):
-    """ A class for Telegram bots """
+    """
+    A class for Telegram bots
+
+    The Bot and Dispatcher are created once per bot class and API key and shared by
+    all instances in the process, so instantiating a bot per webhook is cheap. They
+    are shut down by shutdown_dispatcher_pools, which runs at exit, not by close.
+
+    Handlers are added once per dispatcher in add_handlers. Bots that added them in
+    __init__ keep working, but should move them to add_handlers, since handlers
+    added after a second instance shares the dispatcher are ignored with a warning.
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define the number of worker threads that process updates if threaded
+    workers = 4
+
+    # Define the number of threads that run run_async handlers if threaded
+    run_async_workers = 4
+
+    # Define the max number of queued updates and the policy when the queue is full
+    queue_size = 1000
+    overflow_policy = DispatcherPool.BLOCK
+
+    # Define how long the block overflow policy waits for room in seconds
+    block_timeout = 5
+
+    # Define how long shutdown waits for queued updates to be processed in seconds
+    shutdown_timeout = 30
+
+    # Initialize dispatcher pools by bot class, API key, and threading
+    _dispatcher_pools = {}
+    _dispatcher_pools_lock = Lock()
+
+    # Define the name of the Django setting that holds the API key, which lets
+    # Celery workers recreate the bot, e.g. "TELEGRAM_API_KEY"
+    api_key_setting = None
+
+    # Define how long a chat queue lock lives in seconds, where the worker draining
+    # the queue extends it every third of this while it processes updates
+    offload_lock_timeout = 60
+
+    # Define how many times an offloaded update is processed before it is dropped,
+    # e.g. if it always raises
+    offload_max_attempts = 3
+
+    # Define how long an offloaded chat queue is kept if no worker drains it
+    offload_queue_ttl = 86400
+
+    # Define the Lua script that releases a chat queue lock if it is still held by
+    # the worker's token
+    release_lock_script = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        return redis.call("DEL", KEYS[1])
+    end
+    return 0
+    """
+
+    # Define the Lua script that extends a chat queue lock if it is still held by
+    # the worker's token
+    extend_lock_script = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        return redis.call("EXPIRE", KEYS[1], ARGV[2])
+    end
+    return 0
+    """
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ INIT METHOD                                                                    │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def __init__(self, api_key, *args, should_thread=False, **kwargs):
-        """ Custom Init Method """
+    def __init__(
+        self, api_key, *args, should_thread=False, should_offload=False, **kwargs
+    ):
+        """
+        Custom Init Method
+
+        If should_offload is True, webhook updates are queued in Redis per chat and
+        processed in order by a Celery task instead of in the web process
+        """
 
         # ┌────────────────────────────────────────────────────────────────────────────┐
         # │ PARENT INIT METHOD                                                         │
@@ -85,75 +812,343 @@ class TelegramBot(BaseBot):
         super().__init__(*args, **kwargs)
 
         # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ BOT INSTANCE                                                               │
+        # │ DISPATCHER POOL                                                            │
         # └────────────────────────────────────────────────────────────────────────────┘
 
-        # Initialize bot instance
-        bot = Bot(token=api_key)
+        # Get shared dispatcher pool
+        pool = self.get_dispatcher_pool(api_key, should_thread)
 
         # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ UPDATE QUEUE                                                               │
+        # │ SET INSTANCE ATTRIBUTES                                                    │
         # └────────────────────────────────────────────────────────────────────────────┘
 
-        # Check if should thread is True
-        if should_thread is True:
+        # Set dispatcher pool, bot, dispatcher, and update queue
+        self.should_offload = should_offload
+        self.pool = pool
+        self.bot = pool.dispatcher.bot
+        self.dispatcher = pool.dispatcher
+        self.update_queue = pool.queue if should_thread else None
 
-            # Initialize update queue
-            update_queue = Queue() if should_thread else None
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET DISPATCHER POOL                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
 
-            # Initialize dispatcher
-            dispatcher = Dispatcher(bot, update_queue)
+    def get_dispatcher_pool(self, api_key, should_thread=False):
+        """
+        Returns the dispatcher pool of an API key, creating it on first use
 
-        # Otherwise handle case of no threading
-        else:
+        The pool lives until shutdown_dispatcher_pools is called, e.g. at exit
+        """
 
-            # Initialize update queue to None
-            update_queue = None
+        # Get key
+        key = (type(self), api_key, should_thread)
 
-            # Initialize dispatcher
-            dispatcher = Dispatcher(bot, None, workers=0)
+        # Acquire lock
+        with self._dispatcher_pools_lock:
 
-        # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ HANDLERS                                                                   │
-        # └────────────────────────────────────────────────────────────────────────────┘
+            # Get dispatcher pool
+            pool = self._dispatcher_pools.get(key)
 
-        # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ START THREAD                                                               │
-        # └────────────────────────────────────────────────────────────────────────────┘
+            # Check if dispatcher pool does not exist
+            if pool is None:
 
-        if should_thread is True:
+                # Initialize bot instance and dispatcher, with run_async threads
+                # only if threaded
+                dispatcher = SharedDispatcher(
+                    Bot(token=api_key),
+                    Queue() if should_thread else None,
+                    workers=self.run_async_workers if should_thread else 0,
+                    name=type(self).__name__,
+                )
 
-            # Start the thread
-            thread = Thread(target=dispatcher.start, name="dispatcher")
-            thread.start()
+                # Start dispatcher thread if threaded, which starts the run_async
+                # threads and idles since updates are submitted to the pool
+                if should_thread:
+                    Thread(
+                        target=dispatcher.start,
+                        name=f"{type(self).__name__}-async",
+                        daemon=True,
+                    ).start()
 
-        # ┌────────────────────────────────────────────────────────────────────────────┐
-        # │ SET INSTANCE ATTRIBUTES                                                    │
-        # └────────────────────────────────────────────────────────────────────────────┘
+                # Add handlers once per dispatcher
+                self.add_handlers(dispatcher)
 
-        # Set bot, dispatcher, and update queue
-        self.bot = bot
-        self.dispatcher = dispatcher
-        self.update_queue = update_queue
+                # Create dispatcher pool, processing updates inline if not threaded
+                pool = self._dispatcher_pools[key] = DispatcherPool(
+                    dispatcher,
+                    workers=self.workers if should_thread else 0,
+                    queue_size=self.queue_size,
+                    overflow_policy=self.overflow_policy,
+                    block_timeout=self.block_timeout,
+                    name=f"{type(self).__name__}-dispatcher",
+                )
+
+            # Otherwise seal the dispatcher, since it is now shared by another
+            # instance that would add the same handlers again
+            else:
+                pool.dispatcher.sealed = True
+
+        # Return dispatcher pool
+        return pool
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SHUTDOWN DISPATCHER POOLS                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @classmethod
+    def shutdown_dispatcher_pools(cls):
+        """ Shuts down all dispatcher pools, e.g. when the process exits """
+
+        # Acquire lock
+        with cls._dispatcher_pools_lock:
+
+            # Remove all dispatcher pools
+            pools = list(cls._dispatcher_pools.items())
+            cls._dispatcher_pools.clear()
+
+        # Shut down dispatcher pools, draining their queued updates
+        for (bot_class, _, _), pool in pools:
+            pool.shutdown(timeout=bot_class.shutdown_timeout)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD HANDLERS                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_handlers(self, dispatcher):
+        """
+        Adds handlers to a dispatcher, called once per shared dispatcher
+
+        Subclasses should add handlers here rather than in __init__, since the
+        dispatcher is shared by every instance and handlers added in __init__ are
+        ignored, with a warning, once a second instance shares the dispatcher
+        """
 
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ PROCESS WEBHOOK                                                                │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
     def process_webhook(self, data):
-        """ Processes data passed in via webhook """
+        """
+        Processes data passed in via webhook
+
+        Returns False if the update was a duplicate or dropped by the overflow policy
+        """
+
+        # Get Redis use, checking Redis if offloading
+        use_redis = self.should_offload or None
+
+        # Return False if update is a duplicate
+        if self.is_duplicate_update(data, use_redis=use_redis):
+            return False
+
+        # Hand off update
+        try:
+
+            # Check if update should be offloaded to Celery
+            if self.should_offload:
+                return self.offload_update(data)
+
+            # Decode data into Update object
+            update = Update.de_json(data, self.bot)
+
+            # Pass update into queue or dispatcher
+            return self.pool.submit(update)
+
+        # Forget update if it could not be handed off so that Telegram's retry is
+        # not dropped as a duplicate
+        except Exception:
+            self.forget_update(data, use_redis=use_redis)
+            raise
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FROM SETTINGS                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @classmethod
+    def from_settings(cls, **kwargs):
+        """ Returns a bot with the API key of the api_key_setting Django setting """
+
+        # Check if API key setting is not defined
+        if not cls.api_key_setting:
+
+            # Raise exception
+            raise Exception(f"{cls.__name__}.api_key_setting must be set")
+
+        # Return bot
+        return cls(getattr(settings, cls.api_key_setting), **kwargs)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET OFFLOAD KEY                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_offload_key(self, suffix):
+        """ Returns a Redis key of the bot class, e.g. beutils:bots:<path>:<suffix> """
+
+        return (
+            f"beutils:bots:{type(self).__module__}.{type(self).__qualname__}:{suffix}"
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ OFFLOAD UPDATE                                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
 
-        # Decode data into Update object
+    def offload_update(self, data):
+        """
+        Queues an update in Redis and enqueues a Celery task to process it
+
+        Updates are queued per chat so that a chat's updates are processed in order
+        """
+
+        # Import here since tasks imports the Celery app of the project
+        from beutils.tasks import process_telegram_updates
+
+        # Get Redis client
+        client = get_redis()
+
+        # Get chat, falling back to the user for updates without a chat
         update = Update.de_json(data, self.bot)
+        chat, user = update.effective_chat, update.effective_user
+
+        # Get queue key
+        queue_key = self.get_offload_key(
+            f"chat:{chat.id}" if chat else f"user:{user.id}" if user else "global"
+        )
 
-        # Get update queue
-        update_queue = self.update_queue
+        # Queue update, expiring the queue if no worker ever drains it
+        pipeline = client.pipeline()
+        pipeline.rpush(queue_key, json.dumps(data))
+        pipeline.expire(queue_key, self.offload_queue_ttl)
+        pipeline.execute()
 
-        # Pass update into queue or dispatcher
-        update_queue.put(update) if update_queue else self.dispatcher.process_update(
-            update
+        # Enqueue task
+        process_telegram_updates.delay(
+            f"{type(self).__module__}.{type(self).__qualname__}", queue_key
         )
 
+        # Return True
+        return True
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ DRAIN UPDATE QUEUE                                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def drain_update_queue(self, queue_key):
+        """
+        Processes the offloaded updates of a queue in order
+
+        A Redis lock makes sure that only one worker drains a queue at a time, and
+        other tasks of the same queue return immediately. The lock is extended in the
+        background while updates are processed, so that a slow update does not let
+        another worker process the rest of the queue out of order.
+
+        Each update is moved to a processing list before it is processed and removed
+        from it once processed, so that an update whose processing raises or whose
+        worker dies is processed first by the next drain of the queue, i.e. updates
+        are processed at least once and at most offload_max_attempts times.
+        """
+
+        # Get Redis client, lock key, and lock release script
+        client = get_redis()
+        lock_key = f"{queue_key}:lock"
+        release_lock = client.register_script(self.release_lock_script)
+
+        # Get the keys of the processing list and of its update's attempt count
+        processing_key = f"{queue_key}:processing"
+        attempts_key = f"{queue_key}:attempts"
+
+        # Iterate while there are updates that no other worker is draining
+        while True:
+
+            # Acquire lock or return if another worker holds it
+            token = uuid.uuid4().hex
+            if not client.set(lock_key, token, nx=True, ex=self.offload_lock_timeout):
+                return
+
+            # Extend lock in the background until draining stops or the lock is lost
+            stopped = Event()
+            extender = Thread(
+                target=self.extend_drain_lock,
+                args=(client, lock_key, token, stopped),
+                daemon=True,
+            )
+            extender.start()
+
+            # Process updates until the queue is empty or the lock is lost
+            try:
+                while not stopped.is_set():
+
+                    # Get the update left by a failed drain, else move the oldest
+                    # update to the processing list
+                    data = client.lindex(processing_key, 0) or client.lmove(
+                        queue_key, processing_key, "LEFT", "RIGHT"
+                    )
+
+                    # Break if the queue is empty
+                    if data is None:
+                        break
+
+                    # Count attempt, expiring the processing list like the queue
+                    pipeline = client.pipeline()
+                    pipeline.incr(attempts_key)
+                    pipeline.expire(attempts_key, self.offload_queue_ttl)
+                    pipeline.expire(processing_key, self.offload_queue_ttl)
+                    attempts = pipeline.execute()[0]
+
+                    # Check if the update has been attempted too many times
+                    if attempts > self.offload_max_attempts:
+
+                        # Log dropped update
+                        logging.getLogger("beutils.bots").error(
+                            "Dropping offloaded Telegram update after %s attempts: %s",
+                            self.offload_max_attempts,
+                            data,
+                        )
+
+                    # Otherwise process update
+                    else:
+                        self.dispatcher.process_update(
+                            Update.de_json(json.loads(data), self.bot)
+                        )
+
+                    # Acknowledge update
+                    pipeline = client.pipeline()
+                    pipeline.lrem(processing_key, 1, data)
+                    pipeline.delete(attempts_key)
+                    pipeline.execute()
+
+            # Stop extending and release lock atomically if it is still held
+            finally:
+                stopped.set()
+                extender.join()
+                release_lock(keys=[lock_key], args=[token])
+
+            # Return unless an update was queued while the lock was being released
+            if not client.llen(queue_key) and not client.llen(processing_key):
+                return
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ EXTEND DRAIN LOCK                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def extend_drain_lock(self, client, lock_key, token, stopped):
+        """ Extends a chat queue lock until stopped is set, setting it if lost """
+
+        # Get lock extension script
+        extend_lock = client.register_script(self.extend_lock_script)
+
+        # Extend lock every third of its timeout until stopped
+        while not stopped.wait(self.offload_lock_timeout / 3):
+
+            # Continue if the lock is still held by this worker
+            if extend_lock(keys=[lock_key], args=[token, self.offload_lock_timeout]):
+                continue
+
+            # Log lost lock and stop draining
+            logging.getLogger("beutils.bots").warning(
+                "Lost the lock of offloaded Telegram updates: %s", lock_key
+            )
+            stopped.set()
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ SEND MESSAGE                                                                   │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -162,4 +1157,17 @@ class TelegramBot(BaseBot):
         """ Sends a message to a recipient / group """
 
         # Send message
-        self.bot.send_message(chat_id=chat_id, text=message)
+        return self.bot.send_message(chat_id=chat_id, text=message)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ _GET RETRY AFTER                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def _get_retry_after(self, exc):
+        """ Returns seconds to wait if an exception is a rate limit, else None """
+
+        return exc.retry_after if isinstance(exc, RetryAfter) else None
+
+
+# Drain the queued updates of all dispatcher pools when the process exits
+atexit.register(TelegramBot.shutdown_dispatcher_pools)
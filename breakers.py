@@ -0,0 +1,156 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import time
+
+from threading import Lock
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CIRCUIT OPEN ERROR                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CircuitOpenError(Exception):
+    """ Raised when a call is rejected because its circuit breaker is open """
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CIRCUIT BREAKER                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CircuitBreaker:
+    """
+    A thread-safe circuit breaker
+
+    The circuit opens after failure_threshold consecutive failures and rejects calls
+    for recovery_timeout seconds, after which it is half-open and lets through up to
+    half_open_max_calls trial calls. A successful trial closes the circuit and a
+    failed trial opens it again.
+    """
+
+    # Define states
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(
+        self, name="", failure_threshold=5, recovery_timeout=30, half_open_max_calls=1
+    ):
+        """ Custom Init Method """
+
+        # Set name and thresholds
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        # Initialize a closed circuit
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._lock = Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STATE                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def state(self):
+        """ Returns the current state, moving from open to half-open if recovered """
+
+        # Acquire lock
+        with self._lock:
+
+            # Check if open circuit has recovered
+            if (
+                self._state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.recovery_timeout
+            ):
+
+                # Move to half-open
+                self._state = self.HALF_OPEN
+                self._trial_calls = 0
+
+            # Return state
+            return self._state
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ BEFORE CALL                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def before_call(self):
+        """ Raises CircuitOpenError if a call should not be made right now """
+
+        # Get state
+        state = self.state
+
+        # Acquire lock
+        with self._lock:
+
+            # Check if circuit is closed
+            if state == self.CLOSED:
+                return
+
+            # Check if circuit is half-open and has trial calls left
+            if state == self.HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+
+                # Count trial call
+                self._trial_calls += 1
+
+                # Return
+                return
+
+            # Get seconds until the circuit may be retried
+            retry_in = max(
+                0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)
+            )
+
+        # Raise CircuitOpenError
+        raise CircuitOpenError(
+            f"Circuit {self.name} is {state}, retry in {retry_in:.1f} seconds"
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD SUCCESS                                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record_success(self):
+        """ Records a successful call, closing the circuit """
+
+        # Acquire lock
+        with self._lock:
+
+            # Close circuit and reset failures
+            self._state = self.CLOSED
+            self._failures = 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD FAILURE                                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record_failure(self):
+        """ Records a failed call, opening the circuit if past the threshold """
+
+        # Acquire lock
+        with self._lock:
+
+            # Increment failures
+            self._failures += 1
+
+            # Check if a trial call failed or there are too many failures
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+
+                # Open circuit
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -9,7 +9,7 @@ from django.contrib import admin
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 
-from beutils.currency.models import Currency
+from beutils.currency.models import Currency, ExchangeRate
 
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
@@ -42,9 +42,42 @@ class CurrencyAdmin(admin.ModelAdmin):
     search_fields = ["name", "slug", "code"]
 
 
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ EXCHANGE RATE ADMIN                                                                │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ExchangeRateAdmin(admin.ModelAdmin):
+    """ Exchange Rate Admin Class """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define list display
+    list_display = [
+        "id",
+        "base",
+        "quote",
+        "rate",
+        "created_at",
+        "updated_at",
+    ]
+
+    # Define list display links
+    list_display_links = ["id"]
+
+    # Define list select related
+    list_select_related = ["base", "quote"]
+
+    # Define search fields
+    search_fields = ["base__code", "quote__code"]
+
+
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ADMIN REGISTRATION                                                                  │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 # Register model admins
 admin.site.register(Currency, CurrencyAdmin)
+admin.site.register(ExchangeRate, ExchangeRateAdmin)
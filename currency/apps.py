@@ -13,3 +13,13 @@ from django.apps import AppConfig
 class CurrencyConfig(AppConfig):
     name = "beutils.currency"
     label = "beutils_currency"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ READY                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def ready(self):
+        """ Connects currency signal receivers """
+
+        # Import signals to connect receivers
+        import beutils.currency.signals  # noqa: F401
@@ -0,0 +1,170 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import numpy as np
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ APP IMPORTS                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.models import Currency, ExchangeRate
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY CONVERTER                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencyConverter:
+    """
+    A vectorized currency converter backed by a dense exchange rate matrix
+
+    The matrix is indexed by currency position, where matrix[i, j] is the price of
+    one unit of currency i in units of currency j. Missing pairs are filled from
+    inverse rates and then triangulated through a base currency.
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, rates, base_id=None):
+        """ Builds the rate matrix from an iterable of (base ID, quote ID, rate) """
+
+        # Coerce rates to a list
+        rates = [(b, q, float(r)) for b, q, r in rates]
+
+        # Get sorted currency IDs
+        ids = sorted(({pk for b, q, r in rates for pk in (b, q)} | {base_id}) - {None})
+
+        # Initialize a lookup array that maps currency IDs to matrix positions, with at
+        # least one slot so that unknown IDs can be looked up on an empty converter
+        index = np.full((ids[-1] + 1) if ids else 1, -1, dtype=np.intp)
+        index[ids] = np.arange(len(ids))
+
+        # Initialize rate matrix
+        matrix = np.full((len(ids), len(ids)), np.nan)
+
+        # Check if there are rates
+        if rates:
+
+            # Unpack rates into columns
+            bases, quotes, values = zip(*rates)
+
+            # Fill direct rates
+            matrix[index[list(bases)], index[list(quotes)]] = values
+
+        # Fill missing rates from inverse rates
+        with np.errstate(divide="ignore"):
+            matrix = np.where(np.isnan(matrix), 1 / matrix.T, matrix)
+
+        # Set identity rates
+        np.fill_diagonal(matrix, 1.0)
+
+        # Check if a base currency is given for triangulation
+        if base_id is not None:
+
+            # Get base position
+            b = index[base_id]
+
+            # Fill missing rates through the base, i.e. i -> base -> j
+            matrix = np.where(
+                np.isnan(matrix), np.outer(matrix[:, b], matrix[b, :]), matrix
+            )
+
+        # Set instance attributes
+        self.ids = ids
+        self.index = index
+        self.matrix = matrix
+        self.base_id = base_id
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FROM DB                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @classmethod
+    def from_db(cls, base_code="USD"):
+        """ Builds a converter from the latest ExchangeRate objects in one query """
+
+        # Get base currency ID
+        base_id = (
+            Currency.objects.filter(code=base_code).values_list("id", flat=True).first()
+            if base_code
+            else None
+        )
+
+        # Check if the base currency is unknown
+        if base_code and base_id is None:
+
+            # Raise exception
+            raise ValueError(f"Unknown base currency code: {base_code}")
+
+        # Return converter
+        return cls(
+            ExchangeRate.objects.values_list("base_id", "quote_id", "rate"),
+            base_id=base_id,
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET POSITIONS                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_positions(self, currency_ids):
+        """ Returns the matrix positions of a currency ID or array of currency IDs """
+
+        # Coerce currency IDs to an array
+        currency_ids = np.asarray(currency_ids, dtype=np.intp)
+
+        # Get out of range mask
+        out_of_range = (currency_ids < 0) | (currency_ids >= len(self.index))
+
+        # Get positions, treating out of range IDs as unknown
+        positions = np.where(
+            out_of_range, -1, self.index[np.where(out_of_range, 0, currency_ids)]
+        )
+
+        # Check if any currency is unknown
+        if (positions < 0).any():
+
+            # Raise exception
+            raise ValueError(
+                f"Unknown currency IDs: {np.unique(currency_ids[positions < 0])}"
+            )
+
+        # Return positions
+        return positions
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET RATES                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_rates(self, from_ids, to_ids):
+        """ Returns an array of rates for broadcastable arrays of currency IDs """
+
+        # Look up rates
+        rates = self.matrix[self.get_positions(from_ids), self.get_positions(to_ids)]
+
+        # Check if any rate is missing
+        if np.isnan(rates).any():
+
+            # Raise exception
+            raise ValueError("No exchange rate for one or more currency pairs")
+
+        # Return rates
+        return rates
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CONVERT                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def convert(self, amounts, from_ids, to_ids):
+        """
+        Converts an array of amounts between currencies
+
+        Currency IDs can be scalars or arrays broadcastable against amounts, e.g.
+            converter.convert(amounts, usd.id, thb.id)
+            converter.convert(amounts, from_ids_array, thb.id)
+        """
+
+        return np.asarray(amounts, dtype=np.float64) * self.get_rates(from_ids, to_ids)
@@ -0,0 +1,121 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import time
+
+import numpy as np
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.core.management.base import BaseCommand
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.converters import CurrencyConverter
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ COMMAND                                                                            │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Command(BaseCommand):
+    """ Benchmarks CurrencyConverter against a per-amount conversion loop """
+
+    # Define help text
+    help = "Benchmarks vectorized conversion of random amounts between currencies"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD ARGUMENTS                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_arguments(self, parser):
+        """ Adds command line arguments """
+
+        # Add amounts argument
+        parser.add_argument(
+            "--amounts",
+            type=int,
+            default=1_000_000,
+            help="Number of amounts to convert",
+        )
+
+        # Add currencies argument
+        parser.add_argument(
+            "--currencies",
+            type=int,
+            default=200,
+            help="Number of currencies, each with a rate against the base currency",
+        )
+
+        # Add loop sample argument
+        parser.add_argument(
+            "--loop-sample",
+            type=int,
+            default=100_000,
+            help="Number of amounts to time the per-amount loop on",
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ HANDLE                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def handle(self, *args, **options):
+        """ Times the conversion of random amounts with random currency pairs """
+
+        # Get options
+        n = options["amounts"]
+        currencies = options["currencies"]
+        sample = min(options["loop_sample"], n)
+
+        # Initialize a seeded random generator
+        rng = np.random.default_rng(0)
+
+        # Generate a rate of each currency against currency 1
+        rates = rng.uniform(0.01, 100, currencies - 1)
+
+        # Build a converter where currency 1 is the base and the rest are triangulated
+        converter = CurrencyConverter(
+            [(1, pk, rate) for pk, rate in enumerate(rates, start=2)], base_id=1
+        )
+
+        # Generate random amounts and currency pairs
+        amounts = rng.uniform(0, 1000, n)
+        from_ids = rng.integers(1, currencies + 1, n)
+        to_ids = rng.integers(1, currencies + 1, n)
+
+        # Time vectorized conversion
+        start = time.perf_counter()
+        converted = converter.convert(amounts, from_ids, to_ids)
+        vectorized = time.perf_counter() - start
+
+        # Time per-amount conversion on a sample
+        start = time.perf_counter()
+        looped = [
+            amount * float(converter.get_rates(from_id, to_id))
+            for amount, from_id, to_id in zip(
+                amounts[:sample].tolist(),
+                from_ids[:sample].tolist(),
+                to_ids[:sample].tolist(),
+            )
+        ]
+        loop = (time.perf_counter() - start) * n / sample
+
+        # Check that both conversions agree
+        if not np.allclose(converted[:sample], looped):
+
+            # Raise exception
+            raise ValueError("Vectorized and looped conversions differ")
+
+        # Write results
+        self.stdout.write(f"Converted {n:,} amounts between {currencies} currencies")
+        self.stdout.write(f"Vectorized: {vectorized:.4f}s")
+        self.stdout.write(
+            f"Per-amount loop: {loop:.4f}s (extrapolated from {sample:,})"
+        )
+        self.stdout.write(f"Speedup: {loop / vectorized:.0f}x")
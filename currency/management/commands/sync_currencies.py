@@ -0,0 +1,150 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import os
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.models import Currency
+from beutils.currency.registry import currency_registry
+from beutils.location.models import Country
+from beutils.syncers import sync_objects
+from beutils.tools import read_json, slugify
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ FIXTURE DIRECTORY                                                                  │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Define fixture directory
+FIXTURE_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "fixtures",
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ COMMAND                                                                            │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Command(BaseCommand):
+    """ Synchronizes Currency objects with the fiat and crypto fixtures """
+
+    # Define help text
+    help = "Synchronizes currencies with the fiat and crypto currency fixtures"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD ARGUMENTS                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_arguments(self, parser):
+        """ Adds command line arguments """
+
+        # Add prune argument
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete currencies that are no longer in the fixtures",
+        )
+
+        # Add dry run argument
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changeset without applying it",
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET RECORDS                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_records(self):
+        """ Returns a list of currency record dicts built from the fixtures """
+
+        # Read currency fixture files
+        fiat = read_json(os.path.join(FIXTURE_DIRECTORY, "fiat.json")) or []
+        crypto = read_json(os.path.join(FIXTURE_DIRECTORY, "crypto.json")) or []
+
+        # Get all countries in a single query
+        countries = dict(Country.objects.values_list("iso3", "id"))
+
+        # Initialize records
+        records = [
+            {
+                "country_id": countries.get(currency["country_iso3"]),
+                "name": currency["name"],
+                "slug": slugify(currency["name"]),
+                "name_plural": currency["name_plural"],
+                "code": currency["code"],
+                "number": currency["number"],
+                "symbol": currency["symbol"],
+                "symbol_native": currency["symbol_native"],
+                "kind": Currency.FIAT,
+            }
+            for currency in fiat
+        ]
+
+        # Add crypto records
+        records += [
+            {
+                "name": currency["name"],
+                "slug": slugify(currency["name"]),
+                "code": currency["code"],
+                "symbol": currency["code"],
+                "kind": Currency.CRYPTO,
+            }
+            for currency in crypto
+        ]
+
+        # Return records ordered by name
+        return sorted(records, key=lambda x: x["slug"])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ HANDLE                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def handle(self, *args, **options):
+        """ Computes and applies the currency changeset in a single transaction """
+
+        # Get dry run
+        dry_run = options["dry_run"]
+
+        # Apply changes in a single transaction
+        with transaction.atomic():
+
+            # Sync currencies keyed by code
+            changeset = sync_objects(
+                Currency.objects.all(),
+                self.get_records(),
+                key="code",
+                prune=options["prune"],
+                dry_run=dry_run,
+            )
+
+            # Invalidate currency registry on commit since bulk writes skip signals
+            transaction.on_commit(currency_registry.invalidate)
+
+        # Iterate over changeset
+        for action, codes in changeset.items():
+
+            # Write action summary
+            self.stdout.write(
+                f"{action.title()}: {len(codes)}"
+                + (f" ({', '.join(codes)})" if codes else "")
+            )
+
+        # Write success message
+        self.stdout.write(
+            self.style.SUCCESS("Dry run complete" if dry_run else "Currencies synced")
+        )
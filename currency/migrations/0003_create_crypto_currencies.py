@@ -45,9 +45,9 @@ def create_crypto_currencies(apps, schema_editor):
     if not currencies:
         return
 
-    # Get list of existing crypto codes
-    existing_codes = Currency.objects.filter(kind="crypto").values_list(
-        "code", flat=True
+    # Get set of existing crypto codes in a single query
+    existing_codes = set(
+        Currency.objects.filter(kind="crypto").values_list("code", flat=True)
     )
 
     # Bulk create currencies
@@ -0,0 +1,63 @@
+# Generated by Django 3.1.1 on 2026-10-19 09:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beutils_currency", "0004_auto_20210331_1006"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExchangeRate",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="updated at"),
+                ),
+                ("rate", models.DecimalField(decimal_places=15, max_digits=30)),
+                (
+                    "base",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="base_exchange_rates",
+                        to="beutils_currency.currency",
+                    ),
+                ),
+                (
+                    "quote",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="quote_exchange_rates",
+                        to="beutils_currency.currency",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Exchange Rate",
+                "verbose_name_plural": "Exchange Rates",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="exchangerate",
+            constraint=models.UniqueConstraint(
+                fields=("base", "quote"), name="unique_exchange_rate_pair"
+            ),
+        ),
+    ]
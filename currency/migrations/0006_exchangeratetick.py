@@ -0,0 +1,96 @@
+# Generated by Django 3.1.1 on 2026-10-19 09:30
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PARTITIONED TABLE SQL                                                              │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Define SQL to create the tick table partitioned by month on timestamp, where the
+# partition key must be part of the primary key
+CREATE_TABLE_SQL = """
+CREATE TABLE "beutils_currency_exchangeratetick" (
+    "id" bigserial NOT NULL,
+    "base_id" integer NOT NULL
+        REFERENCES "beutils_currency_currency" ("id") DEFERRABLE INITIALLY DEFERRED,
+    "quote_id" integer NOT NULL
+        REFERENCES "beutils_currency_currency" ("id") DEFERRABLE INITIALLY DEFERRED,
+    "timestamp" timestamp with time zone NOT NULL,
+    "rate" numeric(30, 15) NOT NULL,
+    PRIMARY KEY ("id", "timestamp")
+) PARTITION BY RANGE ("timestamp");
+
+CREATE INDEX "exchangeratetick_ts_brin"
+    ON "beutils_currency_exchangeratetick" USING brin ("timestamp");
+
+CREATE INDEX "exchangeratetick_pair_ts"
+    ON "beutils_currency_exchangeratetick" ("base_id", "quote_id", "timestamp" DESC);
+"""
+
+# Define SQL to drop the tick table and all of its partitions
+DROP_TABLE_SQL = 'DROP TABLE "beutils_currency_exchangeratetick" CASCADE;'
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ MIGRATION                                                                          │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("beutils_currency", "0005_exchangerate"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            CREATE_TABLE_SQL,
+            DROP_TABLE_SQL,
+            state_operations=[
+                migrations.CreateModel(
+                    name="ExchangeRateTick",
+                    fields=[
+                        ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                        ("timestamp", models.DateTimeField()),
+                        ("rate", models.DecimalField(decimal_places=15, max_digits=30)),
+                        (
+                            "base",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.DO_NOTHING,
+                                related_name="+",
+                                to="beutils_currency.currency",
+                            ),
+                        ),
+                        (
+                            "quote",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.DO_NOTHING,
+                                related_name="+",
+                                to="beutils_currency.currency",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Exchange Rate Tick",
+                        "verbose_name_plural": "Exchange Rate Ticks",
+                    },
+                ),
+                migrations.AddIndex(
+                    model_name="exchangeratetick",
+                    index=django.contrib.postgres.indexes.BrinIndex(
+                        fields=["timestamp"], name="exchangeratetick_ts_brin"
+                    ),
+                ),
+                migrations.AddIndex(
+                    model_name="exchangeratetick",
+                    index=models.Index(
+                        fields=["base", "quote", "-timestamp"],
+                        name="exchangeratetick_pair_ts",
+                    ),
+                ),
+            ],
+        ),
+    ]
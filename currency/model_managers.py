@@ -0,0 +1,228 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.db import connections, models, router, transaction
+from django.utils import timezone
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.tools import to_utc
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ MAKE AWARE                                                                         │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def make_aware(dt):
+    """ Makes a naive datetime aware in TIME_ZONE, as Django interprets it """
+
+    # Return datetime if already timezone aware
+    if not dt or timezone.is_aware(dt):
+        return dt
+
+    # Return datetime localized to the default timezone
+    return timezone.make_aware(dt, timezone.get_default_timezone())
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY QUERYSET                                                                  │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencyQuerySet(models.QuerySet):
+    """ A queryset for the Currency model """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FIAT                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def fiat(self):
+        """ Filters the queryset to fiat currencies """
+
+        return self.filter(kind="fiat")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CRYPTO                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def crypto(self):
+        """ Filters the queryset to crypto currencies """
+
+        return self.filter(kind="crypto")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ WITH COUNTRY                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def with_country(self):
+        """ Joins country so that emoji and emoji_u do not query per currency """
+
+        return self.select_related("country")
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY MANAGER                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencyManager(models.Manager.from_queryset(CurrencyQuerySet)):
+    """ A model manager for the Currency model """
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ EXCHANGE RATE TICK MANAGER                                                         │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ExchangeRateTickManager(models.Manager):
+    """ A model manager for the month-partitioned ExchangeRateTick model """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, *args, **kwargs):
+        """ Custom Init Method """
+
+        # Call parent init method
+        super().__init__(*args, **kwargs)
+
+        # Initialize set of months known to have a partition
+        self._partitioned_months = set()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ENSURE PARTITIONS                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def ensure_partitions(self, months):
+        """ Creates monthly partitions for an iterable of (year, month) tuples """
+
+        # Get months that are not known to have a partition
+        months = set(months) - self._partitioned_months
+
+        # Return if there is nothing to create
+        if not months:
+            return
+
+        # Get table name and the database that ticks are written to
+        table = self.model._meta.db_table
+        using = router.db_for_write(self.model)
+
+        # Get a cursor for the write database
+        with connections[using].cursor() as cursor:
+
+            # Iterate over months
+            for year, month in sorted(months):
+
+                # Get the first day of the next month
+                next_year, next_month = (
+                    (year + 1, 1) if month == 12 else (year, month + 1)
+                )
+
+                # Create partition if it does not exist
+                cursor.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{table}_p{year:04d}{month:02d}" '
+                    f'PARTITION OF "{table}" FOR VALUES '
+                    f"FROM ('{year:04d}-{month:02d}-01 00:00:00+00') "
+                    f"TO ('{next_year:04d}-{next_month:02d}-01 00:00:00+00')"
+                )
+
+        # Remember created partitions once they are committed
+        transaction.on_commit(
+            lambda: self._partitioned_months.update(months), using=using
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INGEST                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def ingest(self, ticks, batch_size=5000):
+        """
+        Bulk inserts an iterable of (base ID, quote ID, timestamp, rate) ticks
+
+        Partitions are created for every month spanned by the ticks beforehand
+        """
+
+        # Initialize objects
+        objs = [
+            self.model(base_id=base_id, quote_id=quote_id, timestamp=ts, rate=rate)
+            for base_id, quote_id, ts, rate in ticks
+        ]
+
+        # Ensure that each month has a partition
+        self.ensure_partitions(
+            {
+                (ts.year, ts.month)
+                for ts in (to_utc(make_aware(obj.timestamp)) for obj in objs)
+            }
+        )
+
+        # Bulk create objects
+        return self.bulk_create(objs, batch_size=batch_size)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ AS OF                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def as_of(self, queries):
+        """
+        Resolves many (base ID, quote ID, timestamp) queries in one round trip
+
+        Returns a list of (rate, timestamp) tuples of the latest tick at or before
+        each query timestamp, or None where there is no such tick
+        """
+
+        # Coerce queries to a list
+        queries = list(queries)
+
+        # Return if there are no queries
+        if not queries:
+            return []
+
+        # Unpack queries into columns
+        base_ids, quote_ids, timestamps = (list(c) for c in zip(*queries))
+
+        # Make naive timestamps aware, since the database session is in UTC
+        timestamps = [make_aware(ts) for ts in timestamps]
+
+        # Get table name
+        table = self.model._meta.db_table
+
+        # Get a cursor for the manager's database
+        with connections[self.db].cursor() as cursor:
+
+            # Select the latest tick per query with a lateral index lookup
+            cursor.execute(
+                f"""
+                SELECT q.i, t.rate, t.timestamp
+                FROM unnest(%s::int[], %s::int[], %s::timestamptz[])
+                    WITH ORDINALITY AS q(base_id, quote_id, ts, i)
+                LEFT JOIN LATERAL (
+                    SELECT rate, timestamp
+                    FROM "{table}"
+                    WHERE base_id = q.base_id
+                        AND quote_id = q.quote_id
+                        AND timestamp <= q.ts
+                    ORDER BY timestamp DESC
+                    LIMIT 1
+                ) t ON TRUE
+                """,
+                [base_ids, quote_ids, timestamps],
+            )
+
+            # Initialize results
+            results = [None] * len(queries)
+
+            # Iterate over rows
+            for i, rate, ts in cursor.fetchall():
+
+                # Set result if a tick was found
+                if ts is not None:
+                    results[i - 1] = (rate, ts)
+
+        # Return results
+        return results
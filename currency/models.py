@@ -2,6 +2,7 @@
 # │ DJANGO IMPORTS                                                                     │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
+from django.contrib.postgres.indexes import BrinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 
@@ -11,6 +12,12 @@ from django.db import models
 
 from beutils.model_mixins import UniqueNameSlugModelMixin, TimeStampedModelMixin
 
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ APP IMPORTS                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.model_managers import CurrencyManager, ExchangeRateTickManager
+
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ CURRENCY                                                                           │
@@ -75,6 +82,13 @@ class Currency(UniqueNameSlugModelMixin, TimeStampedModelMixin):
     # Define kind model field
     kind = models.CharField(max_length=10, choices=KIND_CHOICES)
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ MODEL MANAGER                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Use the model manager
+    objects = CurrencyManager()
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ STRING METHOD                                                                  │
     # └────────────────────────────────────────────────────────────────────────────────┘
@@ -179,3 +193,130 @@ class Currency(UniqueNameSlugModelMixin, TimeStampedModelMixin):
         # Define verbose names
         verbose_name = "Currency"
         verbose_name_plural = "Currencies"
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ EXCHANGE RATE                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ExchangeRate(TimeStampedModelMixin):
+    """ Exchange Rate Model, i.e. the latest price of one base unit in quote units """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CURRENCY FOREIGN KEYS                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    base = models.ForeignKey(
+        Currency, related_name="base_exchange_rates", on_delete=models.CASCADE
+    )
+
+    quote = models.ForeignKey(
+        Currency, related_name="quote_exchange_rates", on_delete=models.CASCADE
+    )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RATE                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    rate = models.DecimalField(max_digits=30, decimal_places=15)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STRING METHOD                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __str__(self):
+        """ Custom String Method """
+
+        return f"{self.base_id}/{self.quote_id}: {self.rate}"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ META                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    class Meta:
+
+        # Define constraints
+        constraints = [
+            models.UniqueConstraint(
+                fields=["base", "quote"], name="unique_exchange_rate_pair"
+            )
+        ]
+
+        # Define verbose names
+        verbose_name = "Exchange Rate"
+        verbose_name_plural = "Exchange Rates"
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ EXCHANGE RATE TICK                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ExchangeRateTick(models.Model):
+    """
+    Exchange Rate Tick Model, i.e. a point-in-time rate of a currency pair
+
+    Ticks are stored in a table partitioned by month on timestamp, so rows must be
+    inserted through ExchangeRateTick.objects.ingest, which creates partitions
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ID                                                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    id = models.BigAutoField(primary_key=True)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CURRENCY FOREIGN KEYS                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    base = models.ForeignKey(Currency, related_name="+", on_delete=models.DO_NOTHING)
+
+    quote = models.ForeignKey(Currency, related_name="+", on_delete=models.DO_NOTHING)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TIMESTAMP                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    timestamp = models.DateTimeField()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RATE                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    rate = models.DecimalField(max_digits=30, decimal_places=15)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ MODEL MANAGER                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Use the model manager
+    objects = ExchangeRateTickManager()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STRING METHOD                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __str__(self):
+        """ Custom String Method """
+
+        return f"{self.base_id}/{self.quote_id} @ {self.timestamp}: {self.rate}"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ META                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    class Meta:
+
+        # Define indexes, which are created on the partitioned table in migrations
+        indexes = [
+            BrinIndex(fields=["timestamp"], name="exchangeratetick_ts_brin"),
+            models.Index(
+                fields=["base", "quote", "-timestamp"], name="exchangeratetick_pair_ts"
+            ),
+        ]
+
+        # Define verbose names
+        verbose_name = "Exchange Rate Tick"
+        verbose_name_plural = "Exchange Rate Ticks"
@@ -0,0 +1,257 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import time
+
+from collections import namedtuple
+from threading import Lock
+from types import MappingProxyType
+from uuid import uuid4
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.core.cache import cache
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.models import Currency
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY RECORD                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Define an immutable currency record with the country emoji denormalized
+CurrencyRecord = namedtuple(
+    "CurrencyRecord",
+    [
+        "id",
+        "name",
+        "slug",
+        "name_plural",
+        "code",
+        "number",
+        "symbol",
+        "symbol_native",
+        "kind",
+        "country_id",
+        "emoji",
+        "emoji_u",
+    ],
+)
+
+# Define a snapshot of registry lookup tables
+CurrencySnapshot = namedtuple(
+    "CurrencySnapshot", ["by_id", "by_code", "by_number", "by_country", "version"]
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY REGISTRY                                                                  │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencyRegistry:
+    """
+    A process-local, read-only registry of all Currency objects
+
+    The registry is loaded lazily in a single query and reloaded after it has been
+    invalidated, either locally or by another process bumping the version stamp
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define the cache key of the cross-process version stamp
+    version_cache_key = "beutils:currency_registry:version"
+
+    # Define how often in seconds the version stamp is checked
+    version_check_interval = 30
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self):
+        """ Custom Init Method """
+
+        # Initialize lock, snapshot, and last version check
+        self._lock = Lock()
+        self._snapshot = None
+        self._checked_at = 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ LOAD                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def load(self):
+        """ Loads all currencies into a new immutable snapshot """
+
+        # Get version stamp before reading so that concurrent changes trigger a reload
+        version = cache.get(self.version_cache_key)
+
+        # Initialize lookup tables
+        by_id, by_code, by_number, by_country = {}, {}, {}, {}
+
+        # Iterate over currencies in a single query
+        for currency in Currency.objects.with_country():
+
+            # Initialize currency record
+            record = CurrencyRecord(
+                id=currency.id,
+                name=currency.name,
+                slug=currency.slug,
+                name_plural=currency.name_plural,
+                code=currency.code,
+                number=currency.number,
+                symbol=currency.symbol,
+                symbol_native=currency.symbol_native,
+                kind=currency.kind,
+                country_id=currency.country_id,
+                emoji=currency.emoji,
+                emoji_u=currency.emoji_u,
+            )
+
+            # Add record to lookup tables
+            by_id[record.id] = record
+            by_code[record.code] = record
+
+            # Check if currency has a number
+            if record.number is not None:
+                by_number[record.number] = record
+
+            # Check if currency has a country
+            if record.country_id is not None:
+                by_country.setdefault(record.country_id, []).append(record)
+
+        # Initialize snapshot
+        snapshot = CurrencySnapshot(
+            by_id=MappingProxyType(by_id),
+            by_code=MappingProxyType(by_code),
+            by_number=MappingProxyType(by_number),
+            by_country=MappingProxyType({k: tuple(v) for k, v in by_country.items()}),
+            version=version,
+        )
+
+        # Swap in the new snapshot
+        self._snapshot = snapshot
+        self._checked_at = time.monotonic()
+
+        # Return snapshot
+        return snapshot
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INVALIDATE                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def invalidate(self, bump_version=True):
+        """ Discards the current snapshot and optionally bumps the version stamp """
+
+        # Check if version should be bumped for other processes
+        if bump_version:
+
+            # Set a new version stamp
+            cache.set(self.version_cache_key, uuid4().hex, None)
+
+        # Discard snapshot
+        self._snapshot = None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET SNAPSHOT                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_snapshot(self):
+        """ Returns the current snapshot, loading or reloading it if necessary """
+
+        # Get snapshot
+        snapshot = self._snapshot
+
+        # Check if snapshot is loaded and the version check is not due
+        if (
+            snapshot is not None
+            and time.monotonic() - self._checked_at < self.version_check_interval
+        ):
+            return snapshot
+
+        # Acquire lock so that only one thread loads at a time
+        with self._lock:
+
+            # Get snapshot again in case another thread loaded it
+            snapshot = self._snapshot
+
+            # Load snapshot if missing
+            if snapshot is None:
+                return self.load()
+
+            # Return snapshot if another thread has just checked the version
+            if time.monotonic() - self._checked_at < self.version_check_interval:
+                return snapshot
+
+            # Reload snapshot if the version stamp has changed
+            if cache.get(self.version_cache_key) != snapshot.version:
+                return self.load()
+
+            # Otherwise reset the version check
+            self._checked_at = time.monotonic()
+
+            # Return snapshot
+            return snapshot
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET BY ID                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_by_id(self, pk):
+        """ Returns a currency record by ID or None """
+
+        return self.get_snapshot().by_id.get(pk)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET BY CODE                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_by_code(self, code):
+        """ Returns a currency record by code or None """
+
+        return self.get_snapshot().by_code.get(code.upper().strip())
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET BY NUMBER                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_by_number(self, number):
+        """ Returns a currency record by ISO 4217 number or None """
+
+        return self.get_snapshot().by_number.get(number)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FOR COUNTRY                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def for_country(self, country_id):
+        """ Returns a tuple of currency records for a country ID """
+
+        return self.get_snapshot().by_country.get(country_id, ())
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ALL                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def all(self):
+        """ Returns a tuple of all currency records """
+
+        return tuple(self.get_snapshot().by_id.values())
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY REGISTRY INSTANCE                                                         │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Initialize process-wide currency registry
+currency_registry = CurrencyRegistry()
@@ -0,0 +1,143 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO REST FRAMEWORK IMPORTS                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from dynamic_rest.serializers import DynamicModelSerializer
+from rest_framework.serializers import Field, ReadOnlyField, ValidationError
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROJECT IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.models import Currency
+from beutils.currency.registry import currency_registry
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY CODE FIELD                                                                │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencyCodeField(Field):
+    """
+    A serializer field that reads and writes a currency foreign key by code
+
+    Lookups are served by the in-memory currency registry, e.g.
+        currency = CurrencyCodeField(source="currency_id")
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TO REPRESENTATION                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def to_representation(self, value):
+        """ Returns the currency code of a currency ID """
+
+        # Get currency record
+        record = currency_registry.get_by_id(value)
+
+        # Return currency code
+        return record.code if record else None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TO INTERNAL VALUE                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def to_internal_value(self, data):
+        """ Returns the currency ID of a currency code """
+
+        # Get currency record
+        record = currency_registry.get_by_code(str(data))
+
+        # Check if currency does not exist
+        if record is None:
+
+            # Raise ValidationError
+            raise ValidationError(f"Invalid currency code: {data}")
+
+        # Return currency ID
+        return record.id
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY EMOJI FIELD                                                               │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencyEmojiField(ReadOnlyField):
+    """
+    A read-only serializer field that reads a currency emoji from the registry
+
+    The registry denormalizes country emojis, so listing currencies does not query
+    the country of each currency, e.g.
+        emoji_u = CurrencyEmojiField(attribute="emoji_u")
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, attribute="emoji", **kwargs):
+        """ Custom Init Method """
+
+        # Set attribute
+        self.attribute = attribute
+
+        # Call parent init method with the whole currency as source
+        super().__init__(source="*", **kwargs)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TO REPRESENTATION                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def to_representation(self, value):
+        """ Returns the emoji of a currency, falling back to the model property """
+
+        # Get currency record
+        record = currency_registry.get_by_id(value.pk)
+
+        # Return emoji
+        return getattr(record or value, self.attribute)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY SERIALIZER                                                                │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencySerializer(DynamicModelSerializer):
+
+    # Read emojis from the currency registry rather than the country of each currency
+    emoji = CurrencyEmojiField()
+    emoji_u = CurrencyEmojiField(attribute="emoji_u")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ META                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    class Meta:
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ MODEL                                                                      │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        model = Currency
+        name = "currency"
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ FIELDS                                                                     │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        fields = (
+            "id",
+            "name",
+            "name_plural",
+            "code",
+            "number",
+            "symbol",
+            "symbol_native",
+            "kind",
+            "country",
+            "emoji",
+            "emoji_u",
+        )
@@ -0,0 +1,31 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.models import Currency
+from beutils.currency.registry import currency_registry
+from beutils.location.models import Country
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ INVALIDATE CURRENCY REGISTRY                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def invalidate_currency_registry(sender, **kwargs):
+    """ Invalidates the currency registry once the current transaction commits """
+
+    # Invalidate registry on commit so that it never reloads uncommitted rows
+    transaction.on_commit(currency_registry.invalidate)
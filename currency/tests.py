@@ -0,0 +1,340 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from io import StringIO
+
+import numpy as np
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.converters import CurrencyConverter
+from beutils.currency.models import Currency, ExchangeRate
+from beutils.currency.registry import currency_registry
+from beutils.currency.serializers import CurrencySerializer
+from beutils.location.models import Country, Region, Subregion
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY SERIALIZER TEST CASE                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencySerializerTestCase(TestCase):
+    """ Tests that listing currencies takes a constant number of queries """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP TEST DATA                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Creates a country with a currency for each test """
+
+        # Create region and subregion
+        region = Region.objects.create(name="Test Region", slug="test-region")
+        subregion = Subregion.objects.create(
+            name="Test Subregion", slug="test-subregion", region=region
+        )
+
+        # Iterate over test countries
+        for i in range(5):
+
+            # Create country
+            country = Country.objects.create(
+                region=region,
+                subregion=subregion,
+                name=f"Test Country {i}",
+                slug=f"test-country-{i}",
+                name_official=f"Test Country Official {i}",
+                slug_official=f"test-country-official-{i}",
+                name_native=f"Test Country Native {i}",
+                iso2=f"X{i}",
+                iso3=f"XX{i}",
+                demonym="Tester",
+                is_nationality=True,
+                emoji="🏳",
+                emoji_u="U+1F3F3",
+            )
+
+            # Create currency
+            Currency.objects.create(
+                country=country,
+                name=f"Test Currency {i}",
+                slug=f"test-currency-{i}",
+                name_plural=f"Test Currencies {i}",
+                code=f"XT{i}",
+                number=9900 + i,
+                symbol=f"T{i}",
+                symbol_native=f"T{i}",
+                kind=Currency.FIAT,
+            )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Discards the currency registry so that each test loads it """
+
+        # Invalidate currency registry
+        currency_registry.invalidate()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST LIST QUERY COUNT                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_list_query_count(self):
+        """ Listing all currencies queries currencies and loads the registry once """
+
+        # Serialize all currencies, i.e. one list query and one registry query
+        with self.assertNumQueries(2):
+            data = CurrencySerializer(Currency.objects.all(), many=True).data
+
+        # Check that emojis were serialized
+        self.assertEqual(
+            {item["emoji"] for item in data if item["code"].startswith("XT")}, {"🏳"}
+        )
+
+        # Serialize all currencies again, i.e. one list query with a loaded registry
+        with self.assertNumQueries(1):
+            CurrencySerializer(Currency.objects.all(), many=True).data
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST LIST QUERY COUNT IS CONSTANT                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_list_query_count_is_constant(self):
+        """ Listing more currencies does not take more queries """
+
+        # Count queries of serializing all currencies
+        with CaptureQueriesContext(connection) as context:
+            CurrencySerializer(Currency.objects.all(), many=True).data
+
+        # Create more currencies without a country
+        Currency.objects.bulk_create(
+            [
+                Currency(
+                    name=f"Extra Currency {i}",
+                    slug=f"extra-currency-{i}",
+                    name_plural=f"Extra Currencies {i}",
+                    code=f"XE{i}",
+                    number=9800 + i,
+                    symbol=f"E{i}",
+                    symbol_native=f"E{i}",
+                    kind=Currency.CRYPTO,
+                )
+                for i in range(20)
+            ]
+        )
+
+        # Invalidate currency registry
+        currency_registry.invalidate()
+
+        # Serialize all currencies with the same number of queries
+        with self.assertNumQueries(len(context.captured_queries)):
+            CurrencySerializer(Currency.objects.all(), many=True).data
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST WITH COUNTRY                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_with_country(self):
+        """ with_country joins country, and deferring country still works """
+
+        # Read emojis of all currencies in a single query
+        with self.assertNumQueries(1):
+            [currency.emoji for currency in Currency.objects.with_country()]
+
+        # Defer country on the default manager
+        with self.assertNumQueries(1):
+            list(Currency.objects.defer("country"))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY CONVERTER TEST CASE                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencyConverterTestCase(SimpleTestCase):
+    """ Tests conversion through direct, inverse, and cross rates """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Builds a converter with USD (1) as base, EUR (2), THB (3), and JPY (5) """
+
+        # Build converter, where JPY has no rate and 4 is not a currency
+        self.converter = CurrencyConverter(
+            [(1, 2, "0.5"), (1, 3, 35), (5, 5, 1)], base_id=1
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST RATES                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_rates(self):
+        """ Direct, inverse, identity, and cross rates are filled """
+
+        # Get rates
+        rates = self.converter.get_rates([1, 2, 2, 3, 2], [2, 1, 2, 2, 3])
+
+        # Check direct, inverse, identity, and cross rates through USD
+        np.testing.assert_allclose(rates, [0.5, 2, 1, 1 / 70, 70])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST CONVERT                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_convert(self):
+        """ Amounts are converted with scalar or array currency IDs """
+
+        # Check conversion with scalar currency IDs
+        np.testing.assert_allclose(self.converter.convert([1, 2.5], 2, 3), [70, 175])
+
+        # Check conversion with an array of source currency IDs
+        np.testing.assert_allclose(
+            self.converter.convert([1, 1, 1], [1, 2, 3], 1), [1, 2, 1 / 35]
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST CONVERT MILLION AMOUNTS                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_convert_million_amounts(self):
+        """ A million amounts match a per-amount conversion """
+
+        # Generate random amounts and currency pairs
+        rng = np.random.default_rng(0)
+        amounts = rng.uniform(0, 1000, 1_000_000)
+        from_ids = rng.choice([1, 2, 3], 1_000_000)
+        to_ids = rng.choice([1, 2, 3], 1_000_000)
+
+        # Convert amounts
+        converted = self.converter.convert(amounts, from_ids, to_ids)
+
+        # Check a sample against a per-amount conversion
+        for i in rng.integers(0, 1_000_000, 100):
+            self.assertAlmostEqual(
+                converted[i],
+                amounts[i] * float(self.converter.get_rates(from_ids[i], to_ids[i])),
+            )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST UNKNOWN CURRENCIES                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_unknown_currencies(self):
+        """ Unknown currency IDs and missing pairs raise a ValueError """
+
+        # Iterate over IDs that are not in the converter
+        for currency_id in (4, 6, 1000, -1):
+
+            # Check that conversion raises a value error
+            with self.assertRaisesRegex(ValueError, "Unknown currency IDs"):
+                self.converter.convert([1, 1], [1, currency_id], 2)
+
+        # Check that a pair with no path through the base raises a value error
+        with self.assertRaisesRegex(ValueError, "No exchange rate"):
+            self.converter.convert(1, 5, 1)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST EMPTY CONVERTER                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_empty_converter(self):
+        """ An empty converter raises a ValueError for any currency """
+
+        # Check that conversion raises a value error
+        with self.assertRaisesRegex(ValueError, "Unknown currency IDs"):
+            CurrencyConverter([]).convert(1, 1, 2)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST BENCHMARK COMMAND                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_benchmark_command(self):
+        """ The benchmark command converts amounts and reports its timings """
+
+        # Call command
+        stdout = StringIO()
+        call_command("benchmark_converter", amounts=1000, currencies=10, stdout=stdout)
+
+        # Check output
+        self.assertIn(
+            "Converted 1,000 amounts between 10 currencies", stdout.getvalue()
+        )
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CURRENCY CONVERTER FROM DB TEST CASE                                               │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CurrencyConverterFromDBTestCase(TestCase):
+    """ Tests building a converter from ExchangeRate objects """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP TEST DATA                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Creates currencies with rates against a base currency """
+
+        # Create currencies
+        cls.currencies = [
+            Currency.objects.create(
+                name=f"Test Currency {i}",
+                slug=f"test-currency-{i}",
+                code=f"XT{i}",
+                number=9900 + i,
+                symbol=f"T{i}",
+                kind=Currency.FIAT,
+            )
+            for i in range(3)
+        ]
+
+        # Create rates of the base currency
+        base, *quotes = cls.currencies
+        for quote, rate in zip(quotes, ("4", "0.25")):
+            ExchangeRate.objects.create(base=base, quote=quote, rate=rate)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST FROM DB                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_from_db(self):
+        """ Rates are loaded in one query and cross rates go through the base """
+
+        # Build converter
+        with self.assertNumQueries(2):
+            converter = CurrencyConverter.from_db(base_code="XT0")
+
+        # Check cross rate
+        _, first, second = self.currencies
+        np.testing.assert_allclose(converter.convert(8, first.id, second.id), 0.5)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST UNKNOWN BASE CODE                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_unknown_base_code(self):
+        """ An unknown base currency code raises a ValueError """
+
+        # Check that building the converter raises a value error
+        with self.assertRaisesRegex(ValueError, "Unknown base currency code"):
+            CurrencyConverter.from_db(base_code="XXX")
@@ -0,0 +1,125 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import time
+
+from threading import Lock
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TOKEN BUCKET                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that paces calls to a steady rate
+
+    Reservations may overdraw the bucket, so concurrent callers are queued one
+    interval apart instead of all retrying at once
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, rate, capacity=None):
+        """ Initializes a bucket of rate tokens per second up to capacity tokens """
+
+        # Set rate and capacity
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1, rate))
+
+        # Initialize a full bucket
+        self._tokens = self.capacity
+        self._timestamp = time.monotonic()
+        self._lock = Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESERVE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def reserve(self, tokens=1):
+        """ Takes tokens and returns the number of seconds to wait before using them """
+
+        # Acquire lock
+        with self._lock:
+
+            # Get current time
+            now = time.monotonic()
+
+            # Refill tokens for the elapsed time and take the requested tokens
+            self._tokens = (
+                min(self.capacity, self._tokens + (now - self._timestamp) * self.rate)
+                - tokens
+            )
+            self._timestamp = now
+
+            # Return wait time of any overdrawn tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ACQUIRE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def acquire(self, tokens=1):
+        """ Blocks until tokens are available """
+
+        # Sleep for the reserved wait time
+        time.sleep(self.reserve(tokens))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ REDIS TOKEN BUCKET                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class RedisTokenBucket(TokenBucket):
+    """ A token bucket stored in Redis and shared across processes """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define the Lua script that refills and takes tokens atomically
+    script = """
+    redis.replicate_commands()
+    local rate = tonumber(ARGV[1])
+    local capacity = tonumber(ARGV[2])
+    local time = redis.call("TIME")
+    local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+    local state = redis.call("HMGET", KEYS[1], "tokens", "timestamp")
+    local tokens = tonumber(state[1]) or capacity
+    local timestamp = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - timestamp) * rate)
+    tokens = tokens - tonumber(ARGV[3])
+    redis.call("HSET", KEYS[1], "tokens", tokens, "timestamp", now)
+    redis.call("EXPIRE", KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+    return tostring(math.max(0, -tokens / rate))
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, client, key, rate, capacity=None):
+        """ Initializes a bucket stored under a Redis key """
+
+        # Call parent init method
+        super().__init__(rate, capacity)
+
+        # Set key and register script
+        self.key = key
+        self._script = client.register_script(self.script)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESERVE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def reserve(self, tokens=1):
+        """ Takes tokens and returns the number of seconds to wait before using them """
+
+        return float(
+            self._script(keys=[self.key], args=[self.rate, self.capacity, tokens])
+        )
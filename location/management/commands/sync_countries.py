@@ -0,0 +1,192 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import os
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.location.models import Country, Region, Subregion
+from beutils.syncers import sync_objects
+from beutils.tools import read_json, slugify
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ FIXTURE DIRECTORY                                                                  │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Define fixture directory
+FIXTURE_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "fixtures",
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ COMMAND                                                                            │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class Command(BaseCommand):
+    """ Synchronizes Region, Subregion, and Country objects with the fixtures """
+
+    # Define help text
+    help = "Synchronizes regions, subregions, and countries with the country fixture"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD ARGUMENTS                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_arguments(self, parser):
+        """ Adds command line arguments """
+
+        # Add prune argument
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete countries that are no longer in the fixture",
+        )
+
+        # Add dry run argument
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changeset without applying it, by rolling it back",
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ HANDLE                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def handle(self, *args, **options):
+        """ Computes and applies the country changeset in a single transaction """
+
+        # Get dry run and prune
+        dry_run = options["dry_run"]
+        prune = options["prune"]
+
+        # Read country fixture file
+        countries = read_json(os.path.join(FIXTURE_DIRECTORY, "countries.json")) or []
+
+        # Initialize changesets
+        changesets = {}
+
+        # Apply changes in a single transaction, which a dry run rolls back so that
+        # countries are diffed against the IDs of new regions and subregions, and
+        # pruning reports the countries that protected objects would block
+        with transaction.atomic():
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ REGIONS                                                                │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Sync regions keyed by name, keeping existing emojis
+            changesets["regions"] = sync_objects(
+                Region.objects.all(),
+                [
+                    {"name": name, "slug": slugify(name)}
+                    for name in sorted({c["region"] for c in countries}, key=slugify)
+                ],
+                key="name",
+            )
+
+            # Map regions by name
+            regions = dict(Region.objects.values_list("name", "id"))
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ SUBREGIONS                                                             │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Sync subregions keyed by name
+            changesets["subregions"] = sync_objects(
+                Subregion.objects.all(),
+                [
+                    {
+                        "name": name,
+                        "slug": slugify(name),
+                        "region_id": regions.get(region),
+                    }
+                    for name, region in sorted(
+                        {(c["subregion"], c["region"]) for c in countries},
+                        key=lambda x: slugify(x[0]),
+                    )
+                ],
+                key="name",
+            )
+
+            # Map subregions by name
+            subregions = dict(Subregion.objects.values_list("name", "id"))
+
+            # ┌────────────────────────────────────────────────────────────────────────┐
+            # │ COUNTRIES                                                              │
+            # └────────────────────────────────────────────────────────────────────────┘
+
+            # Sync countries keyed by ISO3 code
+            changesets["countries"] = sync_objects(
+                Country.objects.all(),
+                [
+                    {
+                        "region_id": regions.get(country["region"]),
+                        "subregion_id": subregions.get(country["subregion"]),
+                        "name": country["name"],
+                        "slug": slugify(country["name"]),
+                        "name_official": country["name_official"],
+                        "slug_official": slugify(country["name_official"]),
+                        "name_native": country["name_native"],
+                        "iso2": country["iso2"].upper(),
+                        "iso3": country["iso3"].upper(),
+                        "phone_codes": country["phone_codes"],
+                        "demonym": country["demonym"],
+                        "is_nationality": country["is_nationality"],
+                        "emoji": country["emoji"],
+                        "emoji_u": country["emoji_u"],
+                    }
+                    for country in sorted(countries, key=lambda x: slugify(x["name"]))
+                ],
+                key="iso3",
+                prune=prune,
+            )
+
+            # Check if the currency app, whose registry copies country emojis, is used
+            if apps.is_installed("beutils.currency"):
+
+                # Import currency registry
+                from beutils.currency.registry import currency_registry
+
+                # Invalidate currency registry on commit since bulk writes skip signals
+                transaction.on_commit(currency_registry.invalidate)
+
+            # Roll back changes if dry run
+            if dry_run:
+                transaction.set_rollback(True)
+
+        # ┌────────────────────────────────────────────────────────────────────────────┐
+        # │ REPORT                                                                     │
+        # └────────────────────────────────────────────────────────────────────────────┘
+
+        # Iterate over changesets
+        for label, changeset in changesets.items():
+
+            # Iterate over changeset
+            for action, keys in changeset.items():
+
+                # Write action summary
+                self.stdout.write(
+                    f"{label.title()} {action}: {len(keys)}"
+                    + (f" ({', '.join(keys)})" if keys else "")
+                )
+
+        # Write success message
+        self.stdout.write(
+            self.style.SUCCESS("Dry run complete" if dry_run else "Countries synced")
+        )
@@ -0,0 +1,134 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from io import StringIO
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.core.management import call_command
+from django.test import TestCase
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.currency.models import Currency
+from beutils.location.models import Country, Region
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SYNC COUNTRIES TEST CASE                                                           │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class SyncCountriesTestCase(TestCase):
+    """ Tests the dry run and prune options of the sync_countries command """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP TEST DATA                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Syncs countries, renames a region, and adds countries that are not in the
+        fixture, one of which a currency protects
+        """
+
+        # Sync countries
+        call_command("sync_countries", stdout=StringIO())
+
+        # Rename a region so that syncing creates it again
+        Region.objects.filter(name="Oceania").update(name="Oceanica", slug="oceanica")
+
+        # Get a synced country to copy the region and subregion of
+        country = Country.objects.get(iso3="FRA")
+
+        # Iterate over countries that are not in the fixture
+        for code in ("XXA", "XXB"):
+
+            # Create country
+            Country.objects.create(
+                region_id=country.region_id,
+                subregion_id=country.subregion_id,
+                name=f"Test Country {code}",
+                slug=f"test-country-{code.lower()}",
+                name_official=f"Test Country {code}",
+                slug_official=f"test-country-{code.lower()}",
+                name_native=f"Test Country {code}",
+                iso2=code[1:],
+                iso3=code,
+                demonym="Tester",
+                is_nationality=True,
+                emoji="🏳",
+                emoji_u="U+1F3F3",
+            )
+
+        # Create a currency that protects a country from deletion
+        Currency.objects.create(
+            country=Country.objects.get(iso3="XXA"),
+            name="Test Currency",
+            slug="test-currency",
+            name_plural="Test Currencies",
+            code="XTA",
+            number=9700,
+            symbol="T",
+            symbol_native="T",
+            kind=Currency.FIAT,
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SYNC                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def sync(self, **options):
+        """ Calls sync_countries with pruning and returns its output lines """
+
+        # Call command
+        stdout = StringIO()
+        call_command("sync_countries", prune=True, stdout=stdout, **options)
+
+        # Return output lines
+        return stdout.getvalue().splitlines()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST DRY RUN                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_dry_run(self):
+        """ A dry run reports the changeset of a sync and changes nothing """
+
+        # Sync countries in a dry run and then for real
+        dry_run = self.sync(dry_run=True)
+        self.assertFalse(Region.objects.filter(name="Oceania").exists())
+        self.assertTrue(Country.objects.filter(iso3="XXB").exists())
+        sync = self.sync()
+
+        # Check that both runs report the same changeset
+        self.assertEqual(dry_run[:-1], sync[:-1])
+        self.assertIn("Regions created: 1 (Oceania)", sync)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST PRUNE PROTECTED                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_prune_protected(self):
+        """ Pruning deletes unprotected countries and reports protected ones """
+
+        # Sync countries
+        output = self.sync()
+
+        # Check that the protected country was kept and reported
+        self.assertIn("Countries deleted: 1 (XXB)", output)
+        self.assertIn("Countries blocked: 1 (XXA)", output)
+        self.assertEqual(
+            list(
+                Country.objects.filter(iso3__in=["XXA", "XXB"]).values_list(
+                    "iso3", flat=True
+                )
+            ),
+            ["XXA"],
+        )
@@ -0,0 +1,231 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import logging
+
+from collections import Counter, deque, namedtuple
+from threading import Lock
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ REQUEST METRIC                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Define the metric of a single adapter request, where elapsed is in seconds
+RequestMetric = namedtuple(
+    "RequestMetric",
+    [
+        "adapter",
+        "method",
+        "endpoint",
+        "status_code",
+        "elapsed",
+        "bytes",
+        "retries",
+        "error",
+    ],
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ LOGGING METRICS HOOK                                                               │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class LoggingMetricsHook:
+    """ A metrics hook that logs each request, with errors at warning level """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, logger=None, level=logging.INFO):
+        """ Custom Init Method """
+
+        # Set logger and level
+        self.logger = logger or logging.getLogger("beutils.metrics")
+        self.level = level
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, metric):
+        """ Logs a request metric """
+
+        # Log metric
+        self.logger.log(
+            logging.WARNING if metric.error else self.level,
+            "%s %s %s %s %.1fms %sB retries=%s%s",
+            metric.adapter,
+            metric.method,
+            metric.endpoint,
+            metric.status_code,
+            metric.elapsed * 1000,
+            metric.bytes,
+            metric.retries,
+            f" error={metric.error}" if metric.error else "",
+        )
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ STATSD METRICS HOOK                                                                │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class StatsdMetricsHook:
+    """
+    A metrics hook that sends statsd-style timers and counters
+
+    The client only needs timing(name, ms) and incr(name, count) methods, e.g. a
+    statsd.StatsClient or datadog.statsd
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, client, prefix="beutils.adapters"):
+        """ Custom Init Method """
+
+        # Set client and prefix
+        self.client = client
+        self.prefix = prefix
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, metric):
+        """ Sends a request metric """
+
+        # Get metric name, e.g. beutils.adapters.MyAdapter.prices_latest
+        endpoint = (
+            (metric.endpoint or "").strip("/").replace("/", "_").replace(".", "_")
+        )
+        name = f"{self.prefix}.{metric.adapter}.{endpoint or 'root'}"
+
+        # Send timer and counters
+        self.client.timing(f"{name}.elapsed", metric.elapsed * 1000)
+        self.client.incr(f"{name}.status.{metric.status_code or 'error'}")
+
+        # Check if request was retried
+        if metric.retries:
+            self.client.incr(f"{name}.retries", metric.retries)
+
+        # Check if response size is known
+        if metric.bytes:
+            self.client.incr(f"{name}.bytes", metric.bytes)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ HISTOGRAM METRICS HOOK                                                             │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class HistogramMetricsHook:
+    """ A thread-safe metrics hook that aggregates requests in process """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, max_samples=10000):
+        """ Custom Init Method """
+
+        # Set max latency samples per key
+        self.max_samples = max_samples
+
+        # Initialize stats and lock
+        self._lock = Lock()
+        self.reset()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, metric):
+        """ Adds a request metric """
+
+        # Get key
+        key = (metric.adapter, metric.method, metric.endpoint)
+
+        # Acquire lock
+        with self._lock:
+
+            # Get stats, creating them on first use
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    "latencies": deque(maxlen=self.max_samples),
+                    "statuses": Counter(),
+                    "count": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "bytes": 0,
+                }
+
+            # Update stats
+            stats["latencies"].append(metric.elapsed)
+            stats["statuses"][metric.status_code] += 1
+            stats["count"] += 1
+            stats["errors"] += bool(metric.error)
+            stats["retries"] += metric.retries or 0
+            stats["bytes"] += metric.bytes or 0
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SUMMARY                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def summary(self):
+        """
+        Returns aggregated stats by (adapter, method, endpoint)
+
+        Latencies are in seconds and percentiles are over the most recent samples
+        """
+
+        # Acquire lock
+        with self._lock:
+
+            # Copy stats
+            stats = {
+                key: dict(
+                    s, latencies=sorted(s["latencies"]), statuses=dict(s["statuses"])
+                )
+                for key, s in self._stats.items()
+            }
+
+        # Define a function that returns a nearest-rank percentile
+        def percentile(latencies, p):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+        # Return summary
+        return {
+            key: {
+                "count": s["count"],
+                "errors": s["errors"],
+                "retries": s["retries"],
+                "bytes": s["bytes"],
+                "statuses": s["statuses"],
+                "mean": sum(s["latencies"]) / len(s["latencies"]),
+                "p50": percentile(s["latencies"], 0.5),
+                "p95": percentile(s["latencies"], 0.95),
+                "p99": percentile(s["latencies"], 0.99),
+                "max": s["latencies"][-1],
+            }
+            for key, s in stats.items()
+        }
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESET                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def reset(self):
+        """ Clears all stats """
+
+        # Acquire lock
+        with self._lock:
+
+            # Clear stats
+            self._stats = {}
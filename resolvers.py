@@ -0,0 +1,259 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import time
+
+from collections import OrderedDict
+from threading import Lock
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TELEGRAM USER RESOLVER                                                             │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TelegramUserResolver:
+    """
+    A cached resolver of Telegram IDs to the pks of a TelegramUserModelMixin model
+
+    Resolved IDs, including IDs with no user, are kept in a bounded LRU for up to ttl
+    seconds and are invalidated when a user is saved or deleted in this process
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(
+        self, model=None, field="telegram_user_id", max_entries=10000, ttl=300
+    ):
+        """ Custom Init Method, where model defaults to the user model """
+
+        # Set model, field, max entries, and TTL
+        self._model = model
+        self.field = field
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        # Initialize LRU of Telegram ID to (pk, expires at), IDs by pk, and lock
+        self._entries = OrderedDict()
+        self._ids_by_pk = {}
+        self._lock = Lock()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ MODEL                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def model(self):
+        """ Returns the model, connecting invalidation signals on first use """
+
+        # Check if model has not been set up
+        if not getattr(self, "_connected", False):
+
+            # Default model to the user model
+            self._model = self._model or get_user_model()
+
+            # Connect invalidation signals
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    self.on_change,
+                    sender=self._model,
+                    weak=False,
+                    dispatch_uid=f"telegram_user_resolver:{id(self)}",
+                )
+
+            # Mark model as set up
+            self._connected = True
+
+        # Return model
+        return self._model
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESOLVE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def resolve(self, telegram_id):
+        """ Returns the pk of a Telegram ID or None if there is no such user """
+
+        return self.resolve_many([telegram_id]).get(telegram_id)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESOLVE MANY                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def resolve_many(self, telegram_ids):
+        """
+        Returns a dict of Telegram ID to pk, where unknown IDs map to None
+
+        IDs missing from the cache are resolved in a single query
+        """
+
+        # Initialize pks and misses
+        pks = {}
+        misses = set()
+
+        # Get current time
+        now = time.monotonic()
+
+        # Acquire lock
+        with self._lock:
+
+            # Iterate over Telegram IDs
+            for telegram_id in telegram_ids:
+
+                # Skip empty IDs
+                if telegram_id is None:
+                    continue
+
+                # Get entry
+                entry = self._entries.get(telegram_id)
+
+                # Check if entry is missing or expired
+                if entry is None or entry[1] < now:
+                    misses.add(telegram_id)
+                    continue
+
+                # Mark entry as most recently used and set pk
+                self._entries.move_to_end(telegram_id)
+                pks[telegram_id] = entry[0]
+
+        # Return pks if everything was cached
+        if not misses:
+            return pks
+
+        # Get pks of misses in a single query, defaulting to None
+        resolved = dict.fromkeys(misses)
+        resolved.update(
+            self.model._default_manager.filter(
+                **{f"{self.field}__in": misses}
+            ).values_list(self.field, "pk")
+        )
+
+        # Acquire lock
+        with self._lock:
+
+            # Iterate over resolved pks
+            for telegram_id, pk in resolved.items():
+
+                # Cache pk
+                self._entries[telegram_id] = (pk, now + self.ttl)
+                self._entries.move_to_end(telegram_id)
+                self._ids_by_pk.setdefault(pk, set()).add(telegram_id)
+
+            # Evict least recently used entries
+            while len(self._entries) > self.max_entries:
+                telegram_id, (pk, _) = self._entries.popitem(last=False)
+                self._ids_by_pk.get(pk, set()).discard(telegram_id)
+
+        # Return pks
+        pks.update(resolved)
+        return pks
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESOLVE UPDATES                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def resolve_updates(self, updates):
+        """
+        Returns a dict of Telegram ID to pk of every user referenced in updates
+
+        Updates may be python-telegram-bot Update objects or webhook data dicts
+        """
+
+        return self.resolve_many({self.get_telegram_id(update) for update in updates})
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET TELEGRAM ID                                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_telegram_id(self, update):
+        """ Returns the Telegram user or chat ID of an update, matching the field """
+
+        # Check if resolving chats
+        is_chat = self.field == "telegram_chat_id"
+
+        # Check if update is a python-telegram-bot Update
+        if hasattr(update, "effective_user"):
+
+            # Get chat or user
+            entity = update.effective_chat if is_chat else update.effective_user
+
+            # Return ID
+            return entity.id if entity else None
+
+        # Iterate over the payloads of webhook data, e.g. message or callback_query
+        for value in update.values():
+
+            # Skip the update ID
+            if not isinstance(value, dict):
+                continue
+
+            # Get chat of the payload or of its message
+            if is_chat:
+                entity = value.get("chat") or (value.get("message") or {}).get("chat")
+
+            # Otherwise get sender of the payload
+            else:
+                entity = value.get("from") or value.get("user")
+
+            # Return ID
+            return entity["id"] if entity else None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INVALIDATE                                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def invalidate(self, pk=None):
+        """ Removes the cached Telegram IDs of a pk, or all entries if pk is None """
+
+        # Acquire lock
+        with self._lock:
+
+            # Check if all entries should be removed
+            if pk is None:
+                self._entries.clear()
+                self._ids_by_pk.clear()
+                return
+
+            # Remove entries of pk
+            for telegram_id in self._ids_by_pk.pop(pk, ()):
+                self._entries.pop(telegram_id, None)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ON CHANGE                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def on_change(self, sender, instance, **kwargs):
+        """ Invalidates a saved or deleted user now and once the transaction commits """
+
+        # Get Telegram ID and pk
+        telegram_id, pk = getattr(instance, self.field), instance.pk
+
+        # Define a function that removes the old and new Telegram IDs of the user
+        def invalidate():
+            self.invalidate(pk)
+            with self._lock:
+                self._entries.pop(telegram_id, None)
+
+        # Invalidate now and on commit, in case another thread cached the old row
+        invalidate()
+        transaction.on_commit(invalidate)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ RESOLVER INSTANCES                                                                 │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Initialize resolvers of the user model by Telegram user and chat ID
+telegram_user_resolver = TelegramUserResolver(field="telegram_user_id")
+telegram_chat_resolver = TelegramUserResolver(field="telegram_chat_id")
@@ -0,0 +1,170 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.db import transaction
+from django.db.models import ProtectedError
+from django.utils import timezone
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ SYNC OBJECTS                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def sync_objects(
+    queryset, records, key, fields=None, prune=False, dry_run=False, batch_size=500
+):
+    """
+    Synchronizes the objects of a queryset against a list of record dicts
+
+    Records are matched to existing objects by a unique key field, e.g. "code" or
+    "iso3", and the resulting inserts, updates, and deletes are applied in bulk.
+    Existing objects are only deleted if prune is True, where objects that protected
+    objects still reference are kept.
+
+    Returns a changeset dict of the created, updated, and deleted keys, and of the
+    blocked keys of objects that could not be deleted if there are any
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET EXISTING OBJECTS                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Get model
+    Model = queryset.model
+
+    # Default fields to all record fields except for the key
+    fields = fields or sorted({f for record in records for f in record} - {key})
+
+    # Map existing objects by key in a single query
+    existing = {getattr(obj, key): obj for obj in queryset}
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COMPUTE DIFF                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Initialize objects to create and update
+    objs_to_create = []
+    objs_to_update = []
+
+    # Initialize changeset
+    changeset = {"created": [], "updated": [], "deleted": []}
+
+    # Iterate over records
+    for record in records:
+
+        # Get record key
+        record_key = record[key]
+
+        # Pop existing object so that only unmatched objects remain
+        obj = existing.pop(record_key, None)
+
+        # Check if object does not exist
+        if obj is None:
+
+            # Add new object to objects to create
+            objs_to_create.append(Model(**record))
+            changeset["created"].append(record_key)
+
+            # Continue
+            continue
+
+        # Get changed fields
+        changed = [f for f in fields if f in record and getattr(obj, f) != record[f]]
+
+        # Continue if nothing has changed
+        if not changed:
+            continue
+
+        # Iterate over changed fields
+        for field in changed:
+
+            # Update object field
+            setattr(obj, field, record[field])
+
+        # Add object to objects to update
+        objs_to_update.append(obj)
+        changeset["updated"].append(record_key)
+
+    # Get objects to delete
+    objs_to_delete = list(existing.values()) if prune else []
+    changeset["deleted"] = [getattr(obj, key) for obj in objs_to_delete]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ APPLY CHANGES                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Return changeset if dry run
+    if dry_run:
+        return changeset
+
+    # Check if there are objects to delete
+    if objs_to_delete:
+
+        # Bulk delete objects
+        try:
+            with transaction.atomic():
+                Model.objects.filter(pk__in=[obj.pk for obj in objs_to_delete]).delete()
+
+        # Otherwise delete objects one by one if any is protected, e.g. by a foreign
+        # key with on_delete=PROTECT, and report the blocked ones
+        except ProtectedError:
+
+            # Reset deleted keys and initialize blocked keys
+            changeset["deleted"] = []
+            changeset["blocked"] = []
+
+            # Iterate over objects to delete
+            for obj in objs_to_delete:
+
+                # Delete object
+                try:
+                    with transaction.atomic():
+                        obj.delete()
+
+                # Add key to blocked keys if object is protected
+                except ProtectedError:
+                    changeset["blocked"].append(getattr(obj, key))
+
+                # Otherwise add key to deleted keys
+                else:
+                    changeset["deleted"].append(getattr(obj, key))
+
+    # Check if there are objects to update
+    if objs_to_update:
+
+        # Get concrete model field names and attnames, e.g. country and country_id
+        model_fields = {
+            name for f in Model._meta.concrete_fields for name in (f.name, f.attname)
+        }
+
+        # Initialize update fields
+        update_fields = [f for f in fields if f in model_fields]
+
+        # Check if model has an updated at field, which bulk update does not set
+        if "updated_at" in model_fields:
+
+            # Get current time
+            now = timezone.now()
+
+            # Iterate over objects to update
+            for obj in objs_to_update:
+
+                # Set updated at
+                obj.updated_at = now
+
+            # Add updated at to update fields
+            update_fields.append("updated_at")
+
+        # Bulk update objects
+        Model.objects.bulk_update(objs_to_update, update_fields, batch_size=batch_size)
+
+    # Check if there are objects to create
+    if objs_to_create:
+
+        # Bulk create objects
+        Model.objects.bulk_create(objs_to_create, batch_size=batch_size)
+
+    # Return changeset
+    return changeset
@@ -2,20 +2,35 @@
 # │ GENERAL IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
+import atexit
+import cProfile
+import hashlib
+import io
 import logging
+import pstats
+import random
+import time
+import tracemalloc
 from celery import Task
+from celery.utils import uuid
+from collections import deque, namedtuple
+from contextlib import ExitStack
+from kombu.utils.json import dumps
+from threading import Lock, local, Timer
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ DJANGO IMPORTS                                                                     │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 from django.conf import settings
-from django.db import transaction
+from django.db import connections, transaction
+from django.utils.module_loading import import_string
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ PROJECT IMPORTS                                                                    │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
+from beutils.tools import get_redis
 from config.celery import app
 
 
@@ -52,25 +67,162 @@ class LoggedTaskHandler(Task):
 class OnCommitTaskHandler(Task):
     """ An on-commit enabled TaskHandler """
 
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CLASS ATTRIBUTES                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    # Define whether identical calls within a transaction are dispatched once, where
+    # None falls back to settings.ENABLE_CELERY_DEDUPE_ON_COMMIT
+    dedupe_on_commit = None
+
+    # Define seconds within which identical calls across transactions are dropped
+    debounce_seconds = None
+
+    # Initialize pending dispatches of the current transaction by thread
+    _on_commit_local = local()
+
     # ┌────────────────────────────────────────────────────────────────────────────────┐
     # │ APPLY ASYNC                                                                    │
     # └────────────────────────────────────────────────────────────────────────────────┘
 
-    def apply_async(self, *args, **kwargs):
+    def apply_async(self, args=None, kwargs=None, task_id=None, **options):
         """
         Only executes tasks after transaction has been committed.
-        Unlike the default Celery task, this task does not return an async result.
+        Like the default Celery task, this task returns an AsyncResult right away,
+        whose task ID is generated up front and used when the task is sent on
+        commit. A deduplicated call returns the result of the pending call, and the
+        task of a rolled back or debounced call is never sent.
+        Calls are identical if the JSON serialization of their args, kwargs, and
+        options is, where calls that cannot be serialized as JSON and calls with their
+        own task_id, e.g. retries, are never deduplicated or debounced.
         See https://docs.djangoproject.com/en/2.1/topics/db/transactions/#performing-
         actions-after-commit
         See http://docs.celeryproject.org/en/latest/userguide/tasks.html#database-
         transactions
         """
 
+        # Get call key unless the call has its own task ID, whose result must have it
+        key = None if task_id else self.get_call_key(args, kwargs, options)
+
+        # Generate task ID and get its result
+        task_id = task_id or uuid()
+        result = self.AsyncResult(task_id)
+
+        # Define a function that dispatches the task
+        def dispatch():
+
+            # Return if an identical call was dispatched within the debounce window
+            if (
+                key
+                and self.debounce_seconds
+                and not get_redis().set(
+                    f"beutils:tasks:debounce:{hashlib.sha256(key.encode()).hexdigest()}",
+                    1,
+                    nx=True,
+                    ex=self.debounce_seconds,
+                )
+            ):
+                return
+
+            # Dispatch task with the generated task ID
+            super(OnCommitTaskHandler, self).apply_async(
+                args, kwargs, task_id=task_id, **options
+            )
+
+        # Get result of an identical call that is already pending in this transaction
+        pending_result = key and self.get_pending_on_commit(key, dispatch, result)
+
+        # Return pending result if there is one
+        if pending_result is not None:
+            return pending_result
+
         # Wrap method in an on commit handler
-        transaction.on_commit(
-            lambda: super(OnCommitTaskHandler, self).apply_async(*args, **kwargs)
+        transaction.on_commit(dispatch)
+
+        # Return result
+        return result
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET CALL KEY                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_call_key(self, args, kwargs, options):
+        """
+        Returns a stable key of a call's task, args, kwargs, and options, so that
+        calls with a different countdown, ETA, or queue are not identical, or None if
+        they cannot be serialized as JSON
+        """
+
+        # Serialize call as Celery's JSON serializer does, with sorted keys
+        try:
+            return dumps(
+                [self.name, list(args or ()), kwargs or {}, options], sort_keys=True
+            )
+
+        # Return None if call cannot be serialized
+        except TypeError:
+            return None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET PENDING ON COMMIT                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_pending_on_commit(self, key, dispatch, result):
+        """
+        Returns the result of a call key that already has a pending dispatch in the
+        current transaction, and otherwise records dispatch as pending and returns
+        None
+        """
+
+        # Get dedupe on commit
+        dedupe_on_commit = (
+            getattr(settings, "ENABLE_CELERY_DEDUPE_ON_COMMIT", False)
+            if self.dedupe_on_commit is None
+            else self.dedupe_on_commit
         )
 
+        # Get default database connection
+        connection = transaction.get_connection()
+
+        # Return None if not deduping or outside a transaction, i.e. sent right away
+        if not dedupe_on_commit or not connection.in_atomic_block:
+            return None
+
+        # Get thread local, whose pending dispatches belong to an on-commit list
+        local = self._on_commit_local
+
+        # Check if the on-commit list has been replaced, which Django does on every
+        # commit, rollback, and savepoint rollback
+        if getattr(local, "run_on_commit", None) is not connection.run_on_commit:
+
+            # Get functions that are still registered, once per replacement rather
+            # than per call, where the function is the second item of each entry,
+            # i.e. (sids, func) or (sids, func, robust) in Django 4.2+
+            registered = {id(entry[1]) for entry in connection.run_on_commit}
+
+            # Keep pending dispatches that were not discarded
+            local.run_on_commit = connection.run_on_commit
+            local.pending = {
+                pending_key: (pending, pending_result)
+                for pending_key, (pending, pending_result) in getattr(
+                    local, "pending", {}
+                ).items()
+                if id(pending) in registered
+            }
+
+        # Get pending dispatch and result
+        pending, pending_result = local.pending.get(key, (None, None))
+
+        # Return pending result if there is a pending dispatch
+        if pending:
+            return pending_result
+
+        # Record dispatch and result as pending
+        local.pending[key] = (dispatch, result)
+
+        # Return None
+        return None
+
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ LOGGED ON-COMMIT TASK HANDLER                                                      │
@@ -82,33 +234,623 @@ class LoggedOnCommitTaskHandler(LoggedTaskHandler, OnCommitTaskHandler):
 
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
-# │ BACKGROUND TASK                                                                    │
+# │ TASK METRIC                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Define the metrics of a single task run, with times in seconds and memory in bytes
+TaskMetric = namedtuple(
+    "TaskMetric",
+    ["name", "task_id", "runtime", "queue_wait", "queries", "peak_memory", "failed"],
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TASK METRICS REGISTRY                                                              │
 # └────────────────────────────────────────────────────────────────────────────────────┘
 
 
-def background_task(func, *args, **kwargs):
-    """ A custom decorator for Celery background tasks """
+class TaskMetricsRegistry:
+    """ A thread-safe registry that aggregates task metrics in process """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, max_samples=10000, max_profiles=20):
+        """ Custom Init Method """
+
+        # Set max runtime samples per task and max kept profiles
+        self.max_samples = max_samples
+        self.max_profiles = max_profiles
+
+        # Initialize stats and lock
+        self._lock = Lock()
+        self.reset()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record(self, metric, profile=None):
+        """ Adds a task metric and, if the run was profiled, its profile stats """
+
+        # Acquire lock
+        with self._lock:
+
+            # Get stats, creating them on first use
+            stats = self._stats.get(metric.name)
+            if stats is None:
+                stats = self._stats[metric.name] = {
+                    "runtimes": deque(maxlen=self.max_samples),
+                    "count": 0,
+                    "failures": 0,
+                    "queue_wait": 0.0,
+                    "queue_wait_count": 0,
+                    "queries": 0,
+                    "max_queries": 0,
+                    "peak_memory": 0,
+                }
+
+            # Update stats
+            stats["runtimes"].append(metric.runtime)
+            stats["count"] += 1
+            stats["failures"] += bool(metric.failed)
+            stats["queries"] += metric.queries
+            stats["max_queries"] = max(stats["max_queries"], metric.queries)
+            stats["peak_memory"] = max(stats["peak_memory"], metric.peak_memory or 0)
+
+            # Check if queue wait is known
+            if metric.queue_wait is not None:
+                stats["queue_wait"] += metric.queue_wait
+                stats["queue_wait_count"] += 1
+
+            # Keep profile
+            if profile:
+                self.profiles.append((metric, profile))
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SUMMARY                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def summary(self):
+        """
+        Returns aggregated stats by task name
+
+        Times are in seconds and runtime percentiles are over the most recent samples
+        """
+
+        # Acquire lock
+        with self._lock:
+
+            # Copy stats
+            stats = {
+                name: dict(s, runtimes=sorted(s["runtimes"]))
+                for name, s in self._stats.items()
+            }
+
+        # Define a function that returns a nearest-rank percentile
+        def percentile(runtimes, p):
+            return runtimes[min(len(runtimes) - 1, int(len(runtimes) * p))]
+
+        # Return summary
+        return {
+            name: {
+                "count": s["count"],
+                "failures": s["failures"],
+                "mean": sum(s["runtimes"]) / len(s["runtimes"]),
+                "p50": percentile(s["runtimes"], 0.5),
+                "p95": percentile(s["runtimes"], 0.95),
+                "p99": percentile(s["runtimes"], 0.99),
+                "max": s["runtimes"][-1],
+                "mean_queue_wait": (
+                    s["queue_wait"] / s["queue_wait_count"]
+                    if s["queue_wait_count"]
+                    else None
+                ),
+                "mean_queries": s["queries"] / s["count"],
+                "max_queries": s["max_queries"],
+                "peak_memory": s["peak_memory"],
+            }
+            for name, s in stats.items()
+        }
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RESET                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def reset(self):
+        """ Clears all stats and profiles """
+
+        # Acquire lock
+        with self._lock:
+
+            # Clear stats and profiles
+            self._stats = {}
+            self.profiles = deque(maxlen=self.max_profiles)
+
+
+# Initialize the default task metrics registry
+task_metrics = TaskMetricsRegistry()
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROFILED TASK HANDLER                                                              │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ProfiledTaskHandler(Task):
+    """
+    A TaskHandler that records runtime, queue wait, and DB queries
+
+    Peak memory is also recorded if trace_memory is set. Metrics are logged and added
+    to task_metrics. A profile_sample_rate share of runs is also run under cProfile,
+    and their stats are kept if the run took at least profile_threshold seconds.
+    """
+
+    # Initialize logger
+    metrics_logger = logging.getLogger("beutils.tasks")
+
+    # Define the registry that metrics are added to
+    metrics_registry = task_metrics
+
+    # Define whether to trace peak memory, which is off by default because tracing
+    # slows down every allocation in the process while the task runs
+    trace_memory = False
+
+    # Define the share of runs to profile and the min runtime to keep a profile
+    profile_sample_rate = 0.0
+    profile_threshold = 1.0
+
+    # Define the number of functions to keep in a profile, by cumulative time
+    profile_limit = 30
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ APPLY ASYNC                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def apply_async(self, args=None, kwargs=None, task_id=None, **options):
+        """ Sends a task with an enqueued_at header, used to measure queue wait """
+
+        # Set enqueued at header
+        options["headers"] = {
+            **(options.get("headers") or {}),
+            "enqueued_at": time.time(),
+        }
+
+        # Call parent apply async
+        return super().apply_async(args, kwargs, task_id=task_id, **options)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET QUEUE WAIT                                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_queue_wait(self):
+        """ Returns seconds between when the current task was sent and started """
+
+        # Get enqueued at, which Celery exposes on the request or in its headers
+        enqueued_at = getattr(self.request, "enqueued_at", None) or (
+            self.request.headers or {}
+        ).get("enqueued_at")
+
+        # Return queue wait
+        return max(0.0, time.time() - enqueued_at) if enqueued_at else None
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, *args, **kwargs):
+        """ Runs the task and records its metrics """
+
+        # Get queue wait
+        queue_wait = self.get_queue_wait()
+
+        # Initialize query count
+        queries = 0
+
+        # Define a database execute wrapper that counts queries
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        # Start tracing memory unless it is already traced, e.g. by another task
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        # Get memory traced before the task
+        memory_before = tracemalloc.get_traced_memory()[0] if started_tracing else 0
+
+        # Initialize profiler for a sample of runs
+        profiler = None
+        if self.profile_sample_rate and random.random() < self.profile_sample_rate:
+            profiler = cProfile.Profile()
+
+        # Initialize failed
+        failed = True
+
+        # Get start time
+        start = time.perf_counter()
+
+        # Run task
+        try:
+            with ExitStack() as stack:
+
+                # Count queries on every database connection
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_queries))
+
+                # Run task, under the profiler if any
+                result = (
+                    profiler.runcall(super().__call__, *args, **kwargs)
+                    if profiler
+                    else super().__call__(*args, **kwargs)
+                )
+
+            # Set failed
+            failed = False
+
+            # Return result
+            return result
+
+        # Record metrics
+        finally:
+
+            # Get runtime
+            runtime = time.perf_counter() - start
+
+            # Get peak memory and stop tracing, only if this task started it
+            peak_memory = None
+            if started_tracing:
+                peak_memory = tracemalloc.get_traced_memory()[1] - memory_before
+                tracemalloc.stop()
+
+            # Initialize metric
+            metric = TaskMetric(
+                self.name,
+                self.request.id,
+                runtime,
+                queue_wait,
+                queries,
+                peak_memory,
+                failed,
+            )
+
+            # Get profile stats if the run was profiled and slow
+            profile = None
+            if profiler and runtime >= self.profile_threshold:
+                stream = io.StringIO()
+                pstats.Stats(profiler, stream=stream).sort_stats(
+                    "cumulative"
+                ).print_stats(self.profile_limit)
+                profile = stream.getvalue()
+
+            # Record metric
+            self.record_metric(metric, profile)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ RECORD METRIC                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def record_metric(self, metric, profile=None):
+        """ Logs a task metric and adds it to the metrics registry """
+
+        # Log metric
+        self.metrics_logger.info(
+            "%s %s %.1fms wait=%s queries=%s memory=%sB%s",
+            metric.name,
+            metric.task_id,
+            metric.runtime * 1000,
+            "-" if metric.queue_wait is None else f"{metric.queue_wait * 1000:.1f}ms",
+            metric.queries,
+            "-" if metric.peak_memory is None else metric.peak_memory,
+            " failed" if metric.failed else "",
+        )
+
+        # Log profile
+        if profile:
+            self.metrics_logger.info("Slow task profile %s\n%s", metric.name, profile)
+
+        # Add metric to registry
+        self.metrics_registry.record(metric, profile)
+
 
-    # Handle case of Celery on-commit
-    if settings.ENABLE_CELERY_ON_COMMIT:
-        task_handler = (
-            LoggedOnCommitTaskHandler
-            if settings.ENABLE_CELERY_LOGGING
-            else OnCommitTaskHandler
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GET TASK HANDLER                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Initialize composed task handlers by (logging, on-commit, profiling)
+_task_handlers = {
+    (False, False, False): Task,
+    (True, False, False): LoggedTaskHandler,
+    (False, True, False): OnCommitTaskHandler,
+    (True, True, False): LoggedOnCommitTaskHandler,
+}
+
+
+def get_task_handler(logged=False, on_commit=False, profiled=False):
+    """
+    Returns a TaskHandler composed of the enabled logging, on-commit, and profiling
+    handlers
+
+    The profiling handler comes after the on-commit handler so that queue wait is
+    measured from when a task is sent on commit
+    """
+
+    # Get key
+    key = (bool(logged), bool(on_commit), bool(profiled))
+
+    # Check if task handler has not been composed
+    if key not in _task_handlers:
+
+        # Get bases
+        bases = [
+            base
+            for base, enabled in zip(
+                (LoggedTaskHandler, OnCommitTaskHandler, ProfiledTaskHandler), key
+            )
+            if enabled
+        ]
+
+        # Compose task handler, e.g. LoggedOnCommitProfiledTaskHandler
+        _task_handlers[key] = type(
+            "".join(base.__name__[: -len("TaskHandler")] for base in bases)
+            + "TaskHandler",
+            tuple(bases),
+            {"__doc__": " A composed TaskHandler "},
         )
 
-    # Otherwise handle case of enabled Celery logging
-    elif settings.ENABLE_CELERY_LOGGING:
-        task_handler = LoggedTaskHandler
+    # Return task handler
+    return _task_handlers[key]
+
 
-    # Otherwise use vanilla Celery task
-    else:
-        task_handler = Task
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BACKGROUND TASK                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def background_task(func=None, *args, **kwargs):
+    """
+    A custom decorator for Celery background tasks
+
+    Can be used as @background_task or with task options, e.g.
+    @background_task(queue="low")
+    """
+
+    # Return a decorator if task options were passed without a function
+    if func is None:
+        return lambda func: background_task(func, *args, **kwargs)
+
+    # Get task handler
+    task_handler = get_task_handler(
+        logged=settings.ENABLE_CELERY_LOGGING,
+        on_commit=settings.ENABLE_CELERY_ON_COMMIT,
+        profiled=getattr(settings, "ENABLE_CELERY_PROFILING", False),
+    )
 
     # Return async task
     return app.task(func, *args, base=task_handler, **kwargs)
 
 
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BATCHED TASK                                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class BatchedTask:
+    """
+    A wrapper of a background task that buffers calls and enqueues them in batches
+
+    Calls made with delay inside a transaction are buffered and enqueued once the
+    transaction commits, and are discarded if it rolls back. Calls made outside a
+    transaction are buffered for up to window seconds if a window is set, and are
+    otherwise enqueued right away. Each enqueued task receives a list of at most
+    max_batch_size (args, kwargs) pairs.
+    """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, task, max_batch_size=100, window=None):
+        """ Custom Init Method """
+
+        # Set task, max batch size, and window
+        self.task = task
+        self.max_batch_size = max_batch_size
+        self.window = window
+
+        # Initialize transaction batches by thread
+        self._local = local()
+
+        # Initialize window batch, timer, and lock
+        self._window_batch = []
+        self._window_timer = None
+        self._window_lock = Lock()
+
+        # Flush the window batch when the process exits
+        atexit.register(self.flush_window)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ CALL METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __call__(self, *args, **kwargs):
+        """ Runs the task function synchronously with a batch of one call """
+
+        return self.task([(args, kwargs)])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ DELAY                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def delay(self, *args, **kwargs):
+        """ Buffers a call to be enqueued as part of a batch """
+
+        # Get default database connection
+        connection = transaction.get_connection()
+
+        # Check if inside a transaction
+        if connection.in_atomic_block:
+
+            # Add call to the transaction batch
+            self.get_transaction_batch(connection).append((args, kwargs))
+
+        # Otherwise check if calls are buffered for a time window
+        elif self.window:
+
+            # Add call to the window batch
+            self.add_to_window((args, kwargs))
+
+        # Otherwise enqueue call right away
+        else:
+            self.enqueue([(args, kwargs)])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET TRANSACTION BATCH                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_transaction_batch(self, connection):
+        """
+        Returns the batch of the current transaction and savepoints
+
+        The on-commit list of the connection is replaced after every commit or
+        rollback, including savepoint rollbacks, so batches are kept across a
+        replacement only if their flush is still registered in the new list, and
+        batches are split by savepoint so that a savepoint rollback discards only
+        its calls
+        """
+
+        # Get batches of this thread, on-commit list, and key
+        batches = self._local.__dict__.setdefault("batches", {})
+        run_on_commit = connection.run_on_commit
+        key = tuple(connection.savepoint_ids)
+
+        # Check if the on-commit list was replaced since batches were added
+        if batches and next(iter(batches.values()))[0] is not run_on_commit:
+
+            # Get the functions that are still registered
+            registered = {id(entry[1]) for entry in run_on_commit}
+
+            # Keep the batches whose flush is still registered
+            batches = self._local.batches = {
+                k: (run_on_commit, batch, flush)
+                for k, (_, batch, flush) in batches.items()
+                if id(flush) in registered
+            }
+
+        # Return batch if there is one for the current savepoints
+        if key in batches:
+            return batches[key][1]
+
+        # Initialize batch
+        batch = []
+
+        # Define a function that enqueues the batch on commit
+        def flush():
+
+            # Stop adding calls to the batch
+            if self._local.batches.get(key, (None, None))[1] is batch:
+                del self._local.batches[key]
+
+            # Enqueue batch
+            self.enqueue(batch)
+
+        # Add batch and register flush on commit
+        batches[key] = (run_on_commit, batch, flush)
+        transaction.on_commit(flush)
+
+        # Return batch
+        return batch
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD TO WINDOW                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_to_window(self, call):
+        """ Adds a call to the window batch, flushing it when full """
+
+        # Acquire lock
+        with self._window_lock:
+
+            # Add call
+            self._window_batch.append(call)
+
+            # Check if batch is full
+            is_full = len(self._window_batch) >= self.max_batch_size
+
+            # Start timer if this is the first call of the window
+            if not is_full and self._window_timer is None:
+                self._window_timer = Timer(self.window, self.flush_window)
+                self._window_timer.daemon = True
+                self._window_timer.start()
+
+        # Flush window batch if full
+        if is_full:
+            self.flush_window()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ FLUSH WINDOW                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def flush_window(self):
+        """ Enqueues the window batch """
+
+        # Acquire lock
+        with self._window_lock:
+
+            # Take batch and cancel timer
+            batch, self._window_batch = self._window_batch, []
+            timer, self._window_timer = self._window_timer, None
+            if timer is not None:
+                timer.cancel()
+
+        # Enqueue batch
+        self.enqueue(batch)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ENQUEUE                                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def enqueue(self, batch):
+        """ Enqueues a batch of calls as tasks of at most max_batch_size calls """
+
+        # Iterate over chunks of the batch
+        for i in range(0, len(batch), self.max_batch_size):
+
+            # Enqueue chunk
+            self.task.delay(batch[i : i + self.max_batch_size])
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BATCHED TASK DECORATOR                                                             │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def batched_task(func=None, *args, max_batch_size=100, window=None, **kwargs):
+    """
+    A custom decorator for background tasks that receive batches of calls
+
+    The decorated function receives a list of (args, kwargs) pairs. For example,
+    each reindex.delay(pk) made in a transaction is buffered, and a function
+    decorated with @batched_task(max_batch_size=500) runs once per 500 calls
+    """
+
+    # Return a decorator if options were passed without a function
+    if func is None:
+        return lambda func: batched_task(
+            func, *args, max_batch_size=max_batch_size, window=window, **kwargs
+        )
+
+    # Return batched task
+    return BatchedTask(
+        background_task(func, *args, **kwargs),
+        max_batch_size=max_batch_size,
+        window=window,
+    )
+
+
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ PERIODIC TASK                                                                      │
 # └────────────────────────────────────────────────────────────────────────────────────┘
@@ -117,13 +859,36 @@ def background_task(func, *args, **kwargs):
 def periodic_task(func, *args, **kwargs):
     """ A custom decorator for periodic tasks """
 
-    # Handle case of enabled Celery logging
-    if settings.ENABLE_CELERY_LOGGING:
-        task_handler = LoggedTaskHandler
-
-    # Otherwise handle disabled logging
-    else:
-        task_handler = Task
+    # Get task handler
+    task_handler = get_task_handler(
+        logged=settings.ENABLE_CELERY_LOGGING,
+        profiled=getattr(settings, "ENABLE_CELERY_PROFILING", False),
+    )
 
     # Return the async task
     return app.task(func, *args, base=task_handler, **kwargs)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROCESS TELEGRAM UPDATES                                                           │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+@background_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def process_telegram_updates(bot_path, queue_key):
+    """
+    Processes the offloaded updates of a TelegramBot chat queue in order
+
+    The task is retried if processing an update raises, so that the update, which is
+    kept in the chat queue's processing list until it is processed, is retried
+    without waiting for the chat's next update
+
+    beutils is not a Django app, so Celery autodiscovery does not register this task
+    and workers must import beutils.tasks, e.g. CELERY_IMPORTS = ("beutils.tasks",)
+    """
+
+    # Get bot class
+    bot_class = import_string(bot_path)
+
+    # Drain update queue
+    bot_class.from_settings().drain_update_queue(queue_key)
@@ -0,0 +1,1906 @@
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GENERAL IMPORTS                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+import aiohttp
+import asyncio
+import fakeredis
+import json
+import sys
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Barrier, Thread, get_ident
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TELEGRAM IMPORTS                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from telegram import Bot, Update, User
+from telegram.ext import TypeHandler
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.db import connection, transaction
+from django.test import (
+    AsyncClient,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.urls import path
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BEUTIL IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from beutils.adapters import BaseAdapter, iter_json_array
+from beutils.async_adapters import AsyncBaseAdapter, gather_with_concurrency
+from beutils.async_bots import AsyncTelegramBot, TelegramAPIAdapter
+from beutils.bots import DedupeStore, TelegramBot
+from beutils.breakers import CircuitOpenError
+from beutils.model_mixins import TelegramUserModelMixin
+from beutils.resolvers import TelegramUserResolver
+from beutils.tasks import TaskMetricsRegistry, batched_task, get_task_handler
+from config.celery import app
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ FAKE TELEGRAM API                                                                  │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class FakeTelegramAPI:
+    """ A local fake of the Telegram Bot API that records method calls """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, rate_limited=0):
+        """ Custom Init Method, where rate_limited calls are answered with a 429 """
+
+        # Initialize calls and rate limited calls left
+        self.calls = []
+        self.rate_limited = rate_limited
+
+        # Initialize server
+        app = web.Application()
+        app.router.add_post("/bot{token}/{method}", self.handle)
+        self.server = TestServer(app)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ HANDLE                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def handle(self, request):
+        """ Answers a Bot API method call """
+
+        # Check if call should be rate limited
+        if self.rate_limited:
+
+            # Count rate limited call
+            self.rate_limited -= 1
+
+            # Return 429 response
+            return web.json_response(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": "Too Many Requests: retry after 0",
+                    "parameters": {"retry_after": 0},
+                },
+                status=429,
+            )
+
+        # Record call
+        params = await request.json()
+        self.calls.append((request.match_info["method"], params))
+
+        # Return result
+        return web.json_response(
+            {"ok": True, "result": {"message_id": len(self.calls), **params}}
+        )
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ECHO BOT                                                                           │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class EchoBot(AsyncTelegramBot):
+    """ A bot that echoes the text of each message """
+
+    # Define the secret token expected in webhook requests
+    secret_token = "secret"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD HANDLERS                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_handlers(self):
+        """ Adds the echo handler """
+
+        # Define echo handler
+        async def echo(bot, update):
+            message = update["message"]
+            await bot.send_message(message["chat"]["id"], message["text"])
+
+        # Add echo handler
+        self.add_handler(echo)
+
+
+# Initialize bot, whose adapter is pointed at a fake API server by each test
+bot = EchoBot("123:ABC")
+
+# Define URL patterns of the webhook view
+urlpatterns = [path("webhook/", bot.as_view(wait=True))]
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GET UPDATE                                                                         │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+def get_update(update_id, chat_id=1, text="hi"):
+    """ Returns webhook data of a text message update """
+
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "text": text,
+        },
+    }
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ASYNC TELEGRAM BOT TEST CASE                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncTelegramBotTestCase(SimpleTestCase):
+    """ Tests AsyncTelegramBot against a local fake Telegram API server """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Clears the update IDs seen by the bot """
+
+        # Clear dedupe stores
+        EchoBot._dedupe_stores.clear()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ START API                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def start_api(self, rate_limited=0):
+        """ Starts a fake API server and points the bot at it """
+
+        # Start fake API server
+        api = FakeTelegramAPI(rate_limited=rate_limited)
+        await api.server.start_server()
+
+        # Point bot adapter at the fake API server
+        bot.adapter = TelegramAPIAdapter(
+            "123:ABC", api_url=str(api.server.make_url(""))
+        )
+
+        # Return fake API
+        return api
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STOP API                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def stop_api(self, api):
+        """ Closes the bot session and stops a fake API server """
+
+        # Close bot and fake API server
+        await bot.aclose()
+        await api.server.close()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST REDIS DEDUPE DOES NOT BLOCK LOOP                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_redis_dedupe_does_not_block_loop(self):
+        """ Updates are deduplicated with Redis in a thread, not on the event loop """
+
+        # Initialize the IDs of threads that deduplicated updates
+        thread_ids = []
+
+        def add(store, key):
+            """ Records the current thread and reports the key as seen """
+
+            thread_ids.append(get_ident())
+            return False
+
+        # Process an update with a Redis dedupe store whose add is patched
+        with mock.patch.object(EchoBot, "dedupe_redis", True), mock.patch(
+            "beutils.bots.get_redis", return_value=fakeredis.FakeRedis()
+        ), mock.patch.object(DedupeStore, "add", autospec=True, side_effect=add):
+            processed = await bot.process_webhook(get_update(1))
+
+        # Check that the update was dropped as a duplicate off the event loop thread
+        self.assertFalse(processed)
+        self.assertEqual(len(thread_ids), 1)
+        self.assertNotEqual(thread_ids[0], get_ident())
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST WEBHOOK VIEW                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_webhook_view(self):
+        """ The webhook view is async and processes updates with a secret token """
+
+        # Check that the view is a coroutine function that Django awaits
+        self.assertTrue(asyncio.iscoroutinefunction(bot.as_view()))
+
+        # Start fake API
+        api = await self.start_api()
+
+        # Post updates to the webhook view
+        try:
+            client = AsyncClient()
+            response = await client.post(
+                "/webhook/",
+                get_update(1, chat_id=7, text="hello"),
+                content_type="application/json",
+                **{"X-Telegram-Bot-Api-Secret-Token": "secret"},
+            )
+            forbidden = await client.post(
+                "/webhook/", get_update(2), content_type="application/json"
+            )
+            not_allowed = await client.get("/webhook/")
+        finally:
+            await self.stop_api(api)
+
+        # Check responses
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(forbidden.status_code, 403)
+        self.assertEqual(not_allowed.status_code, 405)
+
+        # Check that the update was echoed
+        self.assertEqual(api.calls, [("sendMessage", {"chat_id": 7, "text": "hello"})])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST CONCURRENT UPDATES                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_concurrent_updates(self):
+        """ Many updates are processed concurrently and duplicates are dropped """
+
+        # Start fake API
+        api = await self.start_api()
+
+        # Process updates concurrently, including a duplicate of each
+        try:
+            results = await asyncio.gather(
+                *(
+                    bot.process_webhook(get_update(i % 1000, chat_id=i))
+                    for i in range(2000)
+                )
+            )
+        finally:
+            await self.stop_api(api)
+
+        # Check that each update was sent once
+        self.assertEqual(results.count(False), 1000)
+        self.assertEqual(len(api.calls), 1000)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST SEND MANY RETRY AFTER                                                     │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_send_many_retry_after(self):
+        """ send_many retries rate limited sends and keeps input order """
+
+        # Start fake API that rate limits the first two calls
+        api = await self.start_api(rate_limited=2)
+
+        # Send messages
+        try:
+            results = await bot.send_many([(1, "a"), (2, "b"), (1, "c")])
+        finally:
+            await self.stop_api(api)
+
+        # Check results
+        self.assertEqual([r.message for r in results], ["a", "b", "c"])
+        self.assertTrue(all(r.error is None for r in results))
+        self.assertEqual(sum(r.attempts for r in results), 5)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST FAILED HAND OFF IS RETRIED                                                │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_failed_hand_off_is_retried(self):
+        """ An update whose hand-off fails is not dropped as a duplicate on retry """
+
+        # Define a dispatch that fails once
+        async def dispatch(data):
+            del bot.dispatch
+            raise RuntimeError("Hand-off failed")
+
+        # Start fake API
+        api = await self.start_api()
+
+        # Process an update whose hand-off fails, then Telegram's retry of it
+        try:
+            bot.dispatch = dispatch
+            with self.assertRaises(RuntimeError):
+                await bot.process_webhook(get_update(1, chat_id=7, text="retry"))
+            retried = await bot.process_webhook(get_update(1, chat_id=7, text="retry"))
+        finally:
+            await self.stop_api(api)
+
+        # Check that the retry was processed
+        self.assertIsNot(retried, False)
+        self.assertEqual(api.calls, [("sendMessage", {"chat_id": 7, "text": "retry"})])
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ITER JSON ARRAY TEST CASE                                                          │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class IterJSONArrayTestCase(SimpleTestCase):
+    """ Tests that JSON arrays are decoded incrementally across chunk boundaries """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST CHUNK BOUNDARIES                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_chunk_boundaries(self):
+        """ Elements split at any chunk boundary are decoded whole """
+
+        # Define bodies and their elements
+        bodies = [
+            ("[3.5]", [3.5]),
+            ("[1e5, -2E-3, 10]", [1e5, -2e-3, 10]),
+            (
+                '[1, "a,]", true, null, {"b": [1, 2]}, [3]]',
+                [1, "a,]", True, None, {"b": [1, 2]}, [3]],
+            ),
+            (" [ 12 , 345 ] ", [12, 345]),
+            ("[]", []),
+        ]
+
+        # Iterate over bodies
+        for body, elements in bodies:
+
+            # Iterate over every split of the body into two chunks
+            for i in range(len(body) + 1):
+                with self.subTest(body=body, split=i):
+                    self.assertEqual(
+                        list(iter_json_array([body[:i], body[i:]])), elements
+                    )
+
+            # Split body into 1-byte chunks
+            with self.subTest(body=body, chunk_size=1):
+                self.assertEqual(list(iter_json_array(body)), elements)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST INVALID BODIES                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_invalid_bodies(self):
+        """ Bodies that are not complete JSON arrays raise an exception """
+
+        # Iterate over invalid bodies
+        for body in ('{"a": 1}', "[1, 2", "[3.5", '[1"a"]', "[true1]"):
+
+            # Check that decoding the body in 1-byte chunks raises an exception
+            with self.subTest(body=body), self.assertRaises(Exception):
+                list(iter_json_array(body))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ FAKE JSON API                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class FakeJSONAPI:
+    """ A local JSON API that echoes requests and records concurrency """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self):
+        """ Custom Init Method """
+
+        # Initialize active and max active requests
+        self.active = self.max_active = 0
+
+        # Initialize server
+        app = web.Application()
+        app.router.add_route("*", "/echo", self.echo)
+        app.router.add_get("/slow/{i}", self.slow)
+        app.router.add_get("/error", self.error)
+        self.server = TestServer(app)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ECHO                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def echo(self, request):
+        """ Returns the method, query, token header, and JSON body of a request """
+
+        return web.json_response(
+            {
+                "method": request.method,
+                "query": dict(request.query),
+                "token": request.headers.get("X-Token"),
+                "json": await request.json() if request.can_read_body else None,
+            }
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SLOW                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def slow(self, request):
+        """ Returns the path index after a delay, counting concurrent requests """
+
+        # Count active request
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+
+        # Wait before responding
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.active -= 1
+
+        # Return index
+        return web.json_response({"i": int(request.match_info["i"])})
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ERROR                                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def error(self, request):
+        """ Returns a server error """
+
+        return web.json_response({"ok": False}, status=500)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TOKEN ADAPTER                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TokenAdapter(AsyncBaseAdapter):
+    """ An async adapter that sends a token header """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET DEFAULT HEADERS                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_default_headers(self):
+        """ Returns the token header """
+
+        return {"X-Token": "token"}
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BREAKER ADAPTER                                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class BreakerAdapter(TokenAdapter):
+    """ An async adapter whose circuit opens after two failures """
+
+    # Define consecutive failures that open the circuit
+    circuit_failure_threshold = 2
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ASYNC BASE ADAPTER TEST CASE                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class AsyncBaseAdapterTestCase(SimpleTestCase):
+    """ Tests AsyncBaseAdapter against a local JSON API server """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ START API                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def start_api(self, adapter_class=TokenAdapter):
+        """ Starts a fake JSON API and returns it with an adapter pointed at it """
+
+        # Start fake API server
+        api = FakeJSONAPI()
+        await api.server.start_server()
+
+        # Initialize adapter
+        adapter = adapter_class()
+        adapter.base_url = str(api.server.make_url(""))
+
+        # Return fake API and adapter
+        return api, adapter
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STOP API                                                                       │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def stop_api(self, api, adapter):
+        """ Closes the adapter session and stops a fake API server """
+
+        # Close adapter and fake API server
+        await adapter.aclose()
+        await api.server.close()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST REQUEST                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_request(self):
+        """ GET and POST requests send params, default headers, and JSON bodies """
+
+        # Start fake API
+        api, adapter = await self.start_api()
+
+        # Make GET and POST requests
+        try:
+            get = await adapter.request("echo", params={"q": "a"})
+            post = await adapter.request("echo", json_data={"a": 1})
+        finally:
+            await self.stop_api(api, adapter)
+
+        # Check responses
+        self.assertEqual(
+            get,
+            (
+                {"method": "GET", "query": {"q": "a"}, "token": "token", "json": None},
+                200,
+            ),
+        )
+        self.assertEqual(
+            post,
+            ({"method": "POST", "query": {}, "token": "token", "json": {"a": 1}}, 200),
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST REQUEST BATCH                                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_request_batch(self):
+        """ Batches keep input order, bound concurrency, and return errors in place """
+
+        # Start fake API
+        api, adapter = await self.start_api()
+
+        # Make a batch of requests, including a failing one
+        try:
+            results = await adapter.request_batch(
+                [f"slow/{i}" for i in range(9)]
+                + [{"endpoint": "echo", "params": {"q": "b"}}, "missing"],
+                limit=3,
+            )
+        finally:
+            await self.stop_api(api, adapter)
+
+        # Check results
+        self.assertEqual(results[:9], [({"i": i}, 200) for i in range(9)])
+        self.assertEqual(results[9][0]["query"], {"q": "b"})
+        self.assertIsInstance(results[10], Exception)
+
+        # Check that at most limit requests were made at a time
+        self.assertEqual(api.max_active, 3)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST GATHER WITH CONCURRENCY                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_gather_with_concurrency(self):
+        """ Awaitables run at most limit at a time and keep input order """
+
+        # Initialize active and max active awaitables
+        active = max_active = 0
+
+        # Define an awaitable that records concurrency
+        async def run(i):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return i
+
+        # Gather awaitables
+        results = await gather_with_concurrency(2, *(run(i) for i in range(6)))
+
+        # Check results and concurrency
+        self.assertEqual(results, list(range(6)))
+        self.assertEqual(max_active, 2)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST ERRORS                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    async def test_errors(self):
+        """ Failed requests open the circuit and emit metrics with their errors """
+
+        # Start fake API
+        api, adapter = await self.start_api(BreakerAdapter)
+
+        # Record metrics
+        metrics = []
+        adapter.metrics_hooks = (metrics.append,)
+
+        # Make requests until the circuit opens
+        try:
+            first = await adapter.request("error")
+            second = await adapter.request("error")
+            with self.assertRaises(CircuitOpenError):
+                await adapter.request("echo")
+        finally:
+            await self.stop_api(api, adapter)
+
+        # Check that server errors were returned
+        self.assertEqual(first, ({"ok": False}, 500))
+        self.assertEqual(second, ({"ok": False}, 500))
+
+        # Check metrics
+        self.assertEqual(
+            [(m.status_code, m.error) for m in metrics],
+            [(500, None), (500, None), (None, "CircuitOpenError")],
+        )
+
+        # Point an adapter without a circuit breaker at the stopped server
+        stopped = TokenAdapter()
+        stopped.base_url = adapter.base_url
+
+        # Check that connection errors are raised
+        try:
+            with self.assertRaises(aiohttp.ClientConnectionError):
+                await stopped.request("echo")
+        finally:
+            await stopped.aclose()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST SYNC METHODS                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_sync_methods(self):
+        """ Sync-only BaseAdapter methods and settings are not inherited """
+
+        # Check that sync-only methods and settings do not exist
+        for name in ("send", "stream", "paginate", "request_many", "cache_ttl"):
+            self.assertFalse(hasattr(AsyncBaseAdapter, name), name)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ FAKE HTTP SERVER                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class FakeHTTPServer(ThreadingHTTPServer):
+    """ A local threaded HTTP server that records requests and answers with JSON """
+
+    # Define that server threads do not block exit
+    daemon_threads = True
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, respond):
+        """ Custom Init Method, where respond returns (status, headers, data) """
+
+        # Initialize requests and respond function
+        self.requests = []
+        self.respond = respond
+
+        # Define request handler
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                self.requests.append((handler.path, dict(handler.headers)))
+                status, headers, data = self.respond(handler)
+                body = json.dumps(data).encode() if data is not None else b""
+                handler.send_response(status)
+                for name, value in headers.items():
+                    handler.send_header(name, value)
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, *args):
+                pass
+
+        # Initialize server on a free port
+        super().__init__(("127.0.0.1", 0), Handler)
+
+        # Serve requests in a background thread
+        Thread(target=self.serve_forever, daemon=True).start()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ URL                                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @property
+    def url(self):
+        """ Returns the base URL of the server """
+
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ STOP                                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def stop(self):
+        """ Stops the server """
+
+        # Shut down and close server
+        self.shutdown()
+        self.server_close()
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ HEDGED ADAPTER                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class HedgedAdapter(BaseAdapter):
+    """ An adapter that hedges requests after 50 ms and allows 5 requests a second """
+
+    # Define hedging
+    hedge_requests = True
+    hedge_delay = 0.05
+
+    # Define rate limit with no burst
+    rate_limit = (5, 1)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BASE ADAPTER HEDGE TEST CASE                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class BaseAdapterHedgeTestCase(SimpleTestCase):
+    """ Tests that BaseAdapter hedges slow requests but not rate limited ones """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST RATE LIMIT WAIT IS NOT HEDGED                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_rate_limit_wait_is_not_hedged(self):
+        """ Waiting for a rate limit token does not count towards the hedge delay """
+
+        # Start server that answers right away
+        server = FakeHTTPServer(lambda handler: (200, {}, {"ok": True}))
+
+        # Make requests, where each one after the first waits for a token
+        try:
+            with HedgedAdapter() as adapter:
+                adapter.base_url = server.url
+                results = [adapter.request("fast") for _ in range(3)]
+        finally:
+            server.stop()
+
+        # Check that each request was sent once
+        self.assertEqual(results, [({"ok": True}, 200)] * 3)
+        self.assertEqual(len(server.requests), 3)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST SLOW REQUEST IS HEDGED                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_slow_request_is_hedged(self):
+        """ A request without a response within the hedge delay is hedged """
+
+        # Define a response that is slow the first time
+        def respond(handler):
+            if len(server.requests) == 1:
+                time.sleep(0.5)
+            return 200, {}, {"request": len(server.requests)}
+
+        # Start server
+        server = FakeHTTPServer(respond)
+
+        # Make request
+        try:
+            with HedgedAdapter() as adapter:
+                adapter.base_url = server.url
+                result = adapter.request("slow")
+        finally:
+            server.stop()
+
+        # Check that the hedge request answered first
+        self.assertEqual(result, ({"request": 2}, 200))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ CACHED ADAPTER                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class CachedAdapter(BaseAdapter):
+    """ An adapter that caches responses and sends an API key header """
+
+    # Define response cache TTL
+    cache_ttl = 60
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, api_key, base_url):
+        """ Custom Init Method """
+
+        # Set API key and base URL
+        self.api_key = api_key
+        self.base_url = base_url
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ GET DEFAULT HEADERS                                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def get_default_headers(self):
+        """ Returns the API key header """
+
+        return {"X-Api-Key": self.api_key}
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BASE ADAPTER CACHE TEST CASE                                                       │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class BaseAdapterCacheTestCase(SimpleTestCase):
+    """ Tests that BaseAdapter caches responses per caller and revalidates them """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Starts a server that answers with the API key, and clears the cache """
+
+        # Define a response that echoes the API key, or is not modified if it has
+        # a matching ETag
+        def respond(handler):
+            if handler.headers.get("If-None-Match") == "v1":
+                return 304, {}, None
+            return 200, {"ETag": "v1"}, {"key": handler.headers["X-Api-Key"]}
+
+        # Start server
+        self.server = FakeHTTPServer(respond)
+
+        # Clear in-process response cache
+        CachedAdapter._local_response_caches.pop(CachedAdapter, None)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEAR DOWN                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def tearDown(self):
+        """ Stops the server """
+
+        # Stop server
+        self.server.stop()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST CACHE IS KEYED BY HEADERS                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_cache_is_keyed_by_headers(self):
+        """ Instances with different API keys are not served each other's data """
+
+        # Make the same request with two API keys, twice each
+        with CachedAdapter("a", self.server.url) as a, CachedAdapter(
+            "b", self.server.url
+        ) as b:
+            results = [
+                a.request("me"),
+                b.request("me"),
+                a.request("me"),
+                b.request("me"),
+            ]
+
+        # Check that each API key got its own response, cached after the first
+        self.assertEqual(
+            results,
+            [({"key": "a"}, 200), ({"key": "b"}, 200)] * 2,
+        )
+        self.assertEqual(len(self.server.requests), 2)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST CACHED DATA IS NOT SHARED                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_cached_data_is_not_shared(self):
+        """ Mutating returned data does not change the cached response """
+
+        # Make request and mutate its data, then the cached request
+        with CachedAdapter("a", self.server.url) as adapter:
+            adapter.request("me")[0]["key"] = "mutated"
+            adapter.request("me")[0]["key"] = "mutated"
+            data, status_code = adapter.request("me")
+
+        # Check that the cached data was not mutated
+        self.assertEqual(data, {"key": "a"})
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST NOT MODIFIED                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_not_modified(self):
+        """ Stale entries are revalidated, and a 304 without an entry has no data """
+
+        # Make request, then revalidate it once it is stale
+        with CachedAdapter("a", self.server.url) as adapter:
+            adapter.request("me")
+            cache = CachedAdapter._local_response_caches[CachedAdapter]
+            for entry in cache._entries.values():
+                entry["expires_at"] = 0
+            revalidated = adapter.request("me")
+
+            # Make request with its own conditional header and no entry
+            not_modified = adapter.request("other", headers={"If-None-Match": "v1"})
+
+        # Check that the stale entry was revalidated with its ETag
+        self.assertEqual(revalidated, ({"key": "a"}, 200))
+        self.assertEqual(self.server.requests[1][1].get("If-None-Match"), "v1")
+
+        # Check that a 304 without an entry has no data
+        self.assertEqual(not_modified, (None, 304))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ RECORD UPDATE                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Initialize the IDs of updates processed by sync bots
+processed_update_ids = []
+
+
+def record_update(update, context):
+    """ Records the ID of a processed update """
+
+    processed_update_ids.append(update.update_id)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ HANDLER BOT                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class HandlerBot(TelegramBot):
+    """ A bot that adds its handler in add_handlers """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ ADD HANDLERS                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def add_handlers(self, dispatcher):
+        """ Adds the record handler """
+
+        dispatcher.add_handler(TypeHandler(Update, record_update))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ LEGACY BOT                                                                         │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class LegacyBot(TelegramBot):
+    """ A bot that adds its handler in __init__ """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ INIT METHOD                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def __init__(self, *args, **kwargs):
+        """ Custom Init Method """
+
+        # Call parent init method
+        super().__init__(*args, **kwargs)
+
+        # Add record handler
+        self.dispatcher.add_handler(TypeHandler(Update, record_update))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TELEGRAM BOT TEST CASE                                                             │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TelegramBotTestCase(SimpleTestCase):
+    """ Tests that TelegramBot instances share a dispatcher pool and its handlers """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Clears processed and seen update IDs """
+
+        # Clear processed update IDs and dedupe stores
+        processed_update_ids.clear()
+        TelegramBot._dedupe_stores.clear()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEAR DOWN                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def tearDown(self):
+        """ Shuts down the dispatcher pools created by each test """
+
+        # Shut down dispatcher pools
+        TelegramBot.shutdown_dispatcher_pools()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ COUNT HANDLERS                                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def count_handlers(self, bot):
+        """ Returns the number of handlers of a bot's dispatcher """
+
+        return sum(len(handlers) for handlers in bot.dispatcher.handlers.values())
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST DISPATCHER POOL IS SHARED                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_dispatcher_pool_is_shared(self):
+        """ Closing bots keeps their pool, which is only shut down explicitly """
+
+        # Create and close bots
+        with HandlerBot("123:ABC") as first, HandlerBot("123:ABC") as second:
+            pass
+
+        # Check that the pool is shared and still open
+        self.assertIs(first.pool, second.pool)
+        self.assertFalse(first.pool.closed)
+
+        # Check that a new bot reuses the pool
+        self.assertIs(HandlerBot("123:ABC").pool, first.pool)
+
+        # Shut down dispatcher pools
+        TelegramBot.shutdown_dispatcher_pools()
+
+        # Check that the pool was shut down and a new bot creates a new one
+        self.assertTrue(first.pool.closed)
+        self.assertIsNot(HandlerBot("123:ABC").pool, first.pool)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST HANDLERS ARE ADDED ONCE                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_handlers_are_added_once(self):
+        """ add_handlers is called once per shared dispatcher """
+
+        # Create bots
+        bots = [HandlerBot("123:ABC") for _ in range(3)]
+
+        # Process an update
+        self.assertTrue(bots[-1].process_webhook(get_update(1)))
+
+        # Check that the handler was added and called once
+        self.assertEqual(self.count_handlers(bots[0]), 1)
+        self.assertEqual(processed_update_ids, [1])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST LEGACY HANDLERS ARE NOT DUPLICATED                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_legacy_handlers_are_not_duplicated(self):
+        """ Handlers added in __init__ are ignored with a warning once shared """
+
+        # Create bots, which add their handler to the shared dispatcher again
+        with self.assertLogs("beutils.bots", "WARNING") as logs:
+            bots = [LegacyBot("123:ABC") for _ in range(3)]
+
+        # Process an update
+        self.assertTrue(bots[-1].process_webhook(get_update(1)))
+
+        # Check that the handler was added and called once and warned about once
+        self.assertEqual(self.count_handlers(bots[0]), 1)
+        self.assertEqual(processed_update_ids, [1])
+        self.assertEqual(len(logs.records), 1)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST THREADED                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_threaded(self):
+        """ Threaded bots process updates on the pool's worker threads """
+
+        # Create threaded bot, where the dispatcher thread gets the bot user
+        with mock.patch.object(Bot, "get_me", return_value=User(1, "Bot", True)):
+            bot = HandlerBot("123:ABC", should_thread=True)
+
+            # Process updates and wait for them
+            for update_id in range(5):
+                bot.process_webhook(get_update(update_id))
+            bot.pool.queue.join()
+
+        # Check that each update was processed
+        self.assertEqual(sorted(processed_update_ids), list(range(5)))
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ OFFLOADED UPDATES TEST CASE                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class OffloadedUpdatesTestCase(SimpleTestCase):
+    """ Tests that offloaded updates are processed in order and at least once """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Patches Redis and queues updates of a chat """
+
+        # Clear processed update IDs
+        processed_update_ids.clear()
+
+        # Patch Redis client
+        self.client = fakeredis.FakeRedis()
+        patcher = mock.patch("beutils.bots.get_redis", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Initialize bot and queue updates
+        self.bot = HandlerBot("123:ABC")
+        self.queue_key = self.bot.get_offload_key("chat:1")
+        self.client.rpush(
+            self.queue_key, *(json.dumps({"update_id": i}) for i in (1, 2, 3))
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEAR DOWN                                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def tearDown(self):
+        """ Shuts down the dispatcher pools created by each test """
+
+        # Shut down dispatcher pools
+        TelegramBot.shutdown_dispatcher_pools()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ PATCH PROCESS UPDATE                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def patch_process_update(self, process):
+        """ Patches the dispatcher to process updates with a function of an ID """
+
+        return mock.patch.object(
+            self.bot.dispatcher,
+            "process_update",
+            side_effect=lambda update: process(update.update_id),
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST UPDATES ARE PROCESSED IN ORDER                                            │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_updates_are_processed_in_order(self):
+        """ Draining processes updates in order and leaves nothing behind """
+
+        # Drain queue
+        self.bot.drain_update_queue(self.queue_key)
+
+        # Check that updates were processed in order and no keys are left
+        self.assertEqual(processed_update_ids, [1, 2, 3])
+        self.assertEqual(self.client.keys(), [])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST FAILED UPDATE IS PROCESSED AGAIN                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_failed_update_is_processed_again(self):
+        """ An update whose processing raises is processed first by the next drain """
+
+        # Initialize failed update IDs
+        failed = []
+
+        def process(update_id):
+            """ Raises the first time update 2 is processed """
+
+            # Raise if update 2 is processed for the first time
+            if update_id == 2 and not failed:
+                failed.append(update_id)
+                raise RuntimeError
+
+            # Record update ID
+            processed_update_ids.append(update_id)
+
+        # Drain queue, where processing update 2 raises
+        with self.patch_process_update(process):
+            with self.assertRaises(RuntimeError):
+                self.bot.drain_update_queue(self.queue_key)
+
+            # Check that update 2 was kept and the lock was released
+            self.assertEqual(processed_update_ids, [1])
+            self.assertFalse(self.client.exists(f"{self.queue_key}:lock"))
+
+            # Drain queue again
+            self.bot.drain_update_queue(self.queue_key)
+
+        # Check that updates were processed in order
+        self.assertEqual(processed_update_ids, [1, 2, 3])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST FAILING UPDATE IS DROPPED                                                 │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_failing_update_is_dropped(self):
+        """ An update that always raises is dropped after the max attempts """
+
+        def process(update_id):
+            """ Raises whenever update 2 is processed """
+
+            # Raise if update 2 is processed
+            if update_id == 2:
+                raise RuntimeError
+
+            # Record update ID
+            processed_update_ids.append(update_id)
+
+        # Drain queue until update 2 is dropped
+        with self.patch_process_update(process):
+            for _ in range(self.bot.offload_max_attempts):
+                with self.assertRaises(RuntimeError):
+                    self.bot.drain_update_queue(self.queue_key)
+            with self.assertLogs("beutils.bots", "ERROR"):
+                self.bot.drain_update_queue(self.queue_key)
+
+        # Check that the other updates were processed in order
+        self.assertEqual(processed_update_ids, [1, 3])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST LOCK IS EXTENDED                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_lock_is_extended(self):
+        """ A slow update keeps the lock, so other drains cannot skip ahead """
+
+        # Shorten the lock timeout
+        self.bot.offload_lock_timeout = 1
+
+        def process(update_id):
+            """ Drains the queue again while update 1 outlives the lock timeout """
+
+            # Check if this is the first update
+            if update_id == 1:
+
+                # Wait past the lock timeout and drain as another worker would
+                time.sleep(2)
+                HandlerBot("123:ABC").drain_update_queue(self.queue_key)
+
+            # Record update ID
+            processed_update_ids.append(update_id)
+
+        # Drain queue
+        with self.patch_process_update(process):
+            self.bot.drain_update_queue(self.queue_key)
+
+        # Check that updates were processed in order
+        self.assertEqual(processed_update_ids, [1, 2, 3])
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DEDUPE STORE TEST CASE                                                             │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class DedupeStoreTestCase(SimpleTestCase):
+    """ Tests that DedupeStore admits each key once across threads """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST CONCURRENT ADDS                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_concurrent_adds(self):
+        """ Threads adding the same keys at the same time admit each key once """
+
+        # Switch threads as often as possible to expose races
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        # Iterate over rounds
+        try:
+            for _ in range(5):
+
+                # Initialize store, barrier, and results
+                store = DedupeStore()
+                barrier = Barrier(8)
+                results = []
+
+                # Define a function that adds all keys once the threads are ready
+                def add_keys():
+                    barrier.wait()
+                    results.extend(store.add(key) for key in range(2000))
+
+                # Run threads
+                threads = [Thread(target=add_keys) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                # Check that each key was admitted once
+                self.assertEqual(results.count(True), 2000)
+                self.assertEqual(
+                    store.stats(),
+                    {"added": 2000, "duplicates": 14000, "discarded": 0, "size": 2000},
+                )
+
+        # Restore switch interval
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST DISCARD                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_discard(self):
+        """ A discarded key is admitted again without changing the other counts """
+
+        # Add a key twice, discard it, and add it again
+        store = DedupeStore()
+        results = [store.add(1), store.add(1)]
+        store.discard(1)
+        results.append(store.add(1))
+
+        # Check results and stats
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(
+            store.stats(), {"added": 2, "duplicates": 1, "discarded": 1, "size": 1}
+        )
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ RECORD TASK                                                                        │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Initialize the (args, kwargs) of task calls
+task_calls = []
+
+
+def record_call(*args, **kwargs):
+    """ Records the args and kwargs of a task call """
+
+    task_calls.append((args, kwargs))
+
+
+# Define an on-commit task that dispatches identical calls once per transaction
+record_task = app.task(
+    record_call,
+    name="beutils.tests.record_task",
+    base=get_task_handler(on_commit=True),
+    dedupe_on_commit=True,
+)
+
+
+def record_request_id(task):
+    """ Records the ID of the running task as a call """
+
+    task_calls.append(task.request.id)
+
+
+# Define an on-commit task that records its own task ID
+record_request_id_task = app.task(
+    record_request_id,
+    name="beutils.tests.record_request_id_task",
+    base=get_task_handler(on_commit=True),
+    bind=True,
+    dedupe_on_commit=True,
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ ON-COMMIT TASK HANDLER TEST CASE                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class OnCommitTaskHandlerTestCase(TestCase):
+    """ Tests that identical on-commit task calls are dispatched once """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Clears recorded task calls """
+
+        # Clear task calls
+        task_calls.clear()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST IDENTICAL CALLS ARE COALESCED                                             │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_identical_calls_are_coalesced(self):
+        """ Calls with equal args, kwargs, and options share one dispatch """
+
+        # Make calls in a transaction
+        with self.captureOnCommitCallbacks(execute=True):
+            first = record_task.delay(1, b={"y": 2, "x": 1})
+            second = record_task.delay(1, b={"x": 1, "y": 2})
+            record_task.delay("1", b={"x": 1, "y": 2})
+            record_task.apply_async((1,), {"b": {"x": 1, "y": 2}}, countdown=5)
+
+        # Check that identical calls returned the same result
+        self.assertEqual(first.id, second.id)
+
+        # Check that calls with other args or options were dispatched
+        self.assertEqual(
+            task_calls,
+            [((1,), {"b": {"x": 1, "y": 2}}), (("1",), {"b": {"x": 1, "y": 2}})]
+            + [((1,), {"b": {"x": 1, "y": 2}})],
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST SAVEPOINT ROLLBACK                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_savepoint_rollback(self):
+        """ A call discarded by a savepoint rollback is dispatched when repeated """
+
+        # Make calls, where a savepoint is rolled back
+        with self.captureOnCommitCallbacks(execute=True):
+            outer = record_task.delay(1)
+            try:
+                with transaction.atomic():
+                    record_task.delay(2)
+                    raise ValueError
+            except ValueError:
+                pass
+            record_task.delay(2)
+            repeated = record_task.delay(1)
+
+        # Check that the outer call is still coalesced and the discarded call is sent
+        self.assertEqual(outer.id, repeated.id)
+        self.assertEqual(task_calls, [((1,), {}), ((2,), {})])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST UNCOALESCED CALLS                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_uncoalesced_calls(self):
+        """ A call with its own task ID is dispatched and keeps its ID """
+
+        # Make calls
+        with self.captureOnCommitCallbacks(execute=True):
+            record_task.delay(1)
+            own = record_task.apply_async((1,), task_id="own-task-id")
+
+        # Check that the call with its own task ID kept it
+        self.assertEqual(own.id, "own-task-id")
+
+        # Check that both calls were dispatched
+        self.assertEqual(task_calls, [((1,), {}), ((1,), {})])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST RESULT ID IS TASK ID                                                      │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_result_id_is_task_id(self):
+        """ The returned result has the ID that the task runs with once committed """
+
+        # Make calls, where the last one is coalesced
+        with self.captureOnCommitCallbacks(execute=True):
+            result = record_request_id_task.delay()
+            own = record_request_id_task.apply_async(task_id="own-task-id")
+            coalesced = record_request_id_task.delay()
+
+            # Check that no task ran before the commit
+            self.assertEqual(task_calls, [])
+
+        # Check that the tasks ran with the returned IDs
+        self.assertEqual(task_calls, [result.id, "own-task-id"])
+        self.assertEqual(coalesced.id, result.id)
+        self.assertEqual(own.id, "own-task-id")
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST ROLLED BACK RESULT                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_rolled_back_result(self):
+        """ A call in a rolled back savepoint returns a result whose task never runs """
+
+        # Make a call in a savepoint that is rolled back
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    result = record_request_id_task.delay()
+                    raise ValueError
+            except ValueError:
+                pass
+
+        # Check that the result has an ID but its task did not run
+        self.assertTrue(result.id)
+        self.assertEqual(task_calls, [])
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TELEGRAM ACCOUNT                                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TelegramAccount(TelegramUserModelMixin):
+    """ A model with Telegram IDs, whose table is created by the resolver tests """
+
+    class Meta:
+
+        # Set app label to an installed app, where the model is not managed so that
+        # migrations and test database serialization skip it
+        app_label = "beutils_location"
+        managed = False
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ TELEGRAM USER RESOLVER TEST CASE                                                   │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class TelegramUserResolverTestCase(TestCase):
+    """ Tests that Telegram IDs are resolved in one query and cached """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP TEST DATA                                                               │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Creates the table of the test model and accounts with IDs 1 to 3 """
+
+        # Create table, which is dropped when the class transaction is rolled back
+        with connection.schema_editor() as editor:
+            editor.create_model(TelegramAccount)
+
+        # Create accounts
+        cls.accounts = [
+            TelegramAccount.objects.create(telegram_user_id=i) for i in (1, 2, 3)
+        ]
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Initializes a resolver of the test model """
+
+        # Initialize resolver
+        self.resolver = TelegramUserResolver(model=TelegramAccount)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST RESOLVE MANY                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_resolve_many(self):
+        """ Misses are resolved in one query and hits, including unknown IDs, in none """
+
+        # Get expected pks, where 4 has no account
+        expected = {1: self.accounts[0].pk, 2: self.accounts[1].pk, 4: None}
+
+        # Check that misses are resolved in one query
+        with self.assertNumQueries(1):
+            self.assertEqual(self.resolver.resolve_many([1, 2, 4, None]), expected)
+
+        # Check that cached IDs are resolved without queries
+        with self.assertNumQueries(0):
+            self.assertEqual(self.resolver.resolve_many([1, 2, 4]), expected)
+            self.assertEqual(self.resolver.resolve(4), None)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST RESOLVE UPDATES                                                           │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_resolve_updates(self):
+        """ The senders of a batch of updates are resolved in one query """
+
+        # Get updates as webhook data and as an Update
+        updates = [
+            {"update_id": 1, "message": {"from": {"id": 1}, "chat": {"id": 7}}},
+            {"update_id": 2, "callback_query": {"from": {"id": 2}}},
+            {"update_id": 3, "message": {"from": {"id": 1}, "chat": {"id": 7}}},
+            Update.de_json(
+                {
+                    "update_id": 4,
+                    "message": {
+                        "message_id": 1,
+                        "date": 0,
+                        "chat": {"id": 8, "type": "private"},
+                        "from": {"id": 3, "is_bot": False, "first_name": "C"},
+                    },
+                },
+                None,
+            ),
+        ]
+
+        # Check that the senders are resolved in one query
+        with self.assertNumQueries(1):
+            pks = self.resolver.resolve_updates(updates)
+        self.assertEqual(
+            pks, {account.telegram_user_id: account.pk for account in self.accounts}
+        )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST SAVE INVALIDATES                                                          │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_save_invalidates(self):
+        """ Saving an account drops the cached entries of its old and new IDs """
+
+        # Resolve IDs
+        self.resolver.resolve_many([1, 5])
+
+        # Change the Telegram ID of an account
+        account = self.accounts[0]
+        account.telegram_user_id = 5
+        account.save()
+
+        # Check that both IDs are resolved again
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.resolver.resolve_many([1, 5]), {1: None, 5: account.pk}
+            )
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST LRU EVICTION                                                              │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_lru_eviction(self):
+        """ The least recently used ID is evicted once max entries is reached """
+
+        # Initialize a resolver of two entries
+        resolver = TelegramUserResolver(model=TelegramAccount, max_entries=2)
+
+        # Resolve IDs, using 1 after 2 so that 2 is least recently used
+        resolver.resolve_many([1, 2])
+        resolver.resolve(1)
+        resolver.resolve(3)
+
+        # Check that 1 and 3 are cached and 2 was evicted
+        with self.assertNumQueries(0):
+            resolver.resolve_many([1, 3])
+        with self.assertNumQueries(1):
+            resolver.resolve(2)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BATCHED RECORD TASKS                                                               │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Initialize the batches that batched tasks received
+task_batches = []
+
+
+def record_batch(calls):
+    """ Records a batch of (args, kwargs) pairs """
+
+    task_batches.append(calls)
+
+
+# Define batched tasks with and without a time window
+batched_record = batched_task(
+    record_batch, name="beutils.tests.batched_record", max_batch_size=2
+)
+windowed_record = batched_task(
+    record_batch, name="beutils.tests.windowed_record", window=0.1
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ BATCHED TASK TEST CASE                                                             │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class BatchedTaskTestCase(TransactionTestCase):
+    """ Tests that batched calls are enqueued on commit and dropped on rollback """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Clears recorded batches """
+
+        # Clear task batches
+        task_batches.clear()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST COMMIT                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_commit(self):
+        """ Calls in a transaction are enqueued in batches once it commits """
+
+        # Make calls in a transaction
+        with transaction.atomic():
+            for i in (1, 2, 3):
+                batched_record.delay(i)
+
+            # Check that nothing was enqueued before the commit
+            self.assertEqual(task_batches, [])
+
+        # Check that calls were enqueued in batches of at most two
+        self.assertEqual(task_batches, [[[[1], {}], [[2], {}]], [[[3], {}]]])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST ROLLBACK                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_rollback(self):
+        """ Calls in a transaction that rolls back are discarded """
+
+        # Make a call in a transaction that rolls back
+        try:
+            with transaction.atomic():
+                batched_record.delay(1)
+                raise ValueError
+        except ValueError:
+            pass
+
+        # Make a call outside a transaction
+        batched_record.delay(2)
+
+        # Check that only the call outside the transaction was enqueued, right away
+        self.assertEqual(task_batches, [[[[2], {}]]])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST SAVEPOINT ROLLBACK                                                        │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_savepoint_rollback(self):
+        """ A savepoint rollback discards only the calls made in the savepoint """
+
+        # Make calls, where a savepoint is rolled back
+        with transaction.atomic():
+            batched_record.delay(1)
+            try:
+                with transaction.atomic():
+                    batched_record.delay(2)
+                    raise ValueError
+            except ValueError:
+                pass
+            batched_record.delay(3)
+
+        # Check that the calls outside the savepoint were enqueued together
+        self.assertEqual(task_batches, [[[[1], {}], [[3], {}]]])
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST WINDOW                                                                    │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_window(self):
+        """ Calls outside a transaction are enqueued together after the window """
+
+        # Make calls outside a transaction
+        windowed_record.delay(1)
+        windowed_record.delay(2, key="value")
+
+        # Check that nothing was enqueued before the window ends
+        self.assertEqual(task_batches, [])
+
+        # Wait for the window to end
+        time.sleep(0.3)
+
+        # Check that the calls were enqueued together
+        self.assertEqual(task_batches, [[[[1], {}], [[2], {"key": "value"}]]])
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROFILED TASK                                                                      │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Initialize the metrics registry of the profiled task
+profiled_metrics = TaskMetricsRegistry()
+
+
+def run_queries(count, fail=False):
+    """ Runs queries while holding a megabyte of memory, raising if fail is set """
+
+    # Allocate memory
+    data = bytearray(1_000_000)
+
+    # Run queries
+    with connection.cursor() as cursor:
+        for _ in range(count):
+            cursor.execute("SELECT 1")
+
+    # Raise if fail is set
+    if fail:
+        raise ValueError
+
+    # Return size of data
+    return len(data)
+
+
+# Define a profiled task that profiles half of its runs, however fast
+profiled_task = app.task(
+    run_queries,
+    name="beutils.tests.profiled_task",
+    base=get_task_handler(profiled=True),
+    metrics_registry=profiled_metrics,
+    trace_memory=True,
+    profile_sample_rate=0.5,
+    profile_threshold=0,
+)
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ PROFILED TASK HANDLER TEST CASE                                                    │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+
+class ProfiledTaskHandlerTestCase(TestCase):
+    """ Tests that profiled tasks record their metrics and sampled profiles """
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ SET UP                                                                         │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def setUp(self):
+        """ Clears recorded metrics """
+
+        # Reset metrics registry
+        profiled_metrics.reset()
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST METRICS                                                                   │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_metrics(self):
+        """ Runs record their count, failures, queries, memory, and queue wait """
+
+        # Run task twice, where the second run fails, without profiling
+        with mock.patch("beutils.tasks.random.random", return_value=1.0):
+            profiled_task.delay(3)
+            profiled_task.delay(1, fail=True)
+
+        # Get summary of the task
+        summary = profiled_metrics.summary()["beutils.tests.profiled_task"]
+
+        # Check counts and queries
+        self.assertEqual(summary["count"], 2)
+        self.assertEqual(summary["failures"], 1)
+        self.assertEqual(summary["max_queries"], 3)
+        self.assertEqual(summary["mean_queries"], 2)
+
+        # Check that memory and queue wait were recorded
+        self.assertGreaterEqual(summary["peak_memory"], 1_000_000)
+        self.assertGreaterEqual(summary["mean_queue_wait"], 0)
+
+        # Check that no run was profiled
+        self.assertEqual(len(profiled_metrics.profiles), 0)
+
+    # ┌────────────────────────────────────────────────────────────────────────────────┐
+    # │ TEST SAMPLING                                                                  │
+    # └────────────────────────────────────────────────────────────────────────────────┘
+
+    def test_sampling(self):
+        """ Only runs whose random draw is below the sample rate are profiled """
+
+        # Run task with draws below and above the sample rate
+        for draw in (0.4, 0.6):
+            with mock.patch("beutils.tasks.random.random", return_value=draw):
+                profiled_task.delay(1)
+
+        # Check that only the first run was profiled
+        self.assertEqual(len(profiled_metrics.profiles), 1)
+
+        # Check that the profile belongs to the first run and includes the task
+        metric, profile = profiled_metrics.profiles[0]
+        self.assertEqual(metric.name, "beutils.tests.profiled_task")
+        self.assertIn("run_queries", profile)
@@ -4,9 +4,43 @@
 
 import json
 import pytz
+import redis
 
 from unidecode import unidecode
 
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ DJANGO IMPORTS                                                                     │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+from django.conf import settings
+
+
+# ┌────────────────────────────────────────────────────────────────────────────────────┐
+# │ GET REDIS                                                                          │
+# └────────────────────────────────────────────────────────────────────────────────────┘
+
+# Initialize Redis clients by URL
+_redis_clients = {}
+
+
+def get_redis(url=None):
+    """ Returns a shared Redis client for a URL, defaulting to settings.REDIS_URL """
+
+    # Get URL
+    url = url or settings.REDIS_URL
+
+    # Get Redis client
+    client = _redis_clients.get(url)
+
+    # Check if Redis client does not exist
+    if client is None:
+
+        # Create Redis client, which is thread-safe and pools its connections
+        client = _redis_clients.setdefault(url, redis.Redis.from_url(url))
+
+    # Return Redis client
+    return client
+
 
 # ┌────────────────────────────────────────────────────────────────────────────────────┐
 # │ IS TZ AWARE                                                                        │